@@ -0,0 +1,99 @@
+# benchmarks/bench_memory.py
+"""
+Compare the memory held by follower lists kept as raw API objects against
+the projected UserInfo records, on synthetic followers/following pages.
+
+Usage:
+    python -m benchmarks.bench_memory [users]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from core.models import UserInfo
+
+PER_PAGE = 100
+
+
+def _user(index: int) -> dict:
+    # Same fields as a user in GitHub's followers and following lists
+    login = f'user{index}'
+    api = f'https://api.github.com/users/{login}'
+    return {
+        'login': login,
+        'id': 1000000 + index,
+        'node_id': f'MDQ6VXNlcj{index:08d}',
+        'avatar_url': f'https://avatars.githubusercontent.com/u/{1000000 + index}?v=4',
+        'gravatar_id': '',
+        'url': api,
+        'html_url': f'https://github.com/{login}',
+        'followers_url': f'{api}/followers',
+        'following_url': f'{api}/following{{/other_user}}',
+        'gists_url': f'{api}/gists{{/gist_id}}',
+        'starred_url': f'{api}/starred{{/owner}}{{/repo}}',
+        'subscriptions_url': f'{api}/subscriptions',
+        'organizations_url': f'{api}/orgs',
+        'repos_url': f'{api}/repos',
+        'events_url': f'{api}/events{{/privacy}}',
+        'received_events_url': f'{api}/received_events',
+        'type': 'User',
+        'user_view_type': 'public',
+        'site_admin': False,
+    }
+
+
+def _pages(start: int, count: int) -> list:
+    # Response bodies as they come off the wire, one JSON document per page
+    return [json.dumps([_user(index) for index in range(page, min(page + PER_PAGE, start + count))])
+            for page in range(start, start + count, PER_PAGE)]
+
+
+def _analyze(followers: dict, following: dict) -> tuple:
+    mutual = {login: following[login] for login in followers.keys() & following.keys()}
+    not_following_back = {login: following[login] for login in following.keys() - followers.keys()}
+    not_followed_back = {login: followers[login] for login in followers.keys() - following.keys()}
+    return mutual, not_following_back, not_followed_back
+
+
+def measure(pages: tuple, parse) -> tuple:
+    """
+    Load both lists and analyze them, tracking allocations.
+
+    Args:
+        pages (tuple): Followers and following page bodies
+        parse (Callable): Converts each API user, None to keep the raw object
+
+    Returns:
+        tuple: Bytes retained by the lists and results, and peak bytes while loading
+    """
+    tracemalloc.start()
+    lists = []
+    for bodies in pages:
+        users = {}
+        for body in bodies:
+            for user in json.loads(body):
+                users[user['login']] = user if parse is None else parse(user)
+        lists.append(users)
+    results = _analyze(*lists)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lists, results
+    return retained, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    # Followers and following overlap by half
+    pages = (_pages(0, count), _pages(count // 2, count))
+    print(f'{count} followers and {count} following')
+
+    raw_retained, raw_peak = measure(pages, None)
+    print(f'raw API dicts:  {raw_retained / 2**20:8.1f} MiB retained, {raw_peak / 2**20:8.1f} MiB peak')
+    slim_retained, slim_peak = measure(pages, UserInfo.from_api)
+    print(f'UserInfo:       {slim_retained / 2**20:8.1f} MiB retained, {slim_peak / 2**20:8.1f} MiB peak')
+    print(f'reduction:      {raw_retained / slim_retained:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_relationships.py
+"""
+Compare login-set relationship analysis against the id-array version on
+synthetic followers and following lists.
+
+Usage:
+    python -m benchmarks.bench_relationships [users]
+"""
+
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+from core.models import UserInfo
+from core.relationships import contains_sorted, split_relationships
+
+
+def _users(ids) -> dict:
+    return {f'user{user_id}': UserInfo(f'user{user_id}', user_id) for user_id in ids}
+
+
+def split_by_login(followers: dict, following: dict) -> tuple:
+    """The previous implementation: set algebra on login strings, then dict rebuilds."""
+    follower_usernames = set(followers.keys())
+    following_usernames = set(following.keys())
+    mutual = {username: following[username] for username in follower_usernames & following_usernames}
+    not_following_back = {username: following[username]
+                          for username in following_usernames - follower_usernames}
+    not_followed_back = {username: followers[username]
+                         for username in follower_usernames - following_usernames}
+    return mutual, not_following_back, not_followed_back
+
+
+def _best(run, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def measure(split, followers: dict, following: dict) -> tuple:
+    """
+    Run one implementation, timing it and then tracking its allocations in a second run.
+
+    Returns:
+        tuple: Seconds, peak bytes allocated and the result sizes
+    """
+    start = perf_counter()
+    result = split(followers, following)
+    elapsed = perf_counter() - start
+    del result
+    # Tracing slows Python-level loops down, so it is kept out of the timed run
+    tracemalloc.start()
+    result = split(followers, following)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, tuple(len(group) for group in result)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(42)
+    # Followers and following overlap by half, ids spread like real GitHub ids
+    ids = rng.sample(range(1, 200000000), count + count // 2)
+    followers = _users(ids[:count])
+    following = _users(ids[count // 2:])
+    print(f'{count} followers and {len(following)} following')
+
+    import numpy as np
+
+    split_relationships({'warmup': UserInfo('warmup', 1)}, {})  # load NumPy outside the timing
+    for name, split in (('login sets (before)', split_by_login), ('id arrays (after)', split_relationships)):
+        elapsed, peak, sizes = measure(split, followers, following)
+        print(f'{name:<22} {elapsed * 1000:8.1f} ms  {peak / 2**20:7.1f} MiB peak  {sizes}')
+
+    # The comparison alone, without building the key sets, id arrays or result dicts
+    follower_logins, following_logins = set(followers), set(following)
+    set_seconds = _best(lambda: (follower_logins & following_logins, following_logins - follower_logins,
+                                 follower_logins - following_logins))
+    follower_ids, following_ids = np.sort(ids[:count]), np.sort(ids[count // 2:])
+
+    def compare_ids():
+        follows_you = contains_sorted(follower_ids, following_ids)
+        followed = contains_sorted(following_ids, follower_ids)
+        return following_ids[follows_you], following_ids[~follows_you], follower_ids[~followed]
+
+    array_seconds = _best(compare_ids)
+    print(f'comparison only: login sets {set_seconds * 1000:.1f} ms '
+          f'({(sys.getsizeof(follower_logins) + sys.getsizeof(following_logins)) / 2**20:.1f} MiB), '
+          f'id arrays {array_seconds * 1000:.1f} ms '
+          f'({(follower_ids.nbytes + following_ids.nbytes) / 2**20:.1f} MiB)')
+
+
+if __name__ == '__main__':
+    main()
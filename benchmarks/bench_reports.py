@@ -0,0 +1,65 @@
+# benchmarks/bench_reports.py
+"""
+Write and reload synthetic network reports in every format, comparing
+file size, write time and load time.
+
+Usage:
+    python -m benchmarks.bench_reports [users]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+from reports.formats import REPORT_EXTENSIONS, load_report, open_report_writer
+
+LANGUAGES = ('Python', 'JavaScript', 'Go', 'Rust', 'TypeScript', 'C', None)
+RELATIONS = ('mutual', 'not-following-back', 'not-followed-back')
+
+
+def _rows(count: int):
+    rng = random.Random(42)
+    for index in range(count):
+        language = rng.choice(LANGUAGES)
+        yield {
+            'login': f'user{index}',
+            'id': rng.randint(1, 200000000),
+            'relation': rng.choice(RELATIONS),
+            'name': f'User {index}' if rng.random() < 0.6 else None,
+            'followers': rng.randint(0, 5000),
+            'following': rng.randint(0, 1000),
+            'public_repos': rng.randint(0, 300),
+            'total_stars': rng.randint(0, 20000),
+            'total_forks': rng.randint(0, 5000),
+            'last_push_at': f'2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T12:00:00+00:00',
+            'top_language': language,
+            'languages': f'{language}:{rng.randint(1, 20)}' if language else '',
+            'score': float(rng.randint(-1000, 30000)),
+        }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rows = list(_rows(count))
+    print(f'{count} users')
+    with tempfile.TemporaryDirectory() as directory:
+        for report_format, extension in REPORT_EXTENSIONS.items():
+            path = os.path.join(directory, f'report{extension}')
+            start = perf_counter()
+            with open_report_writer(path, report_format) as writer:
+                for row in rows:
+                    writer.write(row)
+            write_seconds = perf_counter() - start
+
+            start = perf_counter()
+            columns = load_report(path)
+            load_seconds = perf_counter() - start
+            assert len(columns['login']) == count
+            print(f'{report_format:<9} {os.path.getsize(path) / 2**20:7.2f} MiB  '
+                  f'write {write_seconds * 1000:7.1f} ms  load {load_seconds * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
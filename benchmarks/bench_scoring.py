@@ -0,0 +1,94 @@
+# benchmarks/bench_scoring.py
+"""
+Compare the per-user Python scoring loop against the columnar ScoringEngine
+on synthetic profiles.
+
+calculate_user_scores and the dashboard collect each profile's metric row
+while users load, so the engine's timing starts from those rows; filling
+them is reported separately, as is loading the columns from the profiles
+after the fact (the path taken without collected rows).
+
+Usage:
+    python -m benchmarks.bench_scoring [users]
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from core.aggregator import MetricColumns
+from core.models import UserDetails, UserProfile
+from core.scoring import ScoringEngine, UserMetrics
+
+
+def _profiles(count: int) -> dict:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    profiles = {}
+    for index in range(count):
+        login = f'user{index}'
+        pushed = None if rng.random() < 0.05 else now - timedelta(seconds=rng.randint(0, 3 * 365 * 86400))
+        profiles[login] = UserProfile(
+            username=login,
+            details=UserDetails(login, None, rng.randint(0, 5000), 0, rng.randint(0, 300)),
+            total_stars=rng.randint(0, 20000),
+            total_forks=rng.randint(0, 5000),
+            last_push_at=pushed,
+            languages={},
+        )
+    return profiles
+
+
+def _columns(profiles: dict) -> MetricColumns:
+    # What UserProfileAggregator.profiles does as each profile is built
+    columns = MetricColumns()
+    for profile in profiles.values():
+        columns.add(profile)
+    return columns
+
+
+def _loop_scores(profiles: dict, now: datetime, top_k: int) -> list:
+    # The scoring loop calculate_user_scores ran before the columnar engine
+    scored = {}
+    for username, profile in profiles.items():
+        days = (now - profile.last_push_at).days if profile.last_push_at else 0
+        scored[username] = profile.total_stars + profile.total_forks - days
+    return sorted(scored.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def _engine_scores(metrics: UserMetrics, now: datetime, top_k: int) -> list:
+    engine = ScoringEngine(now=now)
+    scores = engine.score(metrics)
+    engine.percentile_ranks(scores)
+    return [(metrics.logins[index], scores[index]) for index in engine.top_k(scores, top_k).tolist()]
+
+
+def _time(call) -> tuple:
+    start = perf_counter()
+    result = call()
+    return result, (perf_counter() - start) * 1000
+
+
+def main(users: int = 100_000, top_k: int = 10):
+    """Score the synthetic users both ways and print the timings."""
+    profiles = _profiles(users)
+    now = datetime.now(timezone.utc)
+    columns, fill_ms = _time(lambda: _columns(profiles))
+
+    loop_top, loop_ms = _time(lambda: _loop_scores(profiles, now, top_k))
+    engine_top, engine_ms = _time(lambda: _engine_scores(UserMetrics.from_columns(columns), now, top_k))
+    late_top, late_ms = _time(lambda: _engine_scores(UserMetrics.from_profiles(profiles), now, top_k))
+    assert [score for _, score in loop_top] == [score for _, score in engine_top] == \
+        [score for _, score in late_top], "rankings differ"
+
+    print(f"{users} users, top {top_k}")
+    print(f"python loop + sort (before)          {loop_ms:8.1f} ms")
+    print(f"engine on collected rows (after)     {engine_ms:8.1f} ms   "
+          f"(rows filled while loading: {fill_ms:.1f} ms)")
+    print(f"engine loading columns from profiles {late_ms:8.1f} ms")
+    print(f"speed-up: {loop_ms / engine_ms:.2f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
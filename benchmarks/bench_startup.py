@@ -0,0 +1,65 @@
+# benchmarks/bench_startup.py
+"""
+Measure the cold-start import cost of the interactive and headless entry
+points with `python -X importtime`, and fail when either exceeds the budget.
+
+Usage:
+    python -m benchmarks.bench_startup [budget_ms]
+"""
+
+import os
+import subprocess
+import sys
+
+# Cumulative import time allowed for each entry point, in milliseconds
+BUDGET_MS = 50
+ENTRY_POINTS = ('main', 'cli')
+TOP_MODULES = 8
+
+
+def import_times(module: str) -> tuple:
+    """
+    Import a module in a fresh interpreter and collect its import timings.
+
+    Args:
+        module (str): Module to import
+
+    Returns:
+        tuple: Cumulative microseconds for the module, and its direct imports mapped to theirs
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=root, capture_output=True, text=True, check=True)
+    total, children, pending = 0, {}, {}
+    # Lines look like "import time: self [us] | cumulative | <two spaces per level>name",
+    # and every module is reported after the modules it imported
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.rstrip().endswith('imported package'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        if level == 1:
+            pending[name.strip()] = int(cumulative)
+        elif level == 0:
+            if name.strip() == module:
+                total, children = int(cumulative), pending
+            pending = {}
+    return total, children
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    over_budget = False
+    for module in ENTRY_POINTS:
+        total, children = import_times(module)
+        total_ms = total / 1000
+        print(f'import {module}: {total_ms:.1f} ms (budget {budget_ms:.0f} ms)')
+        top = sorted(((us, name) for name, us in children.items()), reverse=True)
+        for us, name in top[:TOP_MODULES]:
+            print(f'    {us / 1000:7.1f} ms  {name}')
+        over_budget = over_budget or total_ms > budget_ms
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+# benchmarks/bench_suite.py
+"""
+Run the analyzer's main operations against the mock GitHub server at
+several network sizes, reporting wall-clock time, API calls issued and
+peak memory for each.
+
+Three more operations cover the paths that depend on GitHub's response
+headers: scoring again through the HTTP cache with every entry stale, so
+each request is revalidated with If-None-Match and answered 304; a
+second round of conditional event polls by the engagement daemon; and
+engagements with the first THROTTLED_USERS followers under a secondary
+mutation limit, so the client waits out Retry-After and retries.
+
+Every size gets its own mock server process, and every operation runs in
+a fresh worker process, so one operation's imports and allocations do
+not leak into the next one's numbers. Operations on a network take its
+followers as input; fetching them is setup and is not measured. The
+client is built as the CLI builds it, minus the HTTP cache and entity
+store (every call goes to the server) and with local mutation pacing
+lifted, which would otherwise hold engagements to 80 per minute.
+
+Usage:
+    python -m benchmarks.bench_suite [--sizes 1000,10000,100000] [--operations NAME,...] [--latency MS]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from time import perf_counter
+
+OPERATIONS = (
+    'analyze_followers',
+    'follow_followers_followers',
+    'filter_users',
+    'calculate_user_scores',
+    'analyze_network_languages',
+    'perform_automated_engagements',
+    'calculate_user_scores_revalidated',
+    'poll_events',
+    'throttled_engagements',
+)
+DEFAULT_SIZES = (1000, 10000, 100000)
+FILTER_CRITERIA = {'min_followers': '5', 'language': 'python'}
+ENGAGEMENT_CONFIG = {'star_repo': True, 'like_commit': True, 'comment_issue_pr': True, 'follow_back': True}
+# Mock settings every operation starts from, and the secondary limit of throttled_engagements
+MOCK_DEFAULTS = {'max_age': 60, 'mutation_limit': None, 'mutation_window': 60.0}
+THROTTLE = {'mutation_limit': 200, 'mutation_window': 1.0}
+THROTTLED_USERS = 500
+
+
+def _peak_rss_mib() -> float:
+    import resource
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10)
+
+
+def run_operation(name: str, base_url: str) -> dict:
+    """
+    Run one operation against a running mock server and measure it.
+
+    Args:
+        name (str): One of OPERATIONS
+        base_url (str): Root URL of the mock server
+
+    Returns:
+        dict: seconds, calls (by request kind), peak and baseline RSS in MiB, and a result summary
+    """
+    import tempfile
+    from rich.console import Console
+    from core.cache import HTTPCache
+    from core.daemon import EngagementDaemon
+    from core.github_api import GitHubAPIClient
+    from core.rate_limiter import RateLimiter
+    from core.utils import GitHubFollowerAnalyzer
+
+    console = Console(quiet=True)
+    cache_dir = tempfile.TemporaryDirectory()
+    cache = HTTPCache(f'{cache_dir.name}/cache.sqlite3') if name == 'calculate_user_scores_revalidated' else None
+    client = GitHubAPIClient('mock-token', base_url=base_url, console=console, cache=cache,
+                             rate_limiter=RateLimiter(mutation_capacity=10 ** 9, mutation_window=1))
+    analyzer = GitHubFollowerAnalyzer(client, console)
+    client.session.put(f'{base_url}/_mock/config', json=MOCK_DEFAULTS)
+
+    def stats() -> dict:
+        return client.session.get(f'{base_url}/_mock/stats').json()
+
+    users = None
+    if name not in ('analyze_followers', 'follow_followers_followers'):
+        users = client.get_followers(client.get_user_info()['login'])
+    # Import what the operations load lazily, so it is not part of the measurement
+    import core.engagement  # noqa: F401
+    import core.scoring  # noqa: F401
+
+    # Setup the header-driven operations measure against
+    if name == 'calculate_user_scores_revalidated':
+        client.session.put(f'{base_url}/_mock/config', json={'max_age': 0})
+        analyzer.calculate_user_scores(users)
+    elif name == 'poll_events':
+        daemon = EngagementDaemon(client, ENGAGEMENT_CONFIG)
+        daemon.track(users)
+        for username in users:
+            daemon.poll(username)
+    elif name == 'throttled_engagements':
+        users = dict(list(users.items())[:THROTTLED_USERS])
+        client.session.put(f'{base_url}/_mock/config', json=THROTTLE)
+
+    before = stats()
+    baseline = _peak_rss_mib()
+    start = perf_counter()
+    if name == 'analyze_followers':
+        result = [len(group) for group in analyzer.analyze_followers()]
+    elif name == 'follow_followers_followers':
+        followed, recommended = analyzer.follow_followers_followers(max_users=50, max_pages_per_seed=1)
+        result = [len(followed), len(recommended)]
+    elif name == 'filter_users':
+        result = len(analyzer.filter_users(users, FILTER_CRITERIA))
+    elif name == 'calculate_user_scores':
+        result = len(analyzer.calculate_user_scores(users))
+    elif name == 'analyze_network_languages':
+        result = len(analyzer.analyze_network_languages(users))
+    elif name in ('perform_automated_engagements', 'throttled_engagements'):
+        performed = analyzer.perform_automated_engagements(users, ENGAGEMENT_CONFIG)
+        result = sum(map(len, performed.values()))
+    elif name == 'calculate_user_scores_revalidated':
+        result = len(analyzer.calculate_user_scores(users))
+    elif name == 'poll_events':
+        result = sum(len(daemon.poll(username)[0]) for username in users)
+    else:
+        raise ValueError(f"Unknown operation: {name}")
+    seconds = perf_counter() - start
+    after = stats()
+    client.close()
+    cache_dir.cleanup()
+
+    return {
+        'seconds': seconds,
+        'calls': {kind: after[kind] - before[kind] for kind in after if after[kind] != before[kind]},
+        'peak_mib': _peak_rss_mib(),
+        'baseline_mib': baseline,
+        'result': result,
+    }
+
+
+def _start_mock(users: int, latency: float) -> tuple:
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.mock_github', '--users', str(users), '--latency', str(latency)],
+        stdout=subprocess.PIPE, text=True)
+    return server, server.stdout.readline().strip()
+
+
+def _measure(name: str, base_url: str) -> dict:
+    worker = subprocess.run([sys.executable, '-m', 'benchmarks.bench_suite', '--worker', name, base_url],
+                            capture_output=True, text=True)
+    if worker.returncode != 0:
+        raise RuntimeError(f"{name} failed:\n{worker.stderr}")
+    return json.loads(worker.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analyzer against a mock GitHub API.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated network sizes (default: 1000,10000,100000)")
+    parser.add_argument('--operations', default=','.join(OPERATIONS), help="Comma-separated operations to run")
+    parser.add_argument('--latency', type=float, default=0.0, help="Milliseconds the mock adds to every request")
+    parser.add_argument('--worker', nargs=2, metavar=('OPERATION', 'BASE_URL'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_operation(*args.worker)))
+        return
+
+    operations = args.operations.split(',')
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+
+    print(f"{'users':>7}  {'operation':<34} {'seconds':>9} {'API calls':>10} "
+          f"{'peak MiB':>9} {'+MiB':>7}  result")
+    for size in map(int, args.sizes.split(',')):
+        server, base_url = _start_mock(size, args.latency)
+        try:
+            for name in operations:
+                run = _measure(name, base_url)
+                calls = run['calls'].pop('total', 0)
+                print(f"{size:>7}  {name:<34} {run['seconds']:>9.2f} {calls:>10} "
+                      f"{run['peak_mib']:>9.1f} {run['peak_mib'] - run['baseline_mib']:>7.1f}  "
+                      f"{run['result']}  {run['calls']}", flush=True)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_transport.py
+"""
+Compare per-call latency of one-off `requests.get` calls against the pooled
+GitHubAPIClient session, using a local stub server.
+
+Usage:
+    python -m benchmarks.bench_transport [calls]
+"""
+
+import sys
+from statistics import mean, median
+from time import perf_counter
+
+import requests
+
+from benchmarks.stub_server import StubServer
+from core.github_api import GitHubAPIClient
+
+
+def _user_route(path, query, request):
+    login = path.rsplit('/', 1)[-1]
+    return 200, {}, {'login': login, 'followers': 1, 'following': 1, 'public_repos': 1}
+
+
+def _measure(call, calls: int) -> list:
+    timings = []
+    for index in range(calls):
+        start = perf_counter()
+        call(index)
+        timings.append((perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list):
+    print(f"{label:<22} mean {mean(timings):7.3f} ms   median {median(timings):7.3f} ms   "
+          f"total {sum(timings):8.1f} ms")
+
+
+def main(calls: int = 500):
+    """Run both transports against the stub server and print the timings."""
+    with StubServer() as server:
+        server.route('GET', '/users/', _user_route)
+        client = GitHubAPIClient('stub-token', base_url=server.base_url)
+        headers = client.headers
+
+        # Warm up both paths so the first-call import costs are excluded
+        requests.get(f'{server.base_url}/users/warmup', headers=headers).json()
+        client.get_user_details('warmup')
+
+        before = _measure(lambda i: requests.get(
+            f'{server.base_url}/users/user{i}', headers=headers).json(), calls)
+        after = _measure(lambda i: client.get_user_details(f'user{i}'), calls)
+        client.close()
+
+    print(f"{calls} sequential GET /users/<login> calls")
+    _report("requests.get (before)", before)
+    _report("pooled session (after)", after)
+    print(f"speed-up: {mean(before) / mean(after):.2f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
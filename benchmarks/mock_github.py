@@ -0,0 +1,419 @@
+# benchmarks/mock_github.py
+"""
+A local mock of the GitHub REST API serving a synthetic network.
+
+The authenticated user 'me' has network_size users around them: user0 ..
+user{3N/4 - 1} follow them, and they follow user{N/4} .. user{N - 1}, so
+half of the network is mutual. Every user in the network and an equal
+number of outsiders (user{N} .. user{2N - 1}) has a profile, repositories,
+recent events and a followers list of their own, generated on request
+from a per-user seed, so nothing is held in memory and every run sees
+the same data. Lists are paginated with Link headers, every response
+carries X-RateLimit headers, and mutations are accepted and counted
+without changing the network. POST /graphql answers the batched user
+lookups and followers/following pages GitHubGraphQLClient sends.
+
+Like GitHub, reads carry an ETag and Cache-Control max-age, and a
+matching If-None-Match gets a 304 that is not charged to the rate limit;
+event feeds also send X-Poll-Interval. An optional secondary limit on
+mutations answers 403 with Retry-After once exceeded. The cache max-age
+and the secondary limit can be changed at runtime with PUT /_mock/config.
+
+Usage:
+    python -m benchmarks.mock_github [--users N] [--port PORT] [--latency MS] [--rate-limit N]
+                                     [--max-age SECONDS] [--mutation-limit N]
+
+Point a GitHubAPIClient at the printed URL with base_url=...
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+from collections import deque
+from math import ceil
+from time import monotonic, sleep, time
+from typing import Dict, List, Optional
+
+from benchmarks.stub_server import StubServer, graphql_route
+
+LOGIN = 'me'
+# Large enough that the client's rate limiter never slows a benchmark down
+DEFAULT_RATE_LIMIT = 10 ** 9
+RATE_LIMIT_WINDOW = 3600
+# GitHub's Cache-Control max-age and X-Poll-Interval for events, in seconds
+DEFAULT_MAX_AGE = 60
+POLL_INTERVAL = 60
+LANGUAGES = ('Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C++', 'Ruby', None)
+# Relative frequency of each generated event type
+EVENT_TYPES = ('PushEvent', 'PushEvent', 'PushEvent', 'CreateEvent', 'WatchEvent',
+               'IssuesEvent', 'PullRequestEvent', 'IssueCommentEvent')
+# Request kinds counted separately in /_mock/stats
+REQUEST_KINDS = ('user', 'profile', 'followers', 'following', 'repos', 'events', 'mutation',
+                 'graphql', 'not_modified', 'throttled')
+
+
+class MockGitHub:
+    """
+    Serves a synthetic follower network over a StubServer.
+    """
+
+    def __init__(self, users: int = 1000, seed: int = 42, latency: float = 0.0,
+                 rate_limit: int = DEFAULT_RATE_LIMIT, port: int = 0, max_age: int = DEFAULT_MAX_AGE,
+                 mutation_limit: Optional[int] = None, mutation_window: float = 60.0):
+        """
+        Build the network and register its routes.
+
+        Args:
+            users (int): Network size, followers and following together
+            seed (int): Seed all generated data derives from
+            latency (float): Seconds every request is delayed by
+            rate_limit (int): Requests allowed per hour before 403 responses
+            port (int): Port to bind, 0 picks a free one
+            max_age (int): Cache-Control max-age of reads, 0 makes clients revalidate every time
+            mutation_limit (int): Mutations allowed per mutation_window, None for no secondary limit
+            mutation_window (float): Seconds the secondary limit applies to
+        """
+        self.users = users
+        self.seed = seed
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.max_age = max_age
+        self.mutation_limit = mutation_limit
+        self.mutation_window = mutation_window
+        self.followers = range(0, users * 3 // 4)
+        self.following = range(users // 4, users)
+        self.counts = dict.fromkeys(REQUEST_KINDS, 0)
+        self._requests = 0
+        self._used = 0
+        self._reset_at = int(time()) + RATE_LIMIT_WINDOW
+        self._mutations = deque()
+        self._lock = threading.Lock()
+        self._graphql_handler = graphql_route(self._graphql_user, self._graphql_connections)
+
+        self.server = StubServer(port)
+        self.server.route('GET', '/_mock/stats', self._stats)
+        self.server.route('PUT', '/_mock/config', self._configure)
+        self.server.route('PUT', '/user/following/', self._mutation)
+        self.server.route('DELETE', '/user/following/', self._mutation)
+        self.server.route('PUT', '/user/starred/', self._mutation)
+        self.server.route('POST', '/repos/', self._mutation)
+        self.server.route('POST', '/graphql', self._graphql)
+        self.server.route('GET', '/users/', self._users)
+        self.server.route('GET', '/user', self._authenticated_user)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL clients should use."""
+        return self.server.base_url
+
+    def start(self) -> 'MockGitHub':
+        """Serve requests on a background thread."""
+        self.server.start()
+        return self
+
+    def stop(self):
+        """Shut the server down."""
+        self.server.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Requests served so far, excluding /_mock routes.
+
+        Returns:
+            Dict[str, int]: 'total' and a count per request kind; 304s and
+                throttled requests are also counted under their own kinds
+        """
+        with self._lock:
+            return {'total': self._requests, **self.counts}
+
+    # Synthetic data
+
+    def _rng(self, index: int, kind: str) -> random.Random:
+        return random.Random(f'{self.seed}:{index}:{kind}')
+
+    def _index(self, login: str) -> Optional[int]:
+        # Network users and outsiders, None for unknown logins
+        if not login.startswith('user') or not login[4:].isdigit():
+            return None
+        index = int(login[4:])
+        return index if index < 2 * self.users else None
+
+    def _summary(self, index: int) -> dict:
+        # The user fields of followers and following lists
+        login = f'user{index}'
+        return {
+            'login': login,
+            'id': index + 1,
+            'avatar_url': f'https://avatars.githubusercontent.com/u/{index + 1}?v=4',
+            'url': f'https://api.github.com/users/{login}',
+            'html_url': f'https://github.com/{login}',
+            'type': 'User',
+            'site_admin': False,
+        }
+
+    def _connections(self, index: int, relation: str) -> List[int]:
+        # Heavy-tailed list sizes: most users have a handful, a few have hundreds
+        rng = self._rng(index, relation)
+        count = max(0, min(int(rng.paretovariate(1.2) * 4) - 4, 500, 2 * self.users))
+        return rng.sample(range(2 * self.users), count)
+
+    def _repos(self, index: int) -> List[dict]:
+        rng = self._rng(index, 'repos')
+        login = f'user{index}'
+        repos = []
+        for number in range(rng.randint(0, 8)):
+            pushed_at = f'20{rng.randint(18, 26)}-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T12:00:00Z'
+            repos.append({
+                'id': index * 100 + number + 1,
+                'name': f'repo{number}',
+                'full_name': f'{login}/repo{number}',
+                'owner': {'login': login, 'id': index + 1},
+                'private': False,
+                'fork': rng.random() < 0.2,
+                'stargazers_count': int(rng.paretovariate(1.1)) - 1,
+                'forks_count': int(rng.paretovariate(1.4)) - 1,
+                'language': rng.choice(LANGUAGES),
+                'created_at': '2018-01-01T00:00:00Z',
+                'updated_at': pushed_at,
+                'pushed_at': pushed_at,
+            })
+        return repos
+
+    def _profile(self, index: int) -> dict:
+        rng = self._rng(index, 'profile')
+        return {
+            **self._summary(index),
+            'name': f'User {index}' if rng.random() < 0.7 else None,
+            'company': None,
+            'blog': '',
+            'location': None,
+            'bio': None,
+            'public_repos': len(self._repos(index)),
+            'public_gists': rng.randint(0, 5),
+            'followers': len(self._connections(index, 'followers')),
+            'following': len(self._connections(index, 'following')),
+            'created_at': f'20{rng.randint(10, 25)}-{rng.randint(1, 12):02d}-01T00:00:00Z',
+            'updated_at': '2026-01-01T00:00:00Z',
+        }
+
+    def _graphql_user(self, login: str, repos: int) -> Optional[dict]:
+        index = self._index(login)
+        if index is None:
+            return None
+        profile = self._profile(index)
+        owned = sorted(self._repos(index), key=lambda repo: repo['pushed_at'], reverse=True)
+        return {
+            'login': login,
+            'databaseId': profile['id'],
+            'name': profile['name'],
+            'createdAt': profile['created_at'],
+            'updatedAt': profile['updated_at'],
+            'followers': {'totalCount': profile['followers']},
+            'following': {'totalCount': profile['following']},
+            'repositories': {'totalCount': len(owned), 'nodes': [{
+                'name': repo['name'],
+                'stargazerCount': repo['stargazers_count'],
+                'forkCount': repo['forks_count'],
+                'pushedAt': repo['pushed_at'],
+                'primaryLanguage': {'name': repo['language']} if repo['language'] else None,
+            } for repo in owned[:repos]]},
+        }
+
+    def _graphql_connections(self, login: str, relation: str) -> List[str]:
+        if login == LOGIN:
+            indexes = self.followers if relation == 'followers' else self.following
+        else:
+            index = self._index(login)
+            indexes = [] if index is None else self._connections(index, relation)
+        return [f'user{index}' for index in indexes]
+
+    def _events(self, index: int) -> List[dict]:
+        rng = self._rng(index, 'events')
+        repos = [repo['full_name'] for repo in self._repos(index)]
+        if not repos:
+            return []
+        events = []
+        for number in range(rng.randint(0, 6)):
+            event_type = rng.choice(EVENT_TYPES)
+            if event_type == 'PushEvent':
+                payload = {'commits': [{'sha': f'{rng.getrandbits(160):040x}', 'message': 'Update'}
+                                       for _ in range(rng.randint(1, 3))]}
+            elif event_type == 'CreateEvent':
+                payload = {'ref_type': 'repository'}
+            elif event_type == 'IssuesEvent':
+                payload = {'action': rng.choice(('opened', 'closed')), 'issue': {'number': rng.randint(1, 500)}}
+            elif event_type == 'PullRequestEvent':
+                payload = {'action': rng.choice(('opened', 'closed')),
+                           'pull_request': {'number': rng.randint(1, 500)}}
+            else:
+                payload = {'action': 'created'}
+            events.append({
+                'id': str(index * 10 + number),
+                'type': event_type,
+                'actor': {'login': f'user{index}', 'id': index + 1},
+                'repo': {'name': rng.choice(repos)},
+                'payload': payload,
+                'public': True,
+                'created_at': '2026-01-01T00:00:00Z',
+            })
+        return events
+
+    # Routes
+
+    def _respond(self, kind: str, request, status: int = 200, headers: Optional[dict] = None,
+                 body=None) -> tuple:
+        if self.latency:
+            sleep(self.latency)
+        headers = dict(headers or {})
+        if request.command == 'GET' and status == 200:
+            etag = f'W/"{hashlib.md5(json.dumps(body).encode()).hexdigest()}"'
+            headers.update({'ETag': etag, 'Cache-Control': f'private, max-age={self.max_age}'})
+            if etag in request.headers.get('If-None-Match', ''):
+                # Revalidations that hit are free, as on GitHub
+                status, body, kind = 304, None, 'not_modified'
+
+        with self._lock:
+            if time() >= self._reset_at:
+                self._used, self._reset_at = 0, int(time()) + RATE_LIMIT_WINDOW
+            self._requests += 1
+            self.counts[kind] += 1
+            if status != 304:
+                self._used += 1
+            throttled = kind == 'mutation' and self._throttle()
+            if throttled:
+                self.counts['throttled'] += 1
+            limit_headers = {
+                'X-RateLimit-Limit': str(self.rate_limit),
+                'X-RateLimit-Remaining': str(max(0, self.rate_limit - self._used)),
+                'X-RateLimit-Reset': str(self._reset_at),
+                'X-RateLimit-Used': str(self._used),
+                'X-RateLimit-Resource': 'core',
+            }
+            exhausted = self._used > self.rate_limit
+
+        if exhausted:
+            return 403, limit_headers, {'message': 'API rate limit exceeded'}
+        if throttled:
+            return 403, {**limit_headers, 'Retry-After': str(throttled)}, \
+                {'message': 'You have exceeded a secondary rate limit'}
+        return status, {**limit_headers, **headers}, body
+
+    def _throttle(self) -> int:
+        # Seconds the client must wait under the secondary limit, 0 to let the mutation through
+        if self.mutation_limit is None:
+            return 0
+        now = monotonic()
+        while self._mutations and self._mutations[0] <= now - self.mutation_window:
+            self._mutations.popleft()
+        if len(self._mutations) >= self.mutation_limit:
+            return max(1, ceil(self._mutations[0] + self.mutation_window - now))
+        self._mutations.append(now)
+        return 0
+
+    def _page(self, kind: str, request, path: str, query: Dict[str, list], items, render=None) -> tuple:
+        # One page of a list, with Link headers when there is more than one
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+        page = max(int(query.get('page', ['1'])[0]), 1)
+        last = max(1, -(-len(items) // per_page))
+        body = items[(page - 1) * per_page:page * per_page]
+        headers = {}
+        if last > 1:
+            url = f"http://{request.headers['Host']}{path}?per_page={per_page}&page="
+            links = [f'<{url}{page + 1}>; rel="next"'] if page < last else []
+            headers['Link'] = ', '.join(links + [f'<{url}{last}>; rel="last"'])
+        return self._respond(kind, request, headers=headers,
+                             body=[render(item) for item in body] if render else body)
+
+    def _stats(self, path, query, request):
+        return 200, {}, self.stats()
+
+    def _configure(self, path, query, request):
+        settings = json.loads(request.request_body or b'{}')
+        with self._lock:
+            for name in ('max_age', 'mutation_limit', 'mutation_window'):
+                if name in settings:
+                    setattr(self, name, settings[name])
+            self._mutations.clear()
+        return 204, {}, None
+
+    def _graphql(self, path, query, request):
+        status, headers, body = self._graphql_handler(path, query, request)
+        return self._respond('graphql', request, status, headers, body)
+
+    def _mutation(self, path, query, request):
+        return self._respond('mutation', request, 201 if path.startswith('/repos/') else 204)
+
+    def _authenticated_user(self, path, query, request):
+        if path != '/user':
+            return 404, {}, {'message': 'Not Found'}
+        return self._respond('user', request, body={
+            'login': LOGIN,
+            'id': 2 * self.users + 1,
+            'html_url': f'https://github.com/{LOGIN}',
+            'type': 'User',
+            'name': 'Benchmark User',
+            'public_repos': 0,
+            'followers': len(self.followers),
+            'following': len(self.following),
+            'created_at': '2015-01-01T00:00:00Z',
+            'updated_at': '2026-01-01T00:00:00Z',
+        })
+
+    def _users(self, path, query, request):
+        parts = path.strip('/').split('/')
+        login = parts[1] if len(parts) > 1 else ''
+        resource = parts[2] if len(parts) == 3 else None
+        if login == LOGIN and resource in ('followers', 'following'):
+            indexes = self.followers if resource == 'followers' else self.following
+            return self._page(resource, request, path, query, indexes, self._summary)
+
+        index = self._index(login)
+        if index is None or len(parts) > 3:
+            return 404, {}, {'message': 'Not Found'}
+        if resource is None:
+            return self._respond('profile', request, body=self._profile(index))
+        if resource in ('followers', 'following'):
+            return self._page(resource, request, path, query, self._connections(index, resource), self._summary)
+        if resource == 'repos':
+            repos = self._repos(index)
+            if query.get('sort') == ['pushed']:
+                repos.sort(key=lambda repo: repo['pushed_at'], reverse=True)
+            return self._page('repos', request, path, query, repos)
+        if resource == 'events':
+            return self._respond('events', request, headers={'X-Poll-Interval': str(POLL_INTERVAL)},
+                                 body=self._events(index)[:int(query.get('per_page', ['30'])[0])])
+        return 404, {}, {'message': 'Not Found'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic GitHub network locally.")
+    parser.add_argument('--users', type=int, default=1000, help="Network size (default: 1000)")
+    parser.add_argument('--port', type=int, default=0, help="Port to bind, 0 picks a free one")
+    parser.add_argument('--latency', type=float, default=0.0, help="Milliseconds added to every request")
+    parser.add_argument('--rate-limit', type=int, default=DEFAULT_RATE_LIMIT, help="Requests allowed per hour")
+    parser.add_argument('--max-age', type=int, default=DEFAULT_MAX_AGE, help="Cache-Control max-age of reads")
+    parser.add_argument('--mutation-limit', type=int, help="Mutations allowed per minute before Retry-After")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    mock = MockGitHub(args.users, args.seed, args.latency / 1000, args.rate_limit, args.port,
+                      args.max_age, args.mutation_limit)
+    print(mock.base_url, flush=True)
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+# benchmarks/stub_server.py
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple
+from urllib.parse import urlparse, parse_qs
+
+# A route handler receives (path, query, handler) and returns (status, headers, body)
+Route = Callable[[str, Dict[str, list], BaseHTTPRequestHandler], Tuple[int, dict, object]]
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Minimal keep-alive capable request handler that dispatches to the server's routes.
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        """Silence the default per-request logging."""
+
+    def _dispatch(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        length = int(self.headers.get('Content-Length') or 0)
+        self.request_body = self.rfile.read(length) if length else b''
+
+        status, headers, body = self.server.resolve(self.command, parsed.path, query, self)
+        payload = b'' if body is None else json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if payload and self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    do_GET = do_PUT = do_POST = do_DELETE = do_PATCH = do_HEAD = _dispatch
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    A local HTTP server standing in for api.github.com.
+    """
+    daemon_threads = True
+
+    def __init__(self, port: int = 0):
+        """
+        Bind the server to localhost.
+
+        Args:
+            port (int): Port to bind, 0 picks a free one
+        """
+        super().__init__(('127.0.0.1', port), StubRequestHandler)
+        self.routes = []
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL clients should use."""
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def route(self, method: str, prefix: str, handler: Route):
+        """
+        Register a handler for requests whose path starts with prefix.
+
+        Args:
+            method (str): HTTP method to match
+            prefix (str): Path prefix to match
+            handler (Route): Callable producing (status, headers, body)
+        """
+        self.routes.append((method, prefix, handler))
+
+    def resolve(self, method: str, path: str, query: Dict[str, list], request: BaseHTTPRequestHandler):
+        """Find the first matching route and run it."""
+        with self._lock:
+            self.request_count += 1
+        for route_method, prefix, handler in self.routes:
+            if route_method == method and path.startswith(prefix):
+                return handler(path, query, request)
+        return 404, {}, {'message': 'Not Found'}
+
+    def start(self) -> 'StubServer':
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def graphql_route(users: Callable[[str, int], dict], connections: Callable[[str, str], list] = None) -> Route:
+    """
+    Build a stand-in for GitHub's /graphql endpoint that answers the queries
+    sent by GitHubGraphQLClient.
+
+    Batched lookups are recognized by their $l0..$lN variables, connection
+    pages by $login/$first/$after.
+
+    Args:
+        users (Callable[[str, int], dict]): Returns the GraphQL user node for a login with at
+            most the given number of repository nodes, or None
+        connections (Callable[[str, str], list]): Returns the logins related to a user
+            for 'followers' or 'following'
+
+    Returns:
+        Route: Handler to register for POST /graphql
+    """
+    def handler(path, query, request):
+        payload = json.loads(request.request_body or b'{}')
+        variables = payload.get('variables', {})
+        repos = int(re.search(r'repositories\(first: (\d+)', payload['query']).group(1))
+
+        if 'login' in variables:
+            relation = 'followers' if ' followers(first' in payload['query'] else 'following'
+            logins = connections(variables['login'], relation) if connections else []
+            start = int(variables.get('after') or 0)
+            end = start + variables['first']
+            nodes = [users(login, repos) for login in logins[start:end]]
+            return 200, {}, {'data': {'user': {relation: {
+                'pageInfo': {'hasNextPage': end < len(logins), 'endCursor': str(end)},
+                'nodes': [node for node in nodes if node],
+            }}}}
+
+        data = {f'u{name[1:]}': users(login, repos) for name, login in variables.items()}
+        return 200, {}, {'data': data}
+
+    return handler
@@ -0,0 +1,387 @@
+# cli.py
+"""
+Non-interactive GitCleanse commands for scripts, cron and CI.
+
+Every result is written to stdout as one JSON object per line (NDJSON);
+progress and errors go to stderr. The token comes from --token or the
+GITHUB_TOKEN environment variable, never from a prompt.
+
+Usage:
+    python main.py analyze --relation not-following-back --min-followers 10
+    python main.py analyze --stream
+    python main.py unfollow --dry-run --limit 50
+    python main.py dashboard --top 20
+    python main.py report --format columnar --diff github_network_report_20260101_120000.gcr
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from config import get_github_token, get_cache_path, ENRICH_BACKEND
+
+if TYPE_CHECKING:
+    from core.models import UserInfo
+    from core.utils import GitHubFollowerAnalyzer
+
+# Mirrors core.aggregator.BACKENDS, kept here so parsing arguments imports nothing heavy
+BACKENDS = ('rest', 'graphql')
+
+# Mirrors core.relationships.RELATIONS
+RELATIONS = ('mutual', 'not-following-back', 'not-followed-back')
+# Mirrors reports.formats.WRITERS
+REPORT_FORMATS = ('csv', 'ndjson', 'columnar')
+# Users filtered per batch while streaming, so profile fetches stay concurrent
+STREAM_FILTER_BATCH = 100
+
+# Filter flag -> UserFilter criterion
+FILTER_FLAGS = {
+    'min_followers': int,
+    'max_followers': int,
+    'min_repos': int,
+    'max_repos': int,
+    'min_account_age_days': int,
+    'max_days_since_push': int,
+    'min_stars': int,
+    'language': str,
+}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def emit(record: dict):
+    """Write one NDJSON record to stdout."""
+    sys.stdout.write(json.dumps(record, default=_json_default, ensure_ascii=False) + '\n')
+    sys.stdout.flush()
+
+
+def _criteria(args: argparse.Namespace) -> Dict[str, str]:
+    return {
+        key: str(getattr(args, key)) for key in FILTER_FLAGS
+        if getattr(args, key, None) is not None
+    }
+
+
+def _limit(users: Dict[str, UserInfo], limit: Optional[int]) -> Dict[str, UserInfo]:
+    if limit is None:
+        return users
+    return dict(list(users.items())[:limit])
+
+
+def _run_bulk(analyzer: GitHubFollowerAnalyzer, operation: str, targets: List[str], dry_run: bool):
+    if dry_run:
+        for target in targets:
+            emit({'type': 'mutation', 'operation': operation, 'login': target, 'ok': None, 'dry_run': True})
+        emit({'type': 'summary', 'operation': operation, 'planned': len(targets), 'dry_run': True})
+        return 0
+
+    # Imported here so read-only commands do not pay for it
+    from core.mutations import BulkMutationExecutor
+
+    login = analyzer.api_client.get_user_info()['login']
+    executor = BulkMutationExecutor(
+        analyzer.api_client, get_cache_path(os.path.join('journals', f'{operation}-{login}.jsonl')))
+    report = executor.run(operation, targets, on_progress=lambda target, ok: emit(
+        {'type': 'mutation', 'operation': operation, 'login': target, 'ok': ok}))
+    emit({
+        'type': 'summary', 'operation': operation, 'succeeded': len(report.succeeded),
+        'failed': report.failed, 'skipped': len(report.skipped),
+        'elapsed': round(report.elapsed, 3), 'throughput': round(report.throughput, 3),
+    })
+    return 1 if report.failed else 0
+
+
+def _analyze_stream(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    from core.relationships import StreamingRelationshipAnalyzer
+
+    criteria = _criteria(args)
+    relations = args.relation or RELATIONS
+    batch_size = STREAM_FILTER_BATCH if criteria else 1
+    batches = {relation: {} for relation in relations}
+    emitted = dict.fromkeys(relations, 0)
+
+    def flush(relation: str):
+        users = analyzer.filter_users(batches[relation], criteria)
+        batches[relation] = {}
+        for login, user in users.items():
+            if args.limit is not None and emitted[relation] >= args.limit:
+                break
+            emitted[relation] += 1
+            emit({'type': 'user', 'relation': relation, 'login': login, 'html_url': user.profile_url})
+
+    stream = StreamingRelationshipAnalyzer(analyzer.api_client)
+    for relation, user in stream.run():
+        if relation not in batches or (args.limit is not None and emitted[relation] >= args.limit):
+            continue
+        batches[relation][user.login] = user
+        if len(batches[relation]) >= batch_size:
+            flush(relation)
+    for relation in relations:
+        flush(relation)
+    emit({'type': 'summary', **{relation.replace('-', '_'): count for relation, count in stream.counts.items()}})
+    return 0
+
+
+def cmd_analyze(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Emit mutual, not-following-back and not-followed-back users."""
+    if args.stream:
+        return _analyze_stream(analyzer, args)
+    mutual, not_following_back, not_followed_back = analyzer.analyze_followers()
+    groups = {
+        'mutual': mutual,
+        'not-following-back': not_following_back,
+        'not-followed-back': not_followed_back,
+    }
+    criteria = _criteria(args)
+    for relation in args.relation or RELATIONS:
+        users = analyzer.filter_users(groups[relation], criteria)
+        for login, user in _limit(users, args.limit).items():
+            emit({'type': 'user', 'relation': relation, 'login': login, 'html_url': user.profile_url})
+    emit({'type': 'summary', **{relation.replace('-', '_'): len(users) for relation, users in groups.items()}})
+    return 0
+
+
+def cmd_unfollow(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Unfollow users who do not follow you back."""
+    _, not_following_back, _ = analyzer.analyze_followers()
+    targets = _limit(analyzer.filter_users(not_following_back, _criteria(args)), args.limit)
+    return _run_bulk(analyzer, 'unfollow', list(targets), args.dry_run)
+
+
+def cmd_followback(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Follow back followers you do not follow."""
+    _, _, not_followed_back = analyzer.analyze_followers()
+    targets = _limit(analyzer.filter_users(not_followed_back, _criteria(args)), args.limit)
+    return _run_bulk(analyzer, 'follow', list(targets), args.dry_run)
+
+
+def cmd_discover(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Recommend (and unless --dry-run, follow) your followers' followers."""
+    newly_followed, recommended_users = analyzer.follow_followers_followers(
+        args.max_users, args.max_pages, follow=not args.dry_run)
+    followed = set(newly_followed)
+    for login, recommended_by in recommended_users:
+        emit({'type': 'recommendation', 'login': login, 'recommended_by': recommended_by,
+              'followed': login in followed})
+    emit({'type': 'summary', 'recommended': len(recommended_users), 'followed': len(newly_followed),
+          'dry_run': args.dry_run})
+    return 0
+
+
+def cmd_activity(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Emit the activity analysis of each given user."""
+    for username in args.usernames:
+        emit({'type': 'activity', 'login': username, **analyzer.analyze_user_activity(username)})
+    return 0
+
+
+def cmd_dashboard(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Emit top scores, language counts, activity buckets and totals of your followers."""
+    from core.dashboard import DashboardPipeline
+
+    api_client = analyzer.api_client
+    user_info = api_client.get_user_info()
+    summary = DashboardPipeline(api_client, backend=args.backend, top_k=args.top).run_connections(
+        user_info['login'], user_info['followers'])
+
+    for rank, (login, data) in enumerate(summary.scored_users.items(), start=1):
+        emit({'type': 'score', 'rank': rank, 'login': login, 'score': data['score'],
+              'percentile': data['percentile'], 'total_stars': data['total_stars'],
+              'total_forks': data['total_forks']})
+    for language, count in summary.language_counts.items():
+        emit({'type': 'language', 'language': language, 'repos': count})
+    for bucket, count in summary.activity.items():
+        emit({'type': 'activity_bucket', 'bucket': bucket, 'users': count})
+    emit({'type': 'summary', 'followers': summary.total, 'total_stars': summary.total_stars,
+          'total_forks': summary.total_forks})
+    return 0
+
+
+def cmd_report(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Stream your whole network to a report file, optionally diffing it against an earlier one."""
+    from reports.formats import diff_reports, load_report, open_report_writer
+    from reports.report_generator import NetworkReportGenerator, report_filename
+
+    output = args.output or report_filename(args.format, datetime.now().strftime('%Y%m%d_%H%M%S'))
+    generator = NetworkReportGenerator(analyzer.api_client, backend=args.backend)
+    with open_report_writer(output, args.format) as writer:
+        counts = generator.write(writer)
+    emit({'type': 'report', 'path': output, 'format': args.format, 'rows': writer.rows,
+          **{relation.replace('-', '_'): count for relation, count in counts.items()}})
+
+    if args.diff:
+        diff = diff_reports(load_report(args.diff), load_report(output))
+        for login in diff['added']:
+            emit({'type': 'diff', 'change': 'added', 'login': login})
+        for login in diff['removed']:
+            emit({'type': 'diff', 'change': 'removed', 'login': login})
+        for login, old, new in diff['changed']:
+            emit({'type': 'diff', 'change': 'relation', 'login': login, 'old': old, 'new': new})
+        emit({'type': 'summary', 'added': len(diff['added']), 'removed': len(diff['removed']),
+              'changed': len(diff['changed'])})
+    return 0
+
+
+def cmd_engage(analyzer: GitHubFollowerAnalyzer, args: argparse.Namespace) -> int:
+    """Engage with followers' recent activity, optionally watching for more."""
+    from core.daemon import EngagementDaemon
+    from core.engagement import DEFAULT_COMMENT, EngagementEngine
+    from core.ledger import EngagementLedger
+
+    config = {
+        'star_repo': args.star,
+        'like_commit': args.like,
+        'follow_back': args.follow_back,
+        'comment_issue_pr': args.comment is not None,
+        'comment_message': args.comment or DEFAULT_COMMENT,
+    }
+    engine = EngagementEngine(analyzer.api_client, config)
+    context = engine.refresh_context()
+    ledger = EngagementLedger(get_cache_path(os.path.join('ledgers', f'{context.login}.sqlite3')))
+    engine.ledger = ledger
+    try:
+        performed_actions = engine.run(context.followers, context)
+        for login, actions in performed_actions.items():
+            for action in actions:
+                emit({'type': 'engagement', 'login': login, 'action': action})
+        for login, reasons in engine.failures.items():
+            for reason in reasons:
+                emit({'type': 'error', 'login': login, 'error': reason})
+        emit({'type': 'summary', 'users': len(performed_actions),
+              'actions': sum(len(actions) for actions in performed_actions.values()),
+              'failed': sum(len(reasons) for reasons in engine.failures.values())})
+
+        if args.watch:
+            daemon = EngagementDaemon(analyzer.api_client, config, ledger=ledger)
+            try:
+                daemon.run(
+                    on_action=lambda action, ok: emit(
+                        {'type': 'engagement', 'login': action.username, 'action': action.description, 'ok': ok}),
+                    on_error=lambda username, e: emit({'type': 'error', 'login': username, 'error': str(e)}))
+            except KeyboardInterrupt:
+                daemon.stop()
+    finally:
+        ledger.close()
+    return 0
+
+
+def _add_filter_flags(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group('filters')
+    for key, kind in FILTER_FLAGS.items():
+        group.add_argument(f"--{key.replace('_', '-')}", dest=key, type=kind, metavar='N' if kind is int else 'NAME')
+    parser.add_argument('--limit', type=int, help='Only act on the first N matching users')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for every headless command."""
+    parser = argparse.ArgumentParser(
+        prog='gitcleanse', description='Headless GitCleanse commands with NDJSON output.')
+    parser.add_argument('--token', help='GitHub token, defaults to the GITHUB_TOKEN environment variable')
+    parser.add_argument('--quiet', action='store_true', help='Suppress progress output on stderr')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    analyze = commands.add_parser('analyze', help='List mutual, not-following-back and not-followed-back users')
+    analyze.add_argument('--relation', action='append', choices=RELATIONS,
+                         help='Only emit this relation (repeatable)')
+    analyze.add_argument('--stream', action='store_true',
+                         help='Emit users as pages arrive, holding only the smaller list in memory')
+    _add_filter_flags(analyze)
+
+    for name, description in (('unfollow', 'Unfollow users who do not follow you back'),
+                              ('followback', 'Follow back your followers')):
+        command = commands.add_parser(name, help=description)
+        command.add_argument('--dry-run', action='store_true', help='Only emit the users that would be changed')
+        _add_filter_flags(command)
+
+    discover = commands.add_parser('discover', help="Recommend and follow your followers' followers")
+    discover.add_argument('--max-users', type=int, default=50, help='Maximum users to recommend (default 50)')
+    discover.add_argument('--max-pages', type=int, default=3, help='Follower pages crawled per follower (default 3)')
+    discover.add_argument('--dry-run', action='store_true', help='Recommend without following')
+
+    activity = commands.add_parser('activity', help='Analyze the activity of one or more users')
+    activity.add_argument('usernames', nargs='+', metavar='USERNAME')
+
+    dashboard = commands.add_parser('dashboard', help='Score your followers and summarize their activity')
+    dashboard.add_argument('--top', type=int, default=10, help='Number of top scored users (default 10)')
+    dashboard.add_argument('--backend', choices=BACKENDS, default=ENRICH_BACKEND)
+
+    report = commands.add_parser('report', help='Write every follower and followed user to a report file')
+    report.add_argument('--format', choices=REPORT_FORMATS, default='csv', help='Report format (default csv)')
+    report.add_argument('--output', metavar='PATH', help='Report file, defaults to a timestamped name')
+    report.add_argument('--diff', metavar='PATH', help='Earlier report to compare the new one with')
+    report.add_argument('--backend', choices=BACKENDS, default=ENRICH_BACKEND)
+
+    engage = commands.add_parser('engage', help="Engage with your followers' recent activity")
+    engage.add_argument('--star', action='store_true', help='Star newly created repositories')
+    engage.add_argument('--like', action='store_true', help='Like new commits')
+    engage.add_argument('--comment', nargs='?', const='', metavar='MESSAGE',
+                        help='Comment on new issues and pull requests')
+    engage.add_argument('--follow-back', action='store_true', help='Follow back followers')
+    engage.add_argument('--watch', action='store_true', help='Keep polling for new activity until interrupted')
+
+    return parser
+
+
+HANDLERS = {
+    'analyze': cmd_analyze,
+    'unfollow': cmd_unfollow,
+    'followback': cmd_followback,
+    'discover': cmd_discover,
+    'activity': cmd_activity,
+    'dashboard': cmd_dashboard,
+    'report': cmd_report,
+    'engage': cmd_engage,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run one headless command.
+
+    Args:
+        argv (List[str]): Command-line arguments, defaults to sys.argv[1:]
+
+    Returns:
+        int: Process exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    token = args.token or get_github_token(interactive=False)
+    if not token:
+        parser.error('a GitHub token is required: pass --token or set GITHUB_TOKEN')
+
+    import requests
+    from rich.console import Console
+    from core.client_factory import create_api_client
+    from core.utils import GitHubFollowerAnalyzer
+
+    # Progress goes to stderr so stdout stays pure NDJSON
+    api_client = create_api_client(token, Console(stderr=True, quiet=args.quiet))
+    analyzer = GitHubFollowerAnalyzer(api_client)
+    try:
+        return HANDLERS[args.command](analyzer, args)
+    except requests.exceptions.RequestException as e:
+        print(f"gitcleanse: API error: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"gitcleanse: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        api_client.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,21 +1,49 @@
 """Configuration settings for the application."""
 
 import os
-from rich.prompt import Prompt
 from dotenv import load_dotenv
 
 # Load environment variables from the .env file
 load_dotenv()
 
+# Directory for persistent caches, override with GITCLEANSE_CACHE_DIR
+CACHE_DIR = os.getenv('GITCLEANSE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.gitcleanse'))
 
-def get_github_token():
+# Seconds before stored users and repositories are fetched again
+ENTITY_TTLS = {
+    'users': int(os.getenv('GITCLEANSE_USER_TTL', 6 * 3600)),
+    'repos': int(os.getenv('GITCLEANSE_REPOS_TTL', 6 * 3600)),
+}
+
+# Backend used to enrich many users at once: 'rest' or 'graphql'
+ENRICH_BACKEND = os.getenv('GITCLEANSE_BACKEND', 'rest')
+
+
+def get_github_token(interactive: bool = True):
     """
     Retrieves the GitHub token from environment variables or user input.
 
+    Args:
+        interactive (bool): Prompt for the token when the environment has none
+
     Returns:
-        str: GitHub personal access token
+        str: GitHub personal access token, or None if missing and not interactive
     """
     token = os.getenv('GITHUB_TOKEN')
-    if not token:
+    if not token and interactive:
+        from rich.prompt import Prompt
         token = Prompt.ask("Enter your GitHub token", password=True)
     return token
+
+
+def get_cache_path(filename: str) -> str:
+    """
+    Builds the path of a file inside the cache directory.
+
+    Args:
+        filename (str): Name of the cache file
+
+    Returns:
+        str: Absolute path of the cache file
+    """
+    return os.path.join(CACHE_DIR, filename)
@@ -0,0 +1,179 @@
+# core/aggregator.py
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from core.github_api import GitHubAPIClient
+from core.models import UserDetails, UserProfile
+
+# Backends an aggregator can enrich users with
+BACKENDS = ('rest', 'graphql')
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a GitHub ISO-8601 timestamp into an aware datetime.
+
+    Args:
+        value (str): Timestamp such as '2024-01-31T12:00:00Z'
+
+    Returns:
+        datetime: Parsed UTC datetime, or None if value is empty
+    """
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def summarize_repos(repos: List[dict]) -> dict:
+    """
+    Compute a user's repository metrics in a single pass.
+
+    Args:
+        repos (List[dict]): Repositories of one user
+
+    Returns:
+        dict: total_stars, total_forks, last_push_at and per-language repo counts
+    """
+    total_stars = 0
+    total_forks = 0
+    last_push = None
+    languages = {}
+    for repo in repos:
+        total_stars += repo.get('stargazers_count', 0)
+        total_forks += repo.get('forks_count', 0)
+        if repo.get('language'):
+            languages[repo['language']] = languages.get(repo['language'], 0) + 1
+        pushed = repo.get('pushed_at') or repo.get('updated_at')
+        if pushed and (last_push is None or pushed > last_push):
+            # ISO-8601 UTC timestamps sort lexicographically
+            last_push = pushed
+    return {
+        'total_stars': total_stars,
+        'total_forks': total_forks,
+        'last_push_at': parse_timestamp(last_push),
+        'languages': languages,
+    }
+
+
+class MetricColumns:
+    """
+    The scoring metrics of profiles, filled one row at a time as profiles are built.
+
+    Collecting the rows while users load lets ranking turn them into NumPy
+    columns directly instead of walking every profile again.
+    """
+
+    def __init__(self):
+        self.logins = []
+        self.stars = []
+        self.forks = []
+        self.last_push = []
+        self.followers = []
+        self.repos = []
+
+    def __len__(self) -> int:
+        return len(self.logins)
+
+    def add(self, profile: UserProfile):
+        """
+        Append one profile's row.
+
+        Args:
+            profile (UserProfile): Enriched record
+        """
+        self.logins.append(profile.username)
+        self.stars.append(profile.total_stars)
+        self.forks.append(profile.total_forks)
+        self.last_push.append(profile.last_push_at.timestamp() if profile.last_push_at else float('nan'))
+        self.followers.append(profile.details.followers)
+        self.repos.append(profile.details.public_repos)
+
+
+class UserProfileAggregator:
+    """
+    Builds enriched user profiles with one profile and one repository fetch per user.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, max_workers: Optional[int] = None, backend: str = 'rest'):
+        """
+        Initialize the aggregator.
+
+        Args:
+            api_client (GitHubAPIClient): Client used to fetch profiles and repositories
+            max_workers (int): Concurrent repository fetches, defaults to the client's page workers
+            backend (str): 'rest' for one profile and one repo request per user,
+                'graphql' to enrich up to 100 users per request
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.api_client = api_client
+        self.max_workers = max_workers or api_client.page_workers
+        self.backend = backend
+
+    def build(self, username: str, details: dict, repos: List[dict]) -> UserProfile:
+        """
+        Combine a profile and its repositories into one record.
+
+        Args:
+            username (str): GitHub username
+            details (dict): User profile from the API
+            repos (List[dict]): The user's repositories
+
+        Returns:
+            UserProfile: The enriched record
+        """
+        metrics = summarize_repos(repos)
+        # Only the profile fields in use are kept, not the whole API object
+        return UserProfile(username=username, details=UserDetails.from_api(details, metrics['total_stars']),
+                           **metrics)
+
+    def profile(self, username: str) -> UserProfile:
+        """
+        Build the enriched profile of one user.
+
+        Args:
+            username (str): GitHub username
+
+        Returns:
+            UserProfile: The enriched record
+        """
+        return self.build(username, self.api_client.get_user_details(username),
+                          self.api_client.get_user_repos(username))
+
+    def profiles(self, usernames: Iterable[str], columns: Optional[MetricColumns] = None) -> Dict[str, UserProfile]:
+        """
+        Build enriched profiles for many users concurrently.
+
+        Args:
+            usernames (Iterable[str]): GitHub usernames
+            columns (MetricColumns): Filled with each profile as it is built, in the returned order
+
+        Returns:
+            Dict[str, UserProfile]: Enriched records keyed by username, in input order
+        """
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return {}
+
+        if self.backend == 'graphql':
+            users = self.api_client.graphql.get_users(usernames)
+            return self._collect((self.build(username, *users[username])
+                                  for username in usernames if username in users), columns)
+
+        details = self.api_client.get_users_details(usernames)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(usernames))) as executor:
+            all_repos = executor.map(self.api_client.get_user_repos, usernames)
+            return self._collect((self.build(username, details[username], repos)
+                                  for username, repos in zip(usernames, all_repos)), columns)
+
+    @staticmethod
+    def _collect(records: Iterable[UserProfile], columns: Optional[MetricColumns]) -> Dict[str, UserProfile]:
+        profiles = {}
+        for profile in records:
+            profiles[profile.username] = profile
+            if columns is not None:
+                # Filled while the remaining users are still loading
+                columns.add(profile)
+        return profiles
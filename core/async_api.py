@@ -0,0 +1,108 @@
+# core/async_api.py
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional
+
+from core.github_api import GitHubAPIClient
+from core.models import UserInfo
+
+
+class AsyncGitHubAPIClient:
+    """
+    Asyncio facade over GitHubAPIClient with bounded concurrency.
+
+    Every coroutine runs the matching blocking call on a dedicated thread
+    pool sized to the concurrency limit, so the pooled session, rate
+    limiter, HTTP cache and entity store are shared with the wrapped
+    client. A semaphore caps how many calls are in flight at once.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, concurrency: Optional[int] = None):
+        """
+        Initialize the async client.
+
+        Args:
+            api_client (GitHubAPIClient): Client whose transport, limiter and caches are shared
+            concurrency (int): Maximum calls in flight, defaults to the connection pool size
+        """
+        self.api_client = api_client
+        self.concurrency = concurrency or api_client.pool_size
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self._semaphore = None
+
+    async def _call(self, func: Callable, *args):
+        # The semaphore is created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args))
+
+    def close(self):
+        """Shut down the worker threads; the wrapped client stays open."""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    async def get_user_info(self) -> dict:
+        """Get authenticated user information."""
+        return await self._call(self.api_client.get_user_info)
+
+    async def get_user_details(self, username: str) -> dict:
+        """Get detailed information about a user."""
+        return await self._call(self.api_client.get_user_details, username)
+
+    async def get_users_details(self, usernames: Iterable[str]) -> Dict[str, dict]:
+        """Get detailed information about many users with one store lookup and one bulk write."""
+        return await self._call(self.api_client.get_users_details, list(usernames))
+
+    async def get_followers(self, username: str) -> Dict[str, UserInfo]:
+        """Get all followers of a user."""
+        users = await self._call(self.api_client.get_pages, f'/users/{username}/followers',
+                                 None, None, UserInfo.from_api)
+        return {user.login: user for user in users}
+
+    async def get_following(self, username: str) -> Dict[str, UserInfo]:
+        """Get all users a user is following."""
+        users = await self._call(self.api_client.get_pages, f'/users/{username}/following',
+                                 None, None, UserInfo.from_api)
+        return {user.login: user for user in users}
+
+    async def get_user_followers_limited(self, username: str, max_pages: int = 3) -> Dict[str, UserInfo]:
+        """Get followers of a specific user up to a max number of pages."""
+        users = await self._call(self.api_client.get_pages, f'/users/{username}/followers',
+                                 None, max_pages, UserInfo.from_api)
+        return {user.login: user for user in users}
+
+    async def get_user_repos(self, username: str) -> List[dict]:
+        """Get the list of repositories of a given user."""
+        return await self._call(self.api_client.get_user_repos, username)
+
+    async def get_user_events(self, username: str) -> List[dict]:
+        """Get recent events for a user."""
+        return await self._call(self.api_client.get_user_events, username)
+
+    async def follow_user(self, username: str) -> bool:
+        """Follow a specific user."""
+        return await self._call(self.api_client.follow_user, username)
+
+    async def unfollow_user(self, username: str) -> bool:
+        """Unfollow a specific user."""
+        return await self._call(self.api_client.unfollow_user, username)
+
+    async def star_repository(self, owner: str, repo: str) -> bool:
+        """Star a specific repository."""
+        return await self._call(self.api_client.star_repository, owner, repo)
+
+    async def create_comment(self, owner: str, repo: str, issue_number: int, comment: str) -> bool:
+        """Create a comment on a specific issue or pull request."""
+        return await self._call(self.api_client.create_comment, owner, repo, issue_number, comment)
+
+    async def like_commit(self, owner: str, repo: str, commit_sha: str) -> bool:
+        """Like a specific commit (by adding a reaction)."""
+        return await self._call(self.api_client.like_commit, owner, repo, commit_sha)
@@ -0,0 +1,213 @@
+# core/cache.py
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from time import time
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Response headers kept with a cached body so a 304 can be replayed faithfully
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Link', 'Cache-Control', 'X-Poll-Interval')
+
+
+class HTTPCache:
+    """
+    Persistent conditional-request cache for GitHub GET endpoints.
+
+    Entries are keyed by URL and query parameters and store the ETag,
+    Last-Modified and body of the last 200 response. Stale entries are
+    revalidated with If-None-Match / If-Modified-Since, and a 304 reply
+    (which GitHub does not charge against the rate limit) is answered
+    from disk.
+    """
+
+    def __init__(self, path: str, identity: str = ''):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str): SQLite file to store entries in
+            identity (str): Caller identity mixed into keys so tokens never share entries
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.identity = identity
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS http_cache ('
+            ' key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT,'
+            ' headers TEXT, body BLOB, expires_at REAL)'
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+
+    def key(self, url: str, params: Optional[dict] = None) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            url (str): Absolute request URL
+            params (dict): Query parameters
+
+        Returns:
+            str: Stable key for the URL and parameters
+        """
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f'{self.identity}\n{url}?{query}'.encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """
+        Get the stored entry for a key.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            dict: Entry with etag, last_modified, headers, body and expires_at, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified, headers, body, expires_at FROM http_cache WHERE key = ?',
+                (key,)
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'etag': row[0],
+            'last_modified': row[1],
+            'headers': json.loads(row[2]),
+            'body': row[3],
+            'expires_at': row[4] or 0.0,
+        }
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Check whether an entry is still within its Cache-Control max-age."""
+        return entry['expires_at'] > time()
+
+    def conditional_headers(self, entry: Optional[dict]) -> Dict[str, str]:
+        """
+        Headers that turn a request into a conditional one.
+
+        Args:
+            entry (dict): Stored entry, or None
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key: str, url: str, response: requests.Response):
+        """
+        Save a 200 response if it carries a validator.
+
+        Args:
+            key (str): Cache key
+            url (str): Request URL
+            response (requests.Response): Response to store
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, url, etag, last_modified, json.dumps(headers), response.content,
+                 time() + max_age(response.headers))
+            )
+            self._conn.commit()
+
+    def refresh(self, key: str, response: requests.Response):
+        """
+        Extend an entry's freshness after a 304 revalidation.
+
+        Args:
+            key (str): Cache key
+            response (requests.Response): The 304 response
+        """
+        with self._lock:
+            self._conn.execute(
+                'UPDATE http_cache SET expires_at = ? WHERE key = ?',
+                (time() + max_age(response.headers), key)
+            )
+            self._conn.commit()
+
+    def replay(self, entry: dict, url: str) -> requests.Response:
+        """
+        Build a 200 response from a stored entry.
+
+        Args:
+            entry (dict): Stored entry
+            url (str): Request URL
+
+        Returns:
+            requests.Response: Response carrying the cached body and headers
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']
+        response.encoding = 'utf-8'
+        return response
+
+    def record(self, outcome: str):
+        """
+        Count a cache outcome.
+
+        Args:
+            outcome (str): 'hits', 'not_modified' or 'misses'
+        """
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counts of cache outcomes since the cache was opened.
+
+        Returns:
+            Dict[str, int]: Fresh hits, 304 revalidations and misses
+        """
+        return {'hits': self.hits, 'not_modified': self.not_modified, 'misses': self.misses}
+
+    def clear(self):
+        """Delete every stored entry."""
+        with self._lock:
+            self._conn.execute('DELETE FROM http_cache')
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def max_age(headers) -> int:
+    """
+    Read max-age from a Cache-Control header.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        int: Seconds the response may be reused without revalidation
+    """
+    match = re.search(r'max-age=(\d+)', headers.get('Cache-Control', ''))
+    return int(match.group(1)) if match else 0
@@ -0,0 +1,30 @@
+# core/client_factory.py
+
+import hashlib
+from typing import TYPE_CHECKING, Optional
+
+from config import ENTITY_TTLS, get_cache_path
+from core.cache import HTTPCache
+from core.github_api import GitHubAPIClient
+from core.store import EntityStore
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+def create_api_client(token: str, console: Optional['Console'] = None) -> GitHubAPIClient:
+    """
+    Build an API client backed by the on-disk HTTP cache and entity store.
+
+    Args:
+        token (str): GitHub personal access token
+        console (Console): Console for status output, shared with the caller
+
+    Returns:
+        GitHubAPIClient: The configured client
+    """
+    # Conditional-request cache, keyed per token so accounts never share entries
+    cache = HTTPCache(get_cache_path('http_cache.sqlite3'),
+                      identity=hashlib.sha256(token.encode()).hexdigest())
+    store = EntityStore(get_cache_path('entities.sqlite3'), ENTITY_TTLS)
+    return GitHubAPIClient(token, cache=cache, store=store, console=console)
@@ -0,0 +1,232 @@
+# core/daemon.py
+
+import heapq
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from core.engagement import EngagementEngine
+from core.github_api import GitHubAPIClient
+from core.ledger import EngagementLedger
+from core.models import EngagementAction
+
+# Seconds between polls of one feed when GitHub sends no X-Poll-Interval
+DEFAULT_POLL_INTERVAL = 60
+# Primary rate limit assumed until a response reports the real one
+DEFAULT_HOURLY_LIMIT = 5000
+RATE_LIMIT_WINDOW = 3600
+# Sent mutations remembered for repeat checks; older ones are covered by the ledger and following list
+QUEUED_LIMIT = 10000
+
+
+def new_events(events: List[dict], cursor: Optional[int]) -> List[dict]:
+    """
+    Select the events newer than a cursor.
+
+    Args:
+        events (List[dict]): Events as returned by the API, newest first
+        cursor (int): Id of the newest event already processed
+
+    Returns:
+        List[dict]: Unprocessed events, oldest first
+    """
+    fresh = [event for event in events if cursor is None or int(event['id']) > cursor]
+    return fresh[::-1]
+
+
+class EngagementDaemon:
+    """
+    Long-running engagement that only acts on new activity.
+
+    Each user's event feed is polled with If-None-Match, so unchanged feeds
+    cost a 304 instead of a download, and never more often than GitHub's
+    X-Poll-Interval allows. A per-user cursor (the newest processed event
+    id) is kept in the entity store when one is configured, so restarts do
+    not act on the same events twice. Polls are scheduled on a heap and
+    spread evenly over the rate-limit window.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, config: dict, budget_share: float = 0.5,
+                 context_refresh: float = RATE_LIMIT_WINDOW, mutation_workers: int = 4,
+                 ledger: Optional[EngagementLedger] = None):
+        """
+        Initialize the daemon.
+
+        Args:
+            api_client (GitHubAPIClient): Client used for polls and mutations
+            config (dict): Engagement options as returned by UserPrompts.ask_for_engagement_options
+            budget_share (float): Fraction of the hourly primary limit polls may use
+            context_refresh (float): Seconds between reloads of own following/followers
+            mutation_workers (int): Mutations in flight at once
+            ledger (EngagementLedger): Record of performed actions to consult and update
+        """
+        self.api_client = api_client
+        self.engine = EngagementEngine(api_client, config, mutation_workers=mutation_workers, ledger=ledger)
+        self.budget_share = budget_share
+        self.context_refresh = context_refresh
+        self.cursors: Dict[str, Optional[int]] = {}
+        self.etags: Dict[str, Optional[str]] = {}
+        self._schedule = []
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Ask a running daemon to exit after the current poll."""
+        self._stop.set()
+
+    def spread_interval(self, user_count: int) -> float:
+        """
+        Seconds between polls of one feed so all feeds fit the polling budget.
+
+        Args:
+            user_count (int): Number of feeds being polled
+
+        Returns:
+            float: Interval per feed
+        """
+        limit = self.api_client.rate_limiter.status()['core']['limit'] or DEFAULT_HOURLY_LIMIT
+        return user_count * RATE_LIMIT_WINDOW / (limit * self.budget_share)
+
+    def track(self, usernames: Iterable[str], now: Optional[float] = None):
+        """
+        Start polling users, staggering their first polls over one interval.
+
+        Args:
+            usernames (Iterable[str]): Users to add, already tracked ones are ignored
+            now (float): Monotonic time to schedule from
+        """
+        added = [username for username in usernames if username not in self.cursors]
+        if not added:
+            return
+        store = self.api_client.store
+        stored = store.get_event_cursors(added) if store is not None else {}
+        for username in added:
+            self.cursors[username], self.etags[username] = stored.get(username, (None, None))
+
+        now = monotonic() if now is None else now
+        interval = max(DEFAULT_POLL_INTERVAL, self.spread_interval(len(self.cursors)))
+        step = interval / len(added)
+        for index, username in enumerate(added):
+            heapq.heappush(self._schedule, (now + index * step, username))
+
+    def untrack(self, usernames: Iterable[str]):
+        """
+        Stop polling users.
+
+        Args:
+            usernames (Iterable[str]): Users to drop
+        """
+        for username in usernames:
+            self.cursors.pop(username, None)
+            self.etags.pop(username, None)
+        self._schedule = [item for item in self._schedule if item[1] in self.cursors]
+        heapq.heapify(self._schedule)
+
+    def poll(self, username: str) -> tuple:
+        """
+        Poll one user's feed and advance their cursor.
+
+        The first poll of a user without a stored cursor only records where
+        the feed stands; activity from before the daemon started is left to
+        the one-shot engagement.
+
+        Args:
+            username (str): GitHub username
+
+        Returns:
+            tuple: (new events oldest first, seconds until the next poll)
+        """
+        result = self.api_client.poll_user_events(username, self.etags.get(username))
+        interval = max(result.poll_interval or DEFAULT_POLL_INTERVAL, self.spread_interval(len(self.cursors)))
+        if not result.modified:
+            return [], interval
+
+        cursor = self.cursors.get(username)
+        events = new_events(result.events, cursor) if cursor is not None else []
+        newest = max((int(event['id']) for event in result.events), default=cursor or 0)
+        self.cursors[username] = max(newest, cursor or 0)
+        self.etags[username] = result.etag
+        if self.api_client.store is not None:
+            self.api_client.store.set_event_cursor(username, self.cursors[username], result.etag)
+        return events, interval
+
+    def run(self, users: Optional[Iterable[str]] = None,
+            on_action: Optional[Callable[[EngagementAction, bool], None]] = None,
+            on_error: Optional[Callable[[str, Exception], None]] = None):
+        """
+        Poll and engage until stop() is called.
+
+        Args:
+            users (Iterable[str]): Users to watch, defaults to your followers (kept in step on every context refresh)
+            on_action (Callable[[EngagementAction, bool], None]): Called after each mutation with its outcome
+            on_error (Callable[[str, Exception], None]): Called when a poll fails, with the polled user, or
+                when a context refresh fails, with your own login; either is retried a poll interval later
+        """
+        follow_followers = users is None
+        context = self.engine.refresh_context()
+        context_loaded = monotonic()
+        self.track(context.followers if follow_followers else users)
+        # Keys of mutations sent by this run, oldest first; settled ones the ledger or following list
+        # now covers are dropped, the rest are capped at QUEUED_LIMIT
+        queued = OrderedDict()
+        queued_lock = threading.Lock()
+
+        def dispatch(action: EngagementAction):
+            # Errors would vanish inside the pool, so they count as a failed mutation
+            try:
+                succeeded = self.engine.dispatch(action)
+            except requests.exceptions.RequestException:
+                succeeded = False
+            if succeeded and action.kind == 'follow':
+                context.following.add(action.target)
+            if succeeded and (action.kind == 'follow' or self.engine.already_done(action)):
+                with queued_lock:
+                    queued.pop(action.key, None)
+            if on_action:
+                on_action(action, succeeded)
+
+        with ThreadPoolExecutor(max_workers=self.engine.mutation_workers) as mutations:
+            while not self._stop.is_set():
+                if monotonic() - context_loaded >= self.context_refresh:
+                    try:
+                        previous = context.followers
+                        context = self.engine.refresh_context()
+                        context_loaded = monotonic()
+                        if follow_followers:
+                            self.untrack(previous - context.followers)
+                            self.track(context.followers - previous)
+                    except requests.exceptions.RequestException as e:
+                        # Keep polling with the current context and try again after a poll interval
+                        context_loaded = monotonic() - self.context_refresh + DEFAULT_POLL_INTERVAL
+                        if on_error:
+                            on_error(context.login, e)
+
+                if not self._schedule:
+                    self._stop.wait(DEFAULT_POLL_INTERVAL)
+                    continue
+                due, username = self._schedule[0]
+                if self._stop.wait(max(0.0, due - monotonic())):
+                    break
+                heapq.heappop(self._schedule)
+
+                try:
+                    events, interval = self.poll(username)
+                except requests.exceptions.RequestException as e:
+                    events, interval = [], max(DEFAULT_POLL_INTERVAL, self.spread_interval(len(self.cursors)))
+                    if on_error:
+                        on_error(username, e)
+                heapq.heappush(self._schedule, (monotonic() + interval, username))
+
+                if events:
+                    for action in self.engine.plan(username, events, context):
+                        # A mutation already sent by this daemon or recorded in the ledger is never repeated
+                        with queued_lock:
+                            if action.key in queued or self.engine.already_done(action):
+                                continue
+                            queued[action.key] = None
+                            if len(queued) > QUEUED_LIMIT:
+                                queued.popitem(last=False)
+                        mutations.submit(dispatch, action)
@@ -0,0 +1,191 @@
+# core/dashboard.py
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from core.aggregator import MetricColumns, UserProfileAggregator
+from core.github_api import GitHubAPIClient
+from core.models import DashboardSummary, UserProfile
+
+# Activity buckets by days since the last push, checked in order
+ACTIVITY_BUCKETS = (
+    ('Last 7 days', 7),
+    ('Last 30 days', 30),
+    ('Last 90 days', 90),
+    ('Last year', 365),
+)
+STALE_BUCKET = 'Over a year'
+INACTIVE_BUCKET = 'Never pushed'
+
+
+def activity_bucket(last_push_at: Optional[datetime], now: datetime) -> str:
+    """
+    Name the activity bucket a user's last push falls into.
+
+    Args:
+        last_push_at (datetime): The user's latest push, None if they never pushed
+        now (datetime): Reference time
+
+    Returns:
+        str: Bucket name
+    """
+    if last_push_at is None:
+        return INACTIVE_BUCKET
+    days = (now - last_push_at).days
+    for name, limit in ACTIVITY_BUCKETS:
+        if days <= limit:
+            return name
+    return STALE_BUCKET
+
+
+class DashboardPipeline:
+    """
+    Builds every dashboard aggregate from a single fetch per follower.
+
+    Each follower's profile and repositories are fetched once and folded
+    into the scores, language counts, star/fork totals and activity
+    buckets as soon as they arrive, so partial results can be rendered
+    while the remaining followers are still loading.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, backend: str = 'rest', max_workers: Optional[int] = None,
+                 top_k: int = 10, update_interval: float = 0.25):
+        """
+        Initialize the pipeline.
+
+        Args:
+            api_client (GitHubAPIClient): Client used to fetch profiles and repositories
+            backend (str): 'rest' or 'graphql' to fetch the followers' data with
+            max_workers (int): Concurrent REST fetches, defaults to the client's page workers
+            top_k (int): Number of top scored users kept in the summary
+            update_interval (float): Minimum seconds between partial updates
+        """
+        self.api_client = api_client
+        self.aggregator = UserProfileAggregator(api_client, max_workers, backend)
+        self.top_k = top_k
+        self.update_interval = update_interval
+
+    def stream(self, usernames: Iterable[str]) -> Iterator[UserProfile]:
+        """
+        Fetch enriched profiles, yielding each as soon as it is ready.
+
+        Args:
+            usernames (Iterable[str]): GitHub usernames
+
+        Yields:
+            UserProfile: Enriched records in completion order
+        """
+        usernames = list(usernames)
+        if not usernames:
+            return
+
+        if self.aggregator.backend == 'graphql':
+            # One request per batch, each batch is yielded as it returns
+            batch_size = self.api_client.graphql.batch_size
+            for start in range(0, len(usernames), batch_size):
+                yield from self.aggregator.profiles(usernames[start:start + batch_size]).values()
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.aggregator.max_workers, len(usernames))) as executor:
+            futures = [executor.submit(self.aggregator.profile, username) for username in usernames]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def stream_connections(self, username: str, relation: str = 'followers') -> Iterator[UserProfile]:
+        """
+        Fetch a user's followers or following with the GraphQL backend, enriched as they are listed.
+
+        Each page of the list comes back with every user's profile and
+        repositories in the same query, so nothing is listed over REST first.
+
+        Args:
+            username (str): GitHub username whose list is enriched
+            relation (str): 'followers' or 'following'
+
+        Yields:
+            UserProfile: Enriched records in list order
+        """
+        for page in self.api_client.graphql.iter_connections(username, relation):
+            for login, (details, repos) in page.items():
+                yield self.aggregator.build(login, details, repos)
+
+    def run(self, usernames: Iterable[str],
+            on_update: Optional[Callable[[DashboardSummary], None]] = None) -> DashboardSummary:
+        """
+        Aggregate the dashboard in one streaming pass.
+
+        Args:
+            usernames (Iterable[str]): Followers to include
+            on_update (Callable): Called with partial summaries while loading and with the final one
+
+        Returns:
+            DashboardSummary: The complete aggregates
+        """
+        usernames = list(usernames)
+        return self._aggregate(self.stream(usernames), len(usernames), on_update)
+
+    def run_connections(self, username: str, expected_count: int, relation: str = 'followers',
+                        on_update: Optional[Callable[[DashboardSummary], None]] = None) -> DashboardSummary:
+        """
+        Aggregate the dashboard over a user's followers or following.
+
+        With the GraphQL backend the list and its enrichment are one query
+        per page; over REST the list is synced and its users fetched after.
+
+        Args:
+            username (str): GitHub username
+            expected_count (int): Size of the list reported by the user's profile
+            relation (str): 'followers' or 'following'
+            on_update (Callable): Called with partial summaries while loading and with the final one
+
+        Returns:
+            DashboardSummary: The complete aggregates
+        """
+        if self.aggregator.backend == 'graphql':
+            return self._aggregate(self.stream_connections(username, relation), expected_count, on_update)
+        return self.run(self.api_client.sync_connections(username, relation, expected_count), on_update)
+
+    def _aggregate(self, records: Iterable[UserProfile], total: int,
+                   on_update: Optional[Callable[[DashboardSummary], None]]) -> DashboardSummary:
+        now = datetime.now(timezone.utc)
+        summary = DashboardSummary(total=total)
+        profiles = {}
+        columns = MetricColumns()
+        last_update = monotonic()
+
+        for profile in records:
+            if profile.username in profiles:
+                # A list that shifts while it is paged can list a user twice
+                continue
+            profiles[profile.username] = profile
+            columns.add(profile)
+            summary.processed += 1
+            summary.total_stars += profile.total_stars
+            summary.total_forks += profile.total_forks
+            for language, count in profile.languages.items():
+                summary.language_counts[language] = summary.language_counts.get(language, 0) + count
+            bucket = activity_bucket(profile.last_push_at, now)
+            summary.activity[bucket] = summary.activity.get(bucket, 0) + 1
+
+            if on_update and monotonic() - last_update >= self.update_interval:
+                on_update(self._finish(summary, profiles, columns))
+                last_update = monotonic()
+
+        # The profile's count can lag the list, the summary reports what was processed
+        summary.total = summary.processed
+        summary = self._finish(summary, profiles, columns)
+        if on_update:
+            on_update(summary)
+        return summary
+
+    def _finish(self, summary: DashboardSummary, profiles: Dict[str, UserProfile],
+                columns: MetricColumns) -> DashboardSummary:
+        # Ranking and ordering only happen when a summary is handed out; NumPy loads on first use
+        from core.scoring import rank_profiles
+
+        summary.scored_users = rank_profiles(profiles, self.top_k, columns=columns)
+        summary.language_counts = dict(
+            sorted(summary.language_counts.items(), key=lambda item: item[1], reverse=True))
+        return summary
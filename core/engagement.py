@@ -0,0 +1,242 @@
+# core/engagement.py
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from core.github_api import GitHubAPIClient
+from core.ledger import EngagementLedger
+from core.models import EngagementAction, EngagementContext
+
+DEFAULT_COMMENT = "Great job, keep up the amazing work! 😄"
+# Issue and pull request actions that get a comment
+COMMENT_ON_ACTIONS = ('opened', 'created', 'submitted')
+# Actions recorded in the ledger; follows are checked against the following list instead
+LEDGER_KINDS = ('star', 'like', 'comment')
+# Event fetches and mutations in flight or waiting, per worker; bounds a run's memory
+QUEUE_PER_WORKER = 4
+
+
+def plan_event_actions(username: str, event: dict, config: dict) -> List[EngagementAction]:
+    """
+    Decide which mutations an event calls for.
+
+    Args:
+        username (str): User whose event it is
+        event (dict): Event from the GitHub events API
+        config (dict): Engagement options as returned by UserPrompts.ask_for_engagement_options
+
+    Returns:
+        List[EngagementAction]: Planned mutations, possibly none
+    """
+    repo_full_name = event["repo"]["name"]
+    owner, repo = repo_full_name.split("/", 1)
+    payload = event.get("payload", {})
+
+    if event["type"] == "CreateEvent" and config.get("star_repo", False):
+        return [EngagementAction(username, 'star', repo_full_name, (owner, repo),
+                                 f"Starred repo: {repo_full_name}")]
+
+    if event["type"] == "PushEvent" and config.get("like_commit", False):
+        return [
+            EngagementAction(username, 'like', f"{repo_full_name}@{commit['sha']}",
+                             (owner, repo, commit['sha']), f"Liked commit: {commit['sha']}")
+            for commit in payload.get("commits", []) if commit.get("sha")
+        ]
+
+    if event["type"] in ("IssuesEvent", "PullRequestEvent") and config.get("comment_issue_pr", False) \
+            and payload.get("action", "") in COMMENT_ON_ACTIONS:
+        is_issue = event["type"] == "IssuesEvent"
+        number = payload["issue"]["number"] if is_issue else payload["pull_request"]["number"]
+        comment = config.get("comment_message", DEFAULT_COMMENT)
+        return [EngagementAction(username, 'comment', f"{repo_full_name}#{number}",
+                                 (owner, repo, number, comment),
+                                 f"Commented on {'issue' if is_issue else 'PR'} {number}")]
+
+    return []
+
+
+class EngagementEngine:
+    """
+    Engages with users' recent activity without redundant reads.
+
+    The authenticated user's login, following and followers are loaded once
+    per run into an EngagementContext. Users' events are fetched
+    concurrently and every planned mutation is queued to a small pool of
+    dispatchers; the client's rate limiter paces them against the mutation
+    budget, so a run is bounded by mutation limits rather than reads. Only
+    a few fetches and mutations per worker are queued at a time, so memory
+    does not grow with the network. A user whose events cannot be fetched,
+    or a mutation that fails, is recorded in failures and the run goes on.
+    With a ledger, stars, likes and comments performed by any earlier run
+    are skipped before they are queued.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, config: dict, max_workers: Optional[int] = None,
+                 mutation_workers: int = 4, ledger: Optional[EngagementLedger] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            api_client (GitHubAPIClient): Client used for reads and mutations
+            config (dict): Engagement options as returned by UserPrompts.ask_for_engagement_options
+            max_workers (int): Concurrent event fetches, defaults to the client's page workers
+            mutation_workers (int): Mutations in flight at once
+            ledger (EngagementLedger): Record of performed actions to consult and update
+        """
+        self.api_client = api_client
+        self.config = config
+        self.max_workers = max_workers or api_client.page_workers
+        self.mutation_workers = mutation_workers
+        self.ledger = ledger
+        self.context = None
+        self.failures: Dict[str, List[str]] = {}
+
+    def refresh_context(self) -> EngagementContext:
+        """
+        Load the authenticated user's login, following and followers.
+
+        Returns:
+            EngagementContext: The refreshed context, also kept on the engine
+        """
+        user_info = self.api_client.get_user_info()
+        login = user_info["login"]
+        following = self.api_client.sync_connections(login, 'following', user_info.get("following", 0))
+        followers = self.api_client.sync_connections(login, 'followers', user_info.get("followers", 0))
+        self.context = EngagementContext(login, set(following), set(followers))
+        return self.context
+
+    def plan(self, username: str, events: List[dict], context: EngagementContext) -> List[EngagementAction]:
+        """
+        Plan every mutation for one user's events.
+
+        Args:
+            username (str): GitHub username
+            events (List[dict]): The user's recent events
+            context (EngagementContext): The run context
+
+        Returns:
+            List[EngagementAction]: Planned mutations
+        """
+        actions = []
+        for event in events:
+            actions.extend(plan_event_actions(username, event, self.config))
+        if self.config.get("follow_back", False) and username != context.login \
+                and username not in context.following:
+            actions.append(EngagementAction(username, 'follow', username, (username,), "Followed user back"))
+        return actions
+
+    def already_done(self, action: EngagementAction) -> bool:
+        """
+        Check the ledger for an action performed by an earlier run.
+
+        Args:
+            action (EngagementAction): Planned mutation
+
+        Returns:
+            bool: True if the mutation can be skipped
+        """
+        return self.ledger is not None and action.kind in LEDGER_KINDS and \
+            self.ledger.contains(action.kind, action.target)
+
+    def dispatch(self, action: EngagementAction) -> bool:
+        """
+        Send one planned mutation, recording it in the ledger on success.
+
+        Args:
+            action (EngagementAction): The mutation to send
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if action.kind == 'star':
+            succeeded = self.api_client.star_repository(*action.args)
+        elif action.kind == 'like':
+            succeeded = self.api_client.like_commit(*action.args)
+        elif action.kind == 'comment':
+            succeeded = self.api_client.create_comment(*action.args)
+        elif action.kind == 'follow':
+            succeeded = self.api_client.follow_user(*action.args)
+        else:
+            raise ValueError(f"Unknown engagement action: {action.kind}")
+
+        if succeeded and self.ledger is not None and action.kind in LEDGER_KINDS:
+            self.ledger.record(action.kind, action.target)
+        return succeeded
+
+    def run(self, users: Iterable[str], context: Optional[EngagementContext] = None,
+            on_progress: Optional[Callable[[str], None]] = None) -> Dict[str, List[str]]:
+        """
+        Engage with every user's recent activity.
+
+        Args:
+            users (Iterable[str]): Usernames to engage with
+            context (EngagementContext): Run context, refreshed once if not given
+            on_progress (Callable[[str], None]): Called after each user's events are planned
+
+        Returns:
+            Dict[str, List[str]]: Performed actions per user, in input order; what
+                failed is in self.failures
+        """
+        users = list(users)
+        context = context or self.context or self.refresh_context()
+        performed_actions = {username: [] for username in users}
+        self.failures = {}
+        if not users:
+            return performed_actions
+
+        queued = set()
+        reading = {}
+        dispatched = {}
+        pending_users = iter(users)
+
+        def settle(futures):
+            for future in futures:
+                action = dispatched.pop(future)
+                try:
+                    succeeded = future.result()
+                except requests.exceptions.RequestException as e:
+                    self.failures.setdefault(action.username, []).append(f"{action.description}: {e}")
+                    continue
+                if not succeeded:
+                    self.failures.setdefault(action.username, []).append(action.description)
+                    continue
+                performed_actions[action.username].append(action.description)
+                if action.kind == 'follow':
+                    context.following.add(action.target)
+
+        with ThreadPoolExecutor(max_workers=self.mutation_workers) as mutations, \
+                ThreadPoolExecutor(max_workers=min(self.max_workers, len(users))) as reads:
+            while True:
+                while len(reading) < self.max_workers * QUEUE_PER_WORKER:
+                    username = next(pending_users, None)
+                    if username is None:
+                        break
+                    reading[reads.submit(self.api_client.get_user_events, username)] = username
+                if not reading:
+                    break
+
+                done, _ = wait(reading, return_when=FIRST_COMPLETED)
+                for future in done:
+                    username = reading.pop(future)
+                    try:
+                        actions = self.plan(username, future.result(), context)
+                    except requests.exceptions.RequestException as e:
+                        # A deleted or renamed user is skipped rather than ending the run
+                        self.failures.setdefault(username, []).append(f"Could not fetch events: {e}")
+                        actions = []
+                    for action in actions:
+                        # The same repo or commit can show up in several events
+                        if action.key in queued or self.already_done(action):
+                            continue
+                        queued.add(action.key)
+                        while len(dispatched) >= self.mutation_workers * QUEUE_PER_WORKER:
+                            settle(wait(dispatched, return_when=FIRST_COMPLETED).done)
+                        dispatched[mutations.submit(self.dispatch, action)] = action
+                    if on_progress:
+                        on_progress(username)
+
+            settle(wait(dispatched).done)
+
+        return performed_actions
@@ -0,0 +1,158 @@
+# core/filters.py
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from core.aggregator import parse_timestamp, summarize_repos
+from core.github_api import GitHubAPIClient
+
+# Criteria evaluated from the user's profile alone
+DETAIL_CRITERIA = ('min_followers', 'max_followers', 'min_repos', 'max_repos', 'min_account_age_days')
+# Criteria that need the user's repositories
+REPO_CRITERIA = ('max_days_since_push', 'min_stars', 'language')
+
+
+def _days_since(moment: Optional[datetime]) -> Optional[int]:
+    if moment is None:
+        return None
+    return (datetime.now(timezone.utc) - moment).days
+
+
+def _compile_detail_check(key: str, value: int) -> Callable[[dict], bool]:
+    if key == 'min_followers':
+        return lambda details: details.get('followers', 0) >= value
+    if key == 'max_followers':
+        return lambda details: details.get('followers', 0) <= value
+    if key == 'min_repos':
+        return lambda details: details.get('public_repos', 0) >= value
+    if key == 'max_repos':
+        return lambda details: details.get('public_repos', 0) <= value
+    # min_account_age_days
+    return lambda details: (_days_since(parse_timestamp(details.get('created_at'))) or 0) >= value
+
+
+def _compile_repo_check(key: str, value) -> Callable[[dict], bool]:
+    if key == 'max_days_since_push':
+        return lambda metrics: metrics['last_push_at'] is not None and \
+            _days_since(metrics['last_push_at']) <= value
+    if key == 'min_stars':
+        return lambda metrics: metrics['total_stars'] >= value
+    # language
+    return lambda metrics: any(language.lower() == value for language in metrics['languages'])
+
+
+class UserFilter:
+    """
+    Compiles filter criteria into a single short-circuiting predicate.
+
+    Profile checks run first, and repositories are only fetched for users
+    that pass them, so every user costs at most one profile and one repo
+    request no matter how many criteria are set.
+    """
+
+    def __init__(self, criteria: Dict[str, str]):
+        """
+        Compile the criteria.
+
+        Args:
+            criteria (Dict[str, str]): Criteria as returned by UserPrompts.ask_for_filter_criteria
+
+        Raises:
+            ValueError: If a criterion is unknown or its value is not a number where one is expected
+        """
+        self.detail_checks = []
+        self.repo_checks = []
+        self.repo_criteria = set()
+        for key, value in (criteria or {}).items():
+            if value in (None, ''):
+                continue
+            if key in DETAIL_CRITERIA:
+                self.detail_checks.append(_compile_detail_check(key, int(value)))
+            elif key in REPO_CRITERIA:
+                value = value.strip().lower() if key == 'language' else int(value)
+                self.repo_checks.append(_compile_repo_check(key, value))
+                self.repo_criteria.add(key)
+            else:
+                raise ValueError(f"Unknown filter criterion: {key}")
+
+    @property
+    def needs_repos(self) -> bool:
+        """Whether any criterion needs the users' repositories."""
+        return bool(self.repo_checks)
+
+    def matches_details(self, details: dict) -> bool:
+        """
+        Evaluate the profile checks for one user.
+
+        Args:
+            details (dict): User profile
+
+        Returns:
+            bool: True if the user passes every profile criterion
+        """
+        return all(check(details) for check in self.detail_checks)
+
+    def matches_repos(self, repos: List[dict]) -> bool:
+        """
+        Evaluate the repository checks for one user.
+
+        Args:
+            repos (List[dict]): The user's repositories
+
+        Returns:
+            bool: True if the user passes every repository criterion
+        """
+        if not self.repo_checks:
+            return True
+        return self.matches_metrics(summarize_repos(repos))
+
+    def matches_metrics(self, metrics: dict) -> bool:
+        """
+        Evaluate the repository checks against precomputed metrics.
+
+        Args:
+            metrics (dict): Repository metrics as returned by summarize_repos
+
+        Returns:
+            bool: True if the user passes every repository criterion
+        """
+        return all(check(metrics) for check in self.repo_checks)
+
+    def apply(self, api_client: GitHubAPIClient, users: Dict[str, dict]) -> Dict[str, dict]:
+        """
+        Filter users, fetching each user's profile and repositories at most once.
+
+        Args:
+            api_client (GitHubAPIClient): Client used to fetch profiles and repositories
+            users (Dict[str, dict]): Users to filter, keyed by username
+
+        Returns:
+            Dict[str, dict]: Users that match, in their original order
+        """
+        if not self.detail_checks and not self.repo_checks:
+            return users.copy()
+
+        details = api_client.get_users_details(users.keys()) if self.detail_checks else {}
+        candidates = [
+            username for username in users
+            if not self.detail_checks or self.matches_details(details[username])
+        ]
+
+        if self.needs_repos and candidates:
+            with ThreadPoolExecutor(max_workers=min(api_client.page_workers, len(candidates))) as executor:
+                if self.repo_criteria == {'max_days_since_push'}:
+                    # Only the latest push matters, one repository per user is enough
+                    pushes = executor.map(api_client.get_last_push_at, candidates)
+                    candidates = [
+                        username for username, pushed_at in zip(candidates, pushes)
+                        if self.matches_metrics({'last_push_at': parse_timestamp(pushed_at)})
+                    ]
+                else:
+                    all_repos = executor.map(api_client.get_user_repos, candidates)
+                    candidates = [
+                        username for username, repos in zip(candidates, all_repos)
+                        if self.matches_repos(repos)
+                    ]
+
+        return {username: users[username] for username in candidates}
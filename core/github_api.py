@@ -1,27 +1,206 @@
 # core/github_api.py
 
 import requests
-from typing import Dict, List
-from time import sleep
-from rich.console import Console
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from core.cache import HTTPCache
+from core.rate_limiter import RateLimiter, is_rate_limited
+from core.store import EntityStore
+from core.models import EventPoll, UserInfo
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# (connect, read) timeouts in seconds, keyed by endpoint class
+DEFAULT_TIMEOUTS = {
+    'default': (3.05, 15),
+    'list': (3.05, 30),
+    'mutation': (3.05, 20),
+    'graphql': (3.05, 60),
+}
+
+# Profile and repository fields requested for every user in GraphQL queries
+GRAPHQL_USER_FIELDS = """
+    login
+    databaseId
+    name
+    createdAt
+    updatedAt
+    followers { totalCount }
+    following { totalCount }
+    repositories(first: %(repos)d, ownerAffiliations: OWNER, orderBy: {field: PUSHED_AT, direction: DESC}) {
+        totalCount
+        nodes { name stargazerCount forkCount pushedAt primaryLanguage { name } }
+    }
+"""
+
+
+class GraphQLError(requests.exceptions.RequestException):
+    """Raised when a GraphQL query returns errors and no data."""
+
+
+def create_session(headers: dict, pool_size: int = 20) -> requests.Session:
+    """
+    Create a pooled keep-alive session for talking to the GitHub API.
+
+    Args:
+        headers (dict): Headers sent with every request
+        pool_size (int): Maximum number of pooled connections per host
+
+    Returns:
+        requests.Session: Session with a sized connection pool mounted
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive'
+    })
+    return session
+
+
+def last_page_number(response: requests.Response) -> int:
+    """
+    Read the last page number from a paginated response's Link header.
+
+    Args:
+        response (requests.Response): First page of a list endpoint
+
+    Returns:
+        int: Number of the last page, 1 when there is only one page
+    """
+    last = response.links.get('last')
+    if not last:
+        return 1
+    return int(parse_qs(urlparse(last['url']).query).get('page', ['1'])[0])
+
 
 class GitHubAPIClient:
     """
     A client class to interact with the GitHub API.
     """
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, base_url: str = 'https://api.github.com',
+                 pool_size: int = 20, timeouts: Optional[Dict[str, tuple]] = None,
+                 rate_limiter: Optional[RateLimiter] = None, max_retries: int = 2,
+                 page_workers: int = 8, cache: Optional[HTTPCache] = None,
+                 store: Optional[EntityStore] = None, console: Optional['Console'] = None):
         """
         Initialize the API client with an access token.
         
         Args:
             access_token (str): GitHub personal access token
+            base_url (str): Root URL of the GitHub REST API
+            pool_size (int): Size of the shared HTTP connection pool
+            timeouts (Dict[str, tuple]): Per-endpoint (connect, read) timeout overrides
+            rate_limiter (RateLimiter): Shared limiter, a new one is created if omitted
+            max_retries (int): Retries for requests rejected by a rate limit
+            page_workers (int): Maximum concurrent page fetches per list
+            cache (HTTPCache): Conditional-request cache for GET endpoints
+            store (EntityStore): Local store of users and repositories consulted before the API
+            console (Console): Console for status spinners, a new one is created if omitted
         """
         self.headers = {
             'Authorization': f'token {access_token}',
             'Accept': 'application/vnd.github.v3+json'
         }
-        self.base_url = 'https://api.github.com'
-        self.console = Console()
+        self.base_url = base_url.rstrip('/')
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.pool_size = pool_size
+        self.session = create_session(self.headers, pool_size)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.page_workers = page_workers
+        self.cache = cache
+        self.store = store
+        self._graphql = None
+        if console is None:
+            from rich.console import Console
+            console = Console()
+        self.console = console
+
+    def request(self, method: str, path: str, endpoint: str = 'default', **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session, waiting on the rate limiter.
+
+        Requests rejected by a rate limit are retried once the limiter allows it.
+
+        Args:
+            method (str): HTTP method
+            path (str): API path relative to the base URL
+            endpoint (str): Endpoint class used to pick the timeout
+            **kwargs: Additional arguments passed to requests
+
+        Returns:
+            requests.Response: The raw response
+        """
+        kwargs.setdefault('timeout', self.timeouts.get(endpoint, self.timeouts['default']))
+        bucket = self.rate_limiter.bucket_for(method, path)
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(bucket)
+            response = self.session.request(method, f'{self.base_url}{path}', **kwargs)
+            self.rate_limiter.update(bucket, response)
+            if not is_rate_limited(response):
+                break
+        return response
+
+    def get(self, path: str, endpoint: str = 'default', params: Optional[dict] = None) -> requests.Response:
+        """
+        Send a GET request, revalidating against the HTTP cache when one is set.
+
+        Fresh entries are served without a request; stale ones are sent with
+        If-None-Match and a 304 reply is answered from the cache.
+
+        Args:
+            path (str): API path relative to the base URL
+            endpoint (str): Endpoint class used to pick the timeout
+            params (dict): Query parameters
+
+        Returns:
+            requests.Response: The live response, or a replay of the cached one
+        """
+        if self.cache is None:
+            return self.request('GET', path, endpoint, params=params)
+
+        url = f'{self.base_url}{path}'
+        key = self.cache.key(url, params)
+        entry = self.cache.lookup(key)
+        if entry and self.cache.is_fresh(entry):
+            self.cache.record('hits')
+            return self.cache.replay(entry, url)
+
+        response = self.request('GET', path, endpoint, params=params,
+                                headers=self.cache.conditional_headers(entry))
+        if response.status_code == 304 and entry:
+            self.cache.record('not_modified')
+            self.cache.refresh(key, response)
+            return self.cache.replay(entry, url)
+
+        self.cache.record('misses')
+        if response.status_code == 200:
+            self.cache.store(key, url, response)
+        return response
+
+    @property
+    def graphql(self) -> 'GitHubGraphQLClient':
+        """GraphQL backend sharing this client's session and rate limiter."""
+        if self._graphql is None:
+            self._graphql = GitHubGraphQLClient(self)
+        return self._graphql
+
+    def close(self):
+        """Release pooled connections."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.store is not None:
+            self.store.close()
 
     def get_user_info(self) -> dict:
         """
@@ -30,13 +209,15 @@ class GitHubAPIClient:
         Returns:
             dict: User information from the GitHub API
         """
-        response = requests.get(f'{self.base_url}/user', headers=self.headers)
+        response = self.get('/user')
         response.raise_for_status()
         return response.json()
 
     def get_user_details(self, username: str) -> dict:
         """
         Get detailed information about a user.
+
+        The entity store is consulted first when one is configured.
         
         Args:
             username (str): GitHub username
@@ -44,12 +225,145 @@ class GitHubAPIClient:
         Returns:
             dict: Detailed user information from the GitHub API
         """
-        response = requests.get(
-            f'{self.base_url}/users/{username}', headers=self.headers)
+        if self.store is not None:
+            details = self.store.get_user(username)
+            if details is not None:
+                return details
+
+        response = self.get(f'/users/{username}')
         response.raise_for_status()
-        return response.json()
+        details = response.json()
+        if self.store is not None:
+            self.store.upsert_users([details])
+        return details
+
+    def get_users_details(self, usernames: Iterable[str]) -> Dict[str, dict]:
+        """
+        Get detailed information about many users.
+
+        Fresh users are read from the entity store in one lookup, the rest are
+        fetched concurrently and written back in one bulk upsert.
+
+        Args:
+            usernames (Iterable[str]): GitHub usernames
+
+        Returns:
+            Dict[str, dict]: Detailed user information keyed by username
+        """
+        usernames = list(usernames)
+        details = self.store.get_users(usernames) if self.store is not None else {}
+        missing = [username for username in usernames if username not in details]
+
+        def fetch(username: str) -> dict:
+            response = self.get(f'/users/{username}')
+            response.raise_for_status()
+            return response.json()
 
-    def get_followers(self, username: str) -> Dict[str, dict]:
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.page_workers, len(missing))) as executor:
+                fetched = dict(zip(missing, executor.map(fetch, missing)))
+            if self.store is not None:
+                self.store.upsert_users(fetched.values())
+            details.update(fetched)
+        return details
+
+    def iter_pages(self, path: str, params: Optional[dict] = None, max_pages: Optional[int] = None,
+                   parse: Optional[Callable[[dict], object]] = None) -> Iterator[list]:
+        """
+        Yield the pages of a list endpoint in order, each as soon as it is ready.
+
+        Page 1 is fetched first; its `Link: rel="last"` header tells how many
+        pages remain, and those are fetched concurrently on a bounded pool.
+        At most page_workers pages are fetched ahead of the consumer, so a
+        slow consumer never has the whole list buffered.
+
+        Args:
+            path (str): API path of the list endpoint
+            params (dict): Extra query parameters
+            max_pages (int): Stop after this many pages
+            parse (Callable): Converts each item as its page arrives, so raw pages are not kept
+
+        Yields:
+            list: Items of one page
+        """
+        params = {**(params or {}), 'per_page': 100}
+
+        def fetch(page: int) -> requests.Response:
+            response = self.get(path, 'list', params={**params, 'page': page})
+            response.raise_for_status()
+            return response
+
+        def items_of(response: requests.Response) -> list:
+            items = response.json()
+            return items if parse is None else [parse(item) for item in items]
+
+        first = fetch(1)
+        last_page = last_page_number(first)
+        if max_pages is not None:
+            last_page = min(last_page, max_pages)
+        yield items_of(first)
+
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(self.page_workers, last_page - 1)) as executor:
+                pending = deque()
+                next_page = 2
+                try:
+                    while pending or next_page <= last_page:
+                        while next_page <= last_page and len(pending) < self.page_workers:
+                            pending.append(executor.submit(fetch, next_page))
+                            next_page += 1
+                        yield items_of(pending.popleft().result())
+                finally:
+                    # The consumer stopped early, do not fetch pages nobody will read
+                    for future in pending:
+                        future.cancel()
+
+    def get_pages(self, path: str, params: Optional[dict] = None, max_pages: Optional[int] = None,
+                  parse: Optional[Callable[[dict], object]] = None) -> list:
+        """
+        Fetch every page of a list endpoint.
+
+        Args:
+            path (str): API path of the list endpoint
+            params (dict): Extra query parameters
+            max_pages (int): Stop after this many pages
+            parse (Callable): Converts each item as its page arrives, so raw pages are not kept
+
+        Returns:
+            list: Items of all pages, in page order
+        """
+        items = []
+        for page in self.iter_pages(path, params, max_pages, parse):
+            items.extend(page)
+        return items
+
+    def iter_followers(self, username: str) -> Iterator[UserInfo]:
+        """
+        Stream a user's followers page by page.
+
+        Args:
+            username (str): GitHub username
+
+        Yields:
+            UserInfo: One follower at a time, newest first
+        """
+        for page in self.iter_pages(f'/users/{username}/followers', parse=UserInfo.from_api):
+            yield from page
+
+    def iter_following(self, username: str) -> Iterator[UserInfo]:
+        """
+        Stream the users a user is following page by page.
+
+        Args:
+            username (str): GitHub username
+
+        Yields:
+            UserInfo: One followed user at a time, newest first
+        """
+        for page in self.iter_pages(f'/users/{username}/following', parse=UserInfo.from_api):
+            yield from page
+
+    def get_followers(self, username: str) -> Dict[str, UserInfo]:
         """
         Get all followers of a user.
         
@@ -57,32 +371,13 @@ class GitHubAPIClient:
             username (str): GitHub username
         
         Returns:
-            Dict[str, dict]: Dictionary of follower usernames and their details
+            Dict[str, UserInfo]: Dictionary of follower usernames and their records
         """
-        followers = {}
-        page = 1
-
         with self.console.status("[bold green]Fetching followers..."):
-            while True:
-                response = requests.get(
-                    f'{self.base_url}/users/{username}/followers',
-                    headers=self.headers,
-                    params={'page': page, 'per_page': 100}
-                )
-                response.raise_for_status()
-
-                current_followers = response.json()
-                if not current_followers:
-                    break
+            users = self.get_pages(f'/users/{username}/followers', parse=UserInfo.from_api)
+        return {user.login: user for user in users}
 
-                for user in current_followers:
-                    followers[user['login']] = user
-                page += 1
-                sleep(1)  # Rate limiting precaution
-
-        return followers
-
-    def get_following(self, username: str) -> Dict[str, dict]:
+    def get_following(self, username: str) -> Dict[str, UserInfo]:
         """
         Get all users a user is following.
 
@@ -90,30 +385,64 @@ class GitHubAPIClient:
             username (str): GitHub username
         
         Returns:
-            Dict[str, dict]: Dictionary of following usernames and their details
+            Dict[str, UserInfo]: Dictionary of following usernames and their records
         """
-        following = {}
-        page = 1
-
         with self.console.status("[bold green]Fetching following..."):
+            users = self.get_pages(f'/users/{username}/following', parse=UserInfo.from_api)
+        return {user.login: user for user in users}
+
+    def sync_connections(self, username: str, relation: str, expected_count: int) -> Dict[str, UserInfo]:
+        """
+        Incrementally sync a user's followers or following against the stored snapshot.
+
+        Lists are returned newest first, so pages are walked only until one
+        overlaps the snapshot. The merged list is trusted only if it matches
+        the expected count and opens with the newest page as fetched; an
+        unfollow offset by a new follow keeps the count, and a refollow moves
+        a known user to the front. Otherwise a full parallel resync runs.
+        Without an entity store this is a plain full fetch.
+
+        Args:
+            username (str): GitHub username
+            relation (str): 'followers' or 'following'
+            expected_count (int): Current count reported by the user's profile
+
+        Returns:
+            Dict[str, UserInfo]: Dictionary of usernames and their records, newest first
+        """
+        if relation not in ('followers', 'following'):
+            raise ValueError(f"Unknown relation: {relation}")
+        path = f'/users/{username}/{relation}'
+
+        snapshot = self.store.get_snapshot(username, relation) if self.store is not None else None
+        if snapshot is not None:
+            snapshot = [UserInfo.from_api(user) for user in snapshot]
+            known = {user.login for user in snapshot}
+            new_users = []
+            newest = None
+            page = 1
             while True:
-                response = requests.get(
-                    f'{self.base_url}/users/{username}/following',
-                    headers=self.headers,
-                    params={'page': page, 'per_page': 100}
-                )
+                response = self.get(path, 'list', params={'page': page, 'per_page': 100})
                 response.raise_for_status()
-
-                current_following = response.json()
-                if not current_following:
+                users = [UserInfo.from_api(user) for user in response.json()]
+                if newest is None:
+                    newest = [user.login for user in users]
+                overlap = next((index for index, user in enumerate(users) if user.login in known), None)
+                new_users.extend(users if overlap is None else users[:overlap])
+                if overlap is not None or page >= last_page_number(response):
                     break
-
-                for user in current_following:
-                    following[user['login']] = user
                 page += 1
-                sleep(1)  # Rate limiting precaution
 
-        return following
+            merged = new_users + snapshot
+            if len(merged) == expected_count and [user.login for user in merged[:len(newest)]] == newest:
+                if new_users:
+                    self.store.prepend_snapshot(username, relation, [user.to_api() for user in new_users])
+                return {user.login: user for user in merged}
+
+        users = self.get_pages(path, parse=UserInfo.from_api)
+        if self.store is not None:
+            self.store.replace_snapshot(username, relation, [user.to_api() for user in users])
+        return {user.login: user for user in users}
 
     def unfollow_user(self, username: str) -> bool:
         """
@@ -125,10 +454,8 @@ class GitHubAPIClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        response = requests.delete(
-            f'{self.base_url}/user/following/{username}',
-            headers=self.headers
-        )
+        response = self.request(
+            'DELETE', f'/user/following/{username}', 'mutation')
         return response.status_code == 204
     
     def follow_user(self, username: str) -> bool:
@@ -141,13 +468,11 @@ class GitHubAPIClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        response = requests.put(
-            f'{self.base_url}/user/following/{username}',
-            headers=self.headers
-        )
+        response = self.request(
+            'PUT', f'/user/following/{username}', 'mutation')
         return response.status_code == 204
 
-    def get_user_followers_limited(self, username: str, max_pages: int = 3) -> Dict[str, dict]:
+    def get_user_followers_limited(self, username: str, max_pages: int = 3) -> Dict[str, UserInfo]:
         """
         Get followers of a specific user up to a max number of pages.
         
@@ -156,34 +481,17 @@ class GitHubAPIClient:
             max_pages (int): Maximum number of pages to fetch (100 users per page)
             
         Returns:
-            Dict[str, dict]: Dictionary of follower usernames and their details
+            Dict[str, UserInfo]: Dictionary of follower usernames and their records
         """
-        followers = {}
-        page = 1
-        
         with self.console.status(f"[bold green]Fetching {username}'s followers..."):
-            while page <= max_pages:
-                response = requests.get(
-                    f'{self.base_url}/users/{username}/followers',
-                    headers=self.headers,
-                    params={'page': page, 'per_page': 100}
-                )
-                response.raise_for_status()
-                
-                current_followers = response.json()
-                if not current_followers:
-                    break
-                    
-                for user in current_followers:
-                    followers[user['login']] = user
-                page += 1
-                sleep(1)
-                
-        return followers
+            users = self.get_pages(f'/users/{username}/followers', max_pages=max_pages, parse=UserInfo.from_api)
+        return {user.login: user for user in users}
     
     def get_user_repos(self, username: str) -> List[dict]:
         """
-        Get the list of repositories of a given user.
+        Get the full list of repositories of a given user.
+
+        The entity store is consulted first when one is configured.
         
         Args:
             username (str): GitHub username
@@ -191,14 +499,68 @@ class GitHubAPIClient:
         Returns:
             List[dict]: List of repository details
         """
-        response = requests.get(
-            f'{self.base_url}/users/{username}/repos',
-            headers=self.headers,
-            params={'sort': 'updated', 'per_page': 100}
-        )
-        response.raise_for_status()
-        return response.json()
+        if self.store is not None:
+            repos = self.store.get_repos(username)
+            if repos is not None:
+                return repos
+
+        repos = list(self.iter_user_repos(username))
+        if self.store is not None:
+            self.store.upsert_repos(username, repos)
+        return repos
     
+    def iter_user_repos(self, username: str, sort: str = 'updated', fields: Optional[Iterable[str]] = None,
+                        per_page: int = 100) -> Iterator[dict]:
+        """
+        Lazily iterate over a user's repositories, one page at a time.
+
+        The next page is only requested once the consumer has used up the
+        current one, so stopping early (e.g. taking the first repository with
+        sort='pushed') costs a single request. A fresh list in the entity
+        store is served without any request.
+
+        Args:
+            username (str): GitHub username
+            sort (str): 'updated', 'pushed', 'created' or 'full_name'
+            fields (Iterable[str]): Keep only these keys of every repository
+            per_page (int): Repositories per request, at most 100
+
+        Yields:
+            dict: Repository details, projected to fields when given
+        """
+        fields = tuple(fields) if fields is not None else None
+        stored = self.store.get_repos(username) if self.store is not None and sort == 'updated' else None
+        if stored is not None:
+            for repo in stored:
+                yield repo if fields is None else {field: repo.get(field) for field in fields}
+            return
+
+        page = 1
+        while True:
+            response = self.get(
+                f'/users/{username}/repos', 'list',
+                params={'sort': sort, 'per_page': per_page, 'page': page}
+            )
+            response.raise_for_status()
+            for repo in response.json():
+                yield repo if fields is None else {field: repo.get(field) for field in fields}
+            if 'next' not in response.links:
+                break
+            page += 1
+
+    def get_last_push_at(self, username: str) -> Optional[str]:
+        """
+        Get when a user last pushed to any of their repositories.
+
+        Args:
+            username (str): GitHub username
+
+        Returns:
+            str: ISO-8601 timestamp of the latest push, or None if the user has no repositories
+        """
+        latest = next(self.iter_user_repos(username, sort='pushed', fields=('pushed_at',), per_page=1), None)
+        return latest['pushed_at'] if latest else None
+
     def get_user_events(self, username: str) -> List[dict]:
         """
         Get recent events for a user.
@@ -209,14 +571,40 @@ class GitHubAPIClient:
         Returns:
             List[dict]: List of recent event details.
         """
-        response = requests.get(
-            f'{self.base_url}/users/{username}/events',
-            headers=self.headers,
+        response = self.get(
+            f'/users/{username}/events', 'list',
             params={'per_page': 100}
         )
         response.raise_for_status()
         return response.json()
     
+    def poll_user_events(self, username: str, etag: Optional[str] = None) -> EventPoll:
+        """
+        Conditionally poll a user's event feed.
+
+        The caller keeps the ETag, so the HTTP cache is bypassed; a 304
+        reply does not count against the primary rate limit.
+
+        Args:
+            username (str): GitHub username
+            etag (str): ETag of the previous poll, if any
+
+        Returns:
+            EventPoll: New events (if modified), the ETag and GitHub's requested poll interval
+        """
+        headers = {'If-None-Match': etag} if etag else {}
+        response = self.request(
+            'GET', f'/users/{username}/events', 'list',
+            params={'per_page': 100}, headers=headers
+        )
+        poll_interval = response.headers.get('X-Poll-Interval')
+        poll_interval = int(poll_interval) if poll_interval else None
+        if response.status_code == 304:
+            return EventPoll(modified=False, etag=etag, poll_interval=poll_interval)
+        response.raise_for_status()
+        return EventPoll(modified=True, events=response.json(),
+                         etag=response.headers.get('ETag'), poll_interval=poll_interval)
+
     def star_repository(self, owner: str, repo: str) -> bool:
         """
         Star a specific repository.
@@ -228,10 +616,8 @@ class GitHubAPIClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        response = requests.put(
-            f'{self.base_url}/user/starred/{owner}/{repo}',
-            headers=self.headers
-        )
+        response = self.request(
+            'PUT', f'/user/starred/{owner}/{repo}', 'mutation')
         return response.status_code == 204
     
     def create_comment(self, owner: str, repo: str, issue_number: int, comment: str) -> bool:
@@ -247,9 +633,8 @@ class GitHubAPIClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        response = requests.post(
-            f'{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments',
-            headers=self.headers,
+        response = self.request(
+            'POST', f'/repos/{owner}/{repo}/issues/{issue_number}/comments', 'mutation',
             json={'body': comment}
         )
         return response.status_code in [200, 201]
@@ -266,9 +651,185 @@ class GitHubAPIClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        response = requests.post(
-           f"{self.base_url}/repos/{owner}/{repo}/commits/{commit_sha}/reactions",
-           headers=self.headers,
+        response = self.request(
+           'POST', f"/repos/{owner}/{repo}/commits/{commit_sha}/reactions", 'mutation',
            json={'content': '+1'}
         )
-        return response.status_code == 201
\ No newline at end of file
+        return response.status_code == 201
+
+
+def graphql_user_to_rest(node: dict) -> Tuple[dict, List[dict]]:
+    """
+    Convert a GraphQL user node into REST-shaped details and repositories.
+
+    Args:
+        node (dict): User node queried with GRAPHQL_USER_FIELDS
+
+    Returns:
+        Tuple[dict, List[dict]]: User details and repository list in the REST API's shape
+    """
+    repositories = node['repositories']
+    details = {
+        'login': node['login'],
+        'id': node['databaseId'],
+        'name': node['name'],
+        'followers': node['followers']['totalCount'],
+        'following': node['following']['totalCount'],
+        'public_repos': repositories['totalCount'],
+        'created_at': node['createdAt'],
+        'updated_at': node['updatedAt'],
+    }
+    repos = [
+        {
+            'name': repo['name'],
+            'stargazers_count': repo['stargazerCount'],
+            'forks_count': repo['forkCount'],
+            'pushed_at': repo['pushedAt'],
+            'language': (repo['primaryLanguage'] or {}).get('name'),
+        }
+        for repo in repositories['nodes']
+    ]
+    return details, repos
+
+
+class GitHubGraphQLClient:
+    """
+    Bulk GraphQL backend for enriching many users per request.
+
+    Shares the REST client's pooled session, rate limiter and entity store,
+    and returns data in the REST API's shape so callers can switch backends
+    per operation.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, batch_size: int = 100, repos_per_user: int = 100):
+        """
+        Initialize the GraphQL backend.
+
+        Args:
+            api_client (GitHubAPIClient): REST client whose transport is reused
+            batch_size (int): Users looked up per query
+            repos_per_user (int): Most recently pushed repositories fetched per user; users
+                with more get their full list from REST
+        """
+        self.api_client = api_client
+        self.batch_size = batch_size
+        self.repos_per_user = repos_per_user
+
+    def query(self, query: str, variables: Optional[dict] = None) -> dict:
+        """
+        Run a GraphQL query.
+
+        Args:
+            query (str): GraphQL query document
+            variables (dict): Query variables
+
+        Returns:
+            dict: The response's data object
+
+        Raises:
+            GraphQLError: If the response carries errors and no data
+        """
+        response = self.api_client.request(
+            'POST', '/graphql', 'graphql', json={'query': query, 'variables': variables or {}})
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get('errors') and not payload.get('data'):
+            raise GraphQLError(payload['errors'][0].get('message', 'GraphQL query failed'))
+        return payload['data']
+
+    def get_users(self, usernames: Iterable[str]) -> Dict[str, Tuple[dict, List[dict]]]:
+        """
+        Get details and repositories of many users, batch_size users per query.
+
+        Users that do not exist are left out of the result.
+
+        Args:
+            usernames (Iterable[str]): GitHub usernames
+
+        Returns:
+            Dict[str, Tuple[dict, List[dict]]]: REST-shaped details and repositories keyed by username
+        """
+        usernames = list(usernames)
+        fields = GRAPHQL_USER_FIELDS % {'repos': self.repos_per_user}
+        results = {}
+
+        for start in range(0, len(usernames), self.batch_size):
+            batch = usernames[start:start + self.batch_size]
+            declarations = ', '.join(f'$l{index}: String!' for index in range(len(batch)))
+            selections = '\n'.join(
+                f'u{index}: user(login: $l{index}) {{ ...UserFields }}' for index in range(len(batch)))
+            query = (f'query({declarations}) {{\n{selections}\n}}\n'
+                     f'fragment UserFields on User {{{fields}}}')
+            data = self.query(query, {f'l{index}': username for index, username in enumerate(batch)})
+
+            for index, username in enumerate(batch):
+                node = data.get(f'u{index}')
+                if node:
+                    results[username] = self.to_rest(node)
+
+        if self.api_client.store is not None:
+            self.api_client.store.upsert_users(details for details, _ in results.values())
+        return results
+
+    def to_rest(self, node: dict) -> Tuple[dict, List[dict]]:
+        """
+        Convert a user node, completing the repositories GraphQL left out.
+
+        Only the repos_per_user most recently pushed repositories come back
+        with a node, so star and fork totals of users with more would be
+        short; their full list is read from REST instead.
+
+        Args:
+            node (dict): User node queried with GRAPHQL_USER_FIELDS
+
+        Returns:
+            Tuple[dict, List[dict]]: REST-shaped details and the complete repository list
+        """
+        details, repos = graphql_user_to_rest(node)
+        if len(repos) < node['repositories']['totalCount'] and len(repos) >= self.repos_per_user:
+            repos = self.api_client.get_user_repos(details['login'])
+        return details, repos
+
+    def iter_connections(self, username: str, relation: str = 'followers',
+                         page_size: int = 50) -> Iterator[Dict[str, Tuple[dict, List[dict]]]]:
+        """
+        Stream a user's followers or following together with each user's details and repositories.
+
+        Every page is one query, so the list and its enrichment cost what
+        listing alone costs over REST.
+
+        Args:
+            username (str): GitHub username
+            relation (str): 'followers' or 'following'
+            page_size (int): Users per page, at most 100
+
+        Yields:
+            Dict[str, Tuple[dict, List[dict]]]: One page of REST-shaped details and repositories keyed by username
+        """
+        if relation not in ('followers', 'following'):
+            raise ValueError(f"Unknown relation: {relation}")
+
+        fields = GRAPHQL_USER_FIELDS % {'repos': self.repos_per_user}
+        query = (
+            'query($login: String!, $first: Int!, $after: String) {\n'
+            f'  user(login: $login) {{ {relation}(first: $first, after: $after) {{\n'
+            '    pageInfo { hasNextPage endCursor }\n'
+            '    nodes { ...UserFields }\n'
+            '  } }\n'
+            '}\n'
+            f'fragment UserFields on User {{{fields}}}'
+        )
+        cursor = None
+
+        while True:
+            data = self.query(query, {'login': username, 'first': page_size, 'after': cursor})
+            connection = (data.get('user') or {}).get(relation)
+            if not connection:
+                return
+            page = {node['login']: self.to_rest(node) for node in connection['nodes']}
+            if self.api_client.store is not None:
+                self.api_client.store.upsert_users(details for details, _ in page.values())
+            yield page
+            if not connection['pageInfo']['hasNextPage']:
+                return
+            cursor = connection['pageInfo']['endCursor']
@@ -0,0 +1,159 @@
+# core/ledger.py
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+from time import time
+from typing import Iterable, Tuple
+
+# Bloom filter sizing used until the ledger outgrows it
+DEFAULT_CAPACITY = 10000
+DEFAULT_ERROR_RATE = 0.01
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Lookups never miss an added item; a small fraction of items that were
+    never added are reported as possibly present.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE):
+        """
+        Size the filter.
+
+        Args:
+            capacity (int): Number of items the filter is sized for
+            error_rate (float): False-positive rate at full capacity
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: two 64-bit halves of one digest give every probe
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str):
+        """
+        Add an item.
+
+        Args:
+            item (str): Item to add
+        """
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class EngagementLedger:
+    """
+    On-disk record of engagement mutations already performed.
+
+    Entries are keyed by action type and target ('star' + 'owner/repo',
+    'like' + 'owner/repo@sha', 'comment' + 'owner/repo#12'). An in-memory
+    Bloom filter answers most lookups for actions never performed without
+    touching the database; only possible hits are confirmed in SQLite.
+    """
+
+    def __init__(self, path: str, error_rate: float = DEFAULT_ERROR_RATE):
+        """
+        Open (or create) the ledger and load its keys into the Bloom filter.
+
+        Args:
+            path (str): SQLite file to keep the ledger in
+            error_rate (float): False-positive rate of the Bloom filter
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS ledger ('
+            ' kind TEXT NOT NULL, target TEXT NOT NULL COLLATE NOCASE, performed_at REAL NOT NULL,'
+            ' PRIMARY KEY (kind, target))'
+        )
+        self._conn.commit()
+        with self._lock:
+            self._rebuild()
+
+    @staticmethod
+    def _key(kind: str, target: str) -> str:
+        return f'{kind}:{target.lower()}'
+
+    def _rebuild(self):
+        # Size for twice the current entries so the filter does not fill up right away
+        count = self._conn.execute('SELECT COUNT(*) FROM ledger').fetchone()[0]
+        self._bloom = BloomFilter(max(DEFAULT_CAPACITY, count * 2), self.error_rate)
+        for kind, target in self._conn.execute('SELECT kind, target FROM ledger'):
+            self._bloom.add(self._key(kind, target))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM ledger').fetchone()[0]
+
+    def contains(self, kind: str, target: str) -> bool:
+        """
+        Check whether an action was already performed.
+
+        Args:
+            kind (str): Action type
+            target (str): Action target
+
+        Returns:
+            bool: True if the ledger has the action
+        """
+        with self._lock:
+            if self._key(kind, target) not in self._bloom:
+                return False
+            return self._conn.execute(
+                'SELECT 1 FROM ledger WHERE kind = ? AND target = ?', (kind, target)
+            ).fetchone() is not None
+
+    def record(self, kind: str, target: str):
+        """
+        Record a performed action.
+
+        Args:
+            kind (str): Action type
+            target (str): Action target
+        """
+        self.record_many([(kind, target)])
+
+    def record_many(self, actions: Iterable[Tuple[str, str]]):
+        """
+        Record many performed actions in one transaction.
+
+        Args:
+            actions (Iterable[Tuple[str, str]]): (action type, target) pairs
+        """
+        actions = list(actions)
+        now = time()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO ledger (kind, target, performed_at) VALUES (?, ?, ?)',
+                ((kind, target, now) for kind, target in actions)
+            )
+            self._conn.commit()
+            for kind, target in actions:
+                self._bloom.add(self._key(kind, target))
+            if self._bloom.count > self._bloom.capacity:
+                self._rebuild()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,16 +1,28 @@
 # core/models.py
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class UserInfo:
-    """Represents basic user information."""
+    """Represents basic user information, as listed in followers and following."""
     login: str
+    id: int = 0
     name: str = None
     profile_url: str = None
-    
-@dataclass
+
+    @classmethod
+    def from_api(cls, data: dict) -> 'UserInfo':
+        """Keep only the fields used from an API user object, dropping its URL templates."""
+        return cls(data['login'], data.get('id') or 0, data.get('name'), data.get('html_url'))
+
+    def to_api(self) -> dict:
+        """The record in the API's shape, so it can be stored and read back with from_api."""
+        return {'login': self.login, 'id': self.id, 'name': self.name, 'html_url': self.profile_url}
+
+
+@dataclass(slots=True)
 class UserDetails:
     """Represents detailed user information."""
     username: str
@@ -18,10 +30,99 @@ class UserDetails:
     followers: int
     following: int
     public_repos: int
-    total_stars: int
-    
+    total_stars: int = 0
+    created_at: str = None
+    updated_at: str = None
+
+    @classmethod
+    def from_api(cls, data: dict, total_stars: int = 0) -> 'UserDetails':
+        """Keep only the fields used from an API user profile."""
+        return cls(data['login'], data.get('name'), data.get('followers') or 0, data.get('following') or 0,
+                   data.get('public_repos') or 0, total_stars, data.get('created_at'), data.get('updated_at'))
+
+
 @dataclass
 class UserRecommendation:
     """Represents user recommendation data."""
     username: str
-    mutual_connections: List[str]
\ No newline at end of file
+    mutual_connections: List[str]
+
+
+@dataclass(slots=True)
+class UserProfile:
+    """Represents a user's profile enriched with repository metrics."""
+    username: str
+    details: UserDetails
+    total_stars: int = 0
+    total_forks: int = 0
+    last_push_at: Optional[datetime] = None
+    languages: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def top_language(self) -> Optional[str]:
+        """The language used by most of the user's repositories."""
+        return max(self.languages, key=self.languages.get) if self.languages else None
+
+
+@dataclass
+class MutationReport:
+    """Represents the outcome of a bulk follow/unfollow run."""
+    operation: str
+    succeeded: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Successful mutations per second."""
+        return len(self.succeeded) / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class DashboardSummary:
+    """Represents the dashboard aggregates over the followers processed so far."""
+    total: int
+    processed: int = 0
+    scored_users: Dict[str, dict] = field(default_factory=dict)
+    language_counts: Dict[str, int] = field(default_factory=dict)
+    total_stars: int = 0
+    total_forks: int = 0
+    activity: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every follower has been processed."""
+        return self.processed >= self.total
+
+
+@dataclass
+class EngagementContext:
+    """Represents the authenticated user's relationships for one engagement run."""
+    login: str
+    following: Set[str] = field(default_factory=set)
+    followers: Set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class EngagementAction:
+    """Represents one mutation planned in response to a user's activity."""
+    username: str
+    kind: str
+    target: str
+    args: Tuple = ()
+    description: str = ''
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Identifies the mutation regardless of which user's activity triggered it."""
+        return self.kind, self.target
+
+
+@dataclass
+class EventPoll:
+    """Represents one conditional poll of a user's event feed."""
+    modified: bool
+    events: List[dict] = field(default_factory=list)
+    etag: Optional[str] = None
+    poll_interval: Optional[int] = None
@@ -0,0 +1,213 @@
+# core/mutations.py
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep, time
+from typing import Callable, Iterable, List, Optional, Set
+
+import requests
+
+from core.github_api import GitHubAPIClient
+from core.models import MutationReport
+from core.rate_limiter import is_rate_limited
+
+# HTTP method, path template and success status codes per operation
+MUTATIONS = {
+    'follow': ('PUT', '/user/following/{target}', (204,)),
+    'unfollow': ('DELETE', '/user/following/{target}', (204,)),
+    'star': ('PUT', '/user/starred/{target}', (204,)),
+}
+# Seconds a failed run can be resumed for; older journal entries are ignored
+JOURNAL_MAX_AGE = 3600
+
+
+def run_key(operation: str, targets: Iterable[str]) -> str:
+    """
+    Identify a run by its operation and target set, whatever the targets' order.
+
+    Args:
+        operation (str): Operation name
+        targets (Iterable[str]): Targets of the run
+
+    Returns:
+        str: Hex digest naming the run
+    """
+    digest = hashlib.sha256(operation.encode())
+    for target in sorted(set(targets)):
+        digest.update(b'\n' + target.encode())
+    return digest.hexdigest()
+
+
+class MutationJournal:
+    """
+    Append-only record of the mutations completed by one run, used to resume it.
+
+    Entries carry the run's key, so only a rerun of exactly the same
+    operation and targets within max_age resumes from them; starting any
+    other run replaces the journal.
+    """
+
+    def __init__(self, path: str, max_age: float = JOURNAL_MAX_AGE):
+        """
+        Open the journal, creating its directory if needed.
+
+        Args:
+            path (str): JSON-lines file to append entries to
+            max_age (float): Seconds an entry can be resumed from
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def resume(self, run: str) -> Set[str]:
+        """
+        Targets an interrupted or failed earlier attempt at this run already mutated.
+
+        The journal is discarded when it holds nothing to resume, so it only
+        ever records the run that starts next.
+
+        Args:
+            run (str): Key of the run, see run_key
+
+        Returns:
+            Set[str]: Completed targets
+        """
+        done = set()
+        if not os.path.exists(self.path):
+            return done
+        cutoff = time() - self.max_age
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+                if entry.get('run') == run and entry.get('status') == 'done' and entry.get('time', 0) >= cutoff:
+                    done.add(entry['target'])
+        if not done:
+            self.discard()
+        return done
+
+    def record(self, run: str, operation: str, target: str, status: str, detail: str = ''):
+        """
+        Append one entry and flush it to disk.
+
+        Args:
+            run (str): Key of the run, see run_key
+            operation (str): Operation name
+            target (str): Mutated target
+            status (str): 'done' or 'failed'
+            detail (str): Failure reason
+        """
+        line = json.dumps({'run': run, 'operation': operation, 'target': target, 'status': status,
+                           'detail': detail, 'time': time()})
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def discard(self):
+        """Delete the journal once a run has finished cleanly or is not resumed."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BulkMutationExecutor:
+    """
+    Runs follow/unfollow/star mutations with bounded concurrency.
+
+    Every completed mutation is journaled, so rerunning the same targets
+    after a crash or failure skips what was already done. Rate-limited
+    requests are retried by GitHubAPIClient.request once the limiter
+    (which honors Retry-After) allows; server and connection errors are
+    retried here with backoff.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, journal_path: str,
+                 max_workers: int = 4, max_attempts: int = 5):
+        """
+        Initialize the executor.
+
+        Args:
+            api_client (GitHubAPIClient): Client used to send the mutations
+            journal_path (str): File to journal completed mutations to
+            max_workers (int): Mutations in flight at once
+            max_attempts (int): Attempts per target before it is reported as failed
+        """
+        self.api_client = api_client
+        self.journal = MutationJournal(journal_path)
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+
+    def _mutate(self, operation: str, target: str) -> Optional[str]:
+        """Run one mutation, returning None on success or the failure reason."""
+        method, path, success = MUTATIONS[operation]
+        reason = 'not attempted'
+        for attempt in range(self.max_attempts):
+            try:
+                response = self.api_client.request(method, path.format(target=target), 'mutation')
+            except requests.exceptions.RequestException as e:
+                reason = str(e)
+            else:
+                if response.status_code in success:
+                    return None
+                reason = f'HTTP {response.status_code}'
+                # request() has already retried rate-limited responses
+                if is_rate_limited(response) or response.status_code < 500:
+                    return reason
+            sleep(min(2 ** attempt, 30))
+        return reason
+
+    def run(self, operation: str, targets: Iterable[str],
+            on_progress: Optional[Callable[[str, bool], None]] = None) -> MutationReport:
+        """
+        Apply an operation to every target, resuming from the journal.
+
+        Args:
+            operation (str): 'follow', 'unfollow' or 'star' (targets as 'owner/repo')
+            targets (Iterable[str]): Usernames or repositories to mutate
+            on_progress (Callable[[str, bool], None]): Called after each target with its outcome
+
+        Returns:
+            MutationReport: Succeeded, failed and skipped targets plus timing
+        """
+        if operation not in MUTATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+
+        report = MutationReport(operation)
+        targets = list(dict.fromkeys(targets))
+        run = run_key(operation, targets)
+        done = self.journal.resume(run)
+        pending: List[str] = []
+        for target in targets:
+            (report.skipped if target in done else pending).append(target)
+
+        def apply(target: str):
+            reason = self._mutate(operation, target)
+            if reason is None:
+                self.journal.record(run, operation, target, 'done')
+            else:
+                self.journal.record(run, operation, target, 'failed', reason)
+            return target, reason
+
+        started = monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for target, reason in executor.map(apply, pending):
+                if reason is None:
+                    report.succeeded.append(target)
+                else:
+                    report.failed[target] = reason
+                if on_progress:
+                    on_progress(target, reason is None)
+        report.elapsed = monotonic() - started
+
+        # A failed run stays journaled so that exactly this run can be resumed
+        if not report.failed:
+            self.journal.discard()
+        return report
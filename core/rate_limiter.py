@@ -0,0 +1,253 @@
+# core/rate_limiter.py
+
+import threading
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep, time
+from typing import Dict, Optional
+
+import requests
+
+# Content-creating requests are capped by GitHub's secondary limits at roughly
+# 80 per minute, so mutations are paced by a local bucket on top of the headers.
+MUTATION_CAPACITY = 80
+MUTATION_WINDOW = 60.0
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Read a Retry-After header, given either as seconds or as an HTTP-date.
+
+    Args:
+        value (str): Header value
+
+    Returns:
+        float: Seconds to wait, or None if the value cannot be parsed
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # HTTP-dates are always GMT
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - time())
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """
+    Check whether a response was rejected by a primary or secondary rate limit.
+
+    Args:
+        response (requests.Response): Response to inspect
+
+    Returns:
+        bool: True if the request should be retried after waiting
+    """
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and (
+        'Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0')
+
+
+class RateBucket:
+    """
+    Tracks the budget for one GitHub rate-limit resource.
+    """
+
+    def __init__(self, name: str, capacity: Optional[int] = None, window: Optional[float] = None,
+                 low_watermark: float = 0.1):
+        """
+        Initialize the bucket.
+
+        Args:
+            name (str): Resource name ('core', 'search', 'mutation', ...)
+            capacity (int): Local token capacity, or None to rely on headers only
+            window (float): Seconds needed to refill a full local bucket
+            low_watermark (float): Fraction of the limit below which calls are spread out
+        """
+        self.name = name
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None
+        self.blocked_until = 0.0
+        self.low_watermark = low_watermark
+        self.capacity = capacity
+        self.refill_rate = capacity / window if capacity and window else None
+        self.tokens = float(capacity) if capacity else None
+        self._refilled_at = monotonic()
+
+    def _refill(self, now: float):
+        if self.tokens is None:
+            return
+        self.tokens = min(self.capacity, self.tokens +
+                          (now - self._refilled_at) * self.refill_rate)
+        self._refilled_at = now
+
+    def delay(self) -> float:
+        """
+        Seconds to wait before the next request may be sent.
+
+        Returns:
+            float: 0 when a request can go out immediately
+        """
+        now = time()
+        wait = max(0.0, self.blocked_until - now)
+
+        self._refill(monotonic())
+        if self.tokens is not None and self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.refill_rate)
+
+        if self.remaining is not None and self.reset_at is not None and self.reset_at > now:
+            until_reset = self.reset_at - now
+            if self.remaining <= 0:
+                wait = max(wait, until_reset)
+            elif self.limit and self.remaining < self.limit * self.low_watermark:
+                # Budget is nearly spent, spread what is left over the window
+                wait = max(wait, until_reset / self.remaining)
+
+        return wait
+
+    def consume(self):
+        """Take one token for a request that is about to be sent."""
+        if self.tokens is not None:
+            self.tokens -= 1
+        if self.remaining is not None:
+            self.remaining -= 1
+
+    def update(self, response: requests.Response):
+        """
+        Refresh the budget from a response's rate-limit headers.
+
+        Args:
+            response (requests.Response): Response to read headers from
+        """
+        headers = response.headers
+        if 'X-RateLimit-Remaining' in headers:
+            self.remaining = int(headers['X-RateLimit-Remaining'])
+        if 'X-RateLimit-Limit' in headers:
+            self.limit = int(headers['X-RateLimit-Limit'])
+        if 'X-RateLimit-Reset' in headers:
+            self.reset_at = float(headers['X-RateLimit-Reset'])
+
+    def block(self, response: requests.Response):
+        """
+        Pause the bucket after a 403/429 rate-limit response.
+
+        Args:
+            response (requests.Response): The rejected response
+        """
+        retry_after = parse_retry_after(response.headers.get('Retry-After', ''))
+        if retry_after is not None:
+            self.blocked_until = max(self.blocked_until, time() + retry_after)
+        elif self.remaining == 0 and self.reset_at:
+            self.blocked_until = max(self.blocked_until, self.reset_at)
+        else:
+            # Secondary limit without a hint, GitHub recommends waiting a minute
+            self.blocked_until = max(self.blocked_until, time() + 60)
+        if self.tokens is not None:
+            self.tokens = 0.0
+
+
+class RateLimiter:
+    """
+    Adaptive rate limiter driven by GitHub's rate-limit response headers.
+
+    Requests only wait when a tracked budget actually requires it: the
+    primary limit is nearly exhausted, a Retry-After was received, or
+    mutations exceed the secondary content-creation limit.
+    """
+
+    def __init__(self, mutation_capacity: int = MUTATION_CAPACITY, mutation_window: float = MUTATION_WINDOW):
+        """
+        Initialize the limiter with core, search, graphql and mutation buckets.
+
+        Args:
+            mutation_capacity (int): Mutations allowed per window
+            mutation_window (float): Length of the mutation window in seconds
+        """
+        self.buckets: Dict[str, RateBucket] = {
+            'core': RateBucket('core'),
+            'search': RateBucket('search'),
+            'graphql': RateBucket('graphql'),
+            'mutation': RateBucket('mutation', mutation_capacity, mutation_window),
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def bucket_for(method: str, path: str) -> str:
+        """
+        Pick the bucket a request counts against.
+
+        Args:
+            method (str): HTTP method
+            path (str): API path
+
+        Returns:
+            str: Bucket name
+        """
+        if path.startswith('/search'):
+            return 'search'
+        if path == '/graphql':
+            return 'graphql'
+        if method.upper() not in ('GET', 'HEAD'):
+            return 'mutation'
+        return 'core'
+
+    def acquire(self, bucket: str):
+        """
+        Block until a request against the bucket may be sent, then consume a token.
+
+        Args:
+            bucket (str): Bucket name
+        """
+        buckets = [self.buckets[bucket]]
+        if bucket == 'mutation':
+            # Mutations also draw from the primary budget
+            buckets.append(self.buckets['core'])
+
+        while True:
+            with self._lock:
+                wait = max(b.delay() for b in buckets)
+                if wait <= 0:
+                    for b in buckets:
+                        b.consume()
+                    return
+            sleep(wait)
+
+    def update(self, bucket: str, response: requests.Response):
+        """
+        Record the rate-limit state reported by a response.
+
+        Args:
+            bucket (str): Bucket the request was charged to
+            response (requests.Response): The response received
+        """
+        resource = response.headers.get('X-RateLimit-Resource')
+        if resource not in self.buckets:
+            # Mutations report the primary budget they were charged to
+            resource = 'core' if bucket == 'mutation' else bucket
+
+        with self._lock:
+            self.buckets[resource].update(response)
+            if is_rate_limited(response):
+                self.buckets[bucket].block(response)
+                if resource != bucket:
+                    self.buckets[resource].block(response)
+
+    def status(self) -> Dict[str, dict]:
+        """
+        Snapshot of every bucket's known budget.
+
+        Returns:
+            Dict[str, dict]: Remaining, limit and reset time per bucket
+        """
+        with self._lock:
+            return {
+                name: {'remaining': b.remaining, 'limit': b.limit, 'reset_at': b.reset_at}
+                for name, b in self.buckets.items()
+            }
@@ -0,0 +1,172 @@
+# core/relationships.py
+
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.github_api import GitHubAPIClient
+from core.models import UserInfo
+
+MUTUAL = 'mutual'
+NOT_FOLLOWING_BACK = 'not-following-back'
+NOT_FOLLOWED_BACK = 'not-followed-back'
+RELATIONS = (MUTUAL, NOT_FOLLOWING_BACK, NOT_FOLLOWED_BACK)
+
+
+def contains_sorted(haystack, needles):
+    """
+    Test which needles occur in a sorted array, as one vectorized binary search.
+
+    Args:
+        haystack (numpy.ndarray): Sorted, unique ids
+        needles (numpy.ndarray): Ids to look up
+
+    Returns:
+        numpy.ndarray: Boolean mask over needles
+    """
+    import numpy as np
+
+    if not len(haystack):
+        return np.zeros(len(needles), dtype=bool)
+    index = np.minimum(np.searchsorted(haystack, needles), len(haystack) - 1)
+    return haystack[index] == needles
+
+
+def _id_index(users: List[UserInfo]):
+    # Sorted ids plus, for each, the position of its user in arrival order
+    import numpy as np
+
+    ids = np.fromiter(map(attrgetter('id'), users), dtype=np.int64, count=len(users))
+    order = np.argsort(ids)
+    return ids[order], order
+
+
+def _resolve(users: List[UserInfo], positions) -> Dict[str, UserInfo]:
+    import numpy as np
+
+    # Positions are sorted so results keep the API's newest-first order
+    resolved = [users[position] for position in np.sort(positions).tolist()]
+    return {user.login: user for user in resolved}
+
+
+def split_relationships(followers: Dict[str, UserInfo], following: Dict[str, UserInfo]) \
+        -> Tuple[Dict[str, UserInfo], Dict[str, UserInfo], Dict[str, UserInfo]]:
+    """
+    Split followers and following into mutual, not-following-back and not-followed-back.
+
+    The comparison runs on the users' numeric ids held in sorted NumPy
+    arrays, and users are only looked up for the final results. If a
+    record has no id (0) or an id repeats, it falls back to login sets.
+
+    Args:
+        followers (Dict[str, UserInfo]): The account's followers
+        following (Dict[str, UserInfo]): Users the account follows
+
+    Returns:
+        Tuple containing:
+        - Dict of mutual followers
+        - Dict of non-following users
+        - Dict of non-followers being followed
+    """
+    follower_users = list(followers.values())
+    following_users = list(following.values())
+    if all(user.id for user in follower_users) and all(user.id for user in following_users):
+        import numpy as np
+
+        follower_ids, follower_order = _id_index(follower_users)
+        following_ids, following_order = _id_index(following_users)
+        # A user renamed between syncs can appear twice under one id
+        if not (np.any(follower_ids[1:] == follower_ids[:-1]) or np.any(following_ids[1:] == following_ids[:-1])):
+            follows_you = contains_sorted(follower_ids, following_ids)
+            followed = contains_sorted(following_ids, follower_ids)
+            return (
+                _resolve(following_users, following_order[follows_you]),
+                _resolve(following_users, following_order[~follows_you]),
+                _resolve(follower_users, follower_order[~followed]),
+            )
+
+    follower_logins = followers.keys()
+    following_logins = following.keys()
+    return (
+        {login: following[login] for login in follower_logins & following_logins},
+        {login: following[login] for login in following_logins - follower_logins},
+        {login: followers[login] for login in follower_logins - following_logins},
+    )
+
+
+def classify_relationships(followers: Iterable[UserInfo], following: Iterable[UserInfo],
+                           hold: str = 'following') -> Iterator[Tuple[str, UserInfo]]:
+    """
+    Classify users into relationships while one of the two lists streams in.
+
+    The held list is loaded into a login-keyed dict first. Each user of the
+    other list is then classified and yielded as soon as it is read. Users
+    already yielded are marked rather than copied, and the unmatched held
+    ones are yielded once the streamed list is exhausted.
+
+    Args:
+        followers (Iterable[UserInfo]): The account's followers
+        following (Iterable[UserInfo]): Users the account follows
+        hold (str): 'following' or 'followers', the list to keep in memory (pick the smaller)
+
+    Yields:
+        Tuple[str, UserInfo]: Relationship and user
+    """
+    if hold == 'following':
+        held, streamed, unmatched, leftover = following, followers, NOT_FOLLOWED_BACK, NOT_FOLLOWING_BACK
+    elif hold == 'followers':
+        held, streamed, unmatched, leftover = followers, following, NOT_FOLLOWING_BACK, NOT_FOLLOWED_BACK
+    else:
+        raise ValueError(f"Unknown relation: {hold}")
+
+    # A None value marks a user that was already yielded, so a streamed user
+    # listed twice by pagination drift is only classified once
+    pending: Dict[str, Optional[UserInfo]] = {user.login: user for user in held}
+    for user in streamed:
+        if user.login not in pending:
+            pending[user.login] = None
+            yield unmatched, user
+        elif pending[user.login] is not None:
+            pending[user.login] = None
+            yield MUTUAL, user
+
+    for user in pending.values():
+        if user is not None:
+            yield leftover, user
+
+
+class StreamingRelationshipAnalyzer:
+    """
+    Analyzes the authenticated user's relationships with bounded memory.
+
+    Only the smaller of the followers and following lists is held, as
+    compact UserInfo records. The larger one is streamed from the API a page
+    at a time, and every user is classified as soon as its page arrives, so
+    results can be consumed long before the lists are fully fetched.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient):
+        """
+        Initialize the analyzer.
+
+        Args:
+            api_client (GitHubAPIClient): Client used to stream the lists
+        """
+        self.api_client = api_client
+        self.counts = dict.fromkeys(RELATIONS, 0)
+
+    def run(self) -> Iterator[Tuple[str, UserInfo]]:
+        """
+        Stream the relationship of every follower and followed user.
+
+        Yields:
+            Tuple[str, UserInfo]: Relationship and user, counted in self.counts
+        """
+        user_info = self.api_client.get_user_info()
+        login = user_info['login']
+        hold = 'following' if user_info.get('following', 0) <= user_info.get('followers', 0) else 'followers'
+
+        self.counts = dict.fromkeys(RELATIONS, 0)
+        for relation, user in classify_relationships(self.api_client.iter_followers(login),
+                                                     self.api_client.iter_following(login), hold):
+            self.counts[relation] += 1
+            yield relation, user
@@ -0,0 +1,228 @@
+# core/scoring.py
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+
+import numpy as np
+
+from core.models import UserProfile
+
+if TYPE_CHECKING:
+    from core.aggregator import MetricColumns
+
+SECONDS_PER_DAY = 86400.0
+
+# Weight per metric column. The defaults reproduce the original score:
+# stars + forks minus the days since the user's last push.
+DEFAULT_WEIGHTS = {
+    'stars': 1.0,
+    'forks': 1.0,
+    'days_since_push': -1.0,
+    'followers': 0.0,
+    'repos': 0.0,
+}
+
+
+class UserMetrics:
+    """
+    Columnar per-user metrics, one NumPy array per metric.
+    """
+
+    def __init__(self, logins: Sequence[str], stars: np.ndarray, forks: np.ndarray,
+                 last_push: np.ndarray, followers: np.ndarray, repos: np.ndarray):
+        """
+        Initialize the columns.
+
+        Args:
+            logins (Sequence[str]): Usernames, row order of every column
+            stars (np.ndarray): Total stars per user
+            forks (np.ndarray): Total forks per user
+            last_push (np.ndarray): Last push as a Unix timestamp, NaN if the user never pushed
+            followers (np.ndarray): Follower count per user
+            repos (np.ndarray): Public repository count per user
+        """
+        self.logins = list(logins)
+        self.stars = stars
+        self.forks = forks
+        self.last_push = last_push
+        self.followers = followers
+        self.repos = repos
+
+    def __len__(self) -> int:
+        return len(self.logins)
+
+    @classmethod
+    def from_profiles(cls, profiles: Dict[str, UserProfile]) -> 'UserMetrics':
+        """
+        Load enriched profiles into columns.
+
+        Args:
+            profiles (Dict[str, UserProfile]): Profiles keyed by username
+
+        Returns:
+            UserMetrics: The columnar metrics
+        """
+        count = len(profiles)
+        values = profiles.values()
+        return cls(
+            logins=profiles.keys(),
+            stars=np.fromiter((p.total_stars for p in values), dtype=np.int64, count=count),
+            forks=np.fromiter((p.total_forks for p in values), dtype=np.int64, count=count),
+            last_push=np.fromiter(
+                (p.last_push_at.timestamp() if p.last_push_at else np.nan for p in values),
+                dtype=np.float64, count=count),
+            followers=np.fromiter((p.details.followers for p in values), dtype=np.int64, count=count),
+            repos=np.fromiter((p.details.public_repos for p in values), dtype=np.int64, count=count),
+        )
+
+    @classmethod
+    def from_columns(cls, columns: 'MetricColumns') -> 'UserMetrics':
+        """
+        Load metric rows collected while profiles were built.
+
+        Args:
+            columns (MetricColumns): Rows filled by UserProfileAggregator or DashboardPipeline
+
+        Returns:
+            UserMetrics: The columnar metrics
+        """
+        return cls(
+            logins=columns.logins,
+            stars=np.array(columns.stars, dtype=np.int64),
+            forks=np.array(columns.forks, dtype=np.int64),
+            last_push=np.array(columns.last_push, dtype=np.float64),
+            followers=np.array(columns.followers, dtype=np.int64),
+            repos=np.array(columns.repos, dtype=np.int64),
+        )
+
+
+class ScoringEngine:
+    """
+    Vectorized weighted scoring over columnar user metrics.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, now: Optional[datetime] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            weights (Dict[str, float]): Overrides for DEFAULT_WEIGHTS
+            now (datetime): Reference time for recency, defaults to the current time
+
+        Raises:
+            ValueError: If a weight names an unknown metric
+        """
+        unknown = set(weights or {}) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown score weights: {', '.join(sorted(unknown))}")
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.now = now
+
+    def days_since_push(self, metrics: UserMetrics) -> np.ndarray:
+        """
+        Whole days since each user's last push, 0 for users who never pushed.
+
+        Args:
+            metrics (UserMetrics): The columnar metrics
+
+        Returns:
+            np.ndarray: Days per user
+        """
+        now = (self.now or datetime.now(timezone.utc)).timestamp()
+        days = np.floor((now - metrics.last_push) / SECONDS_PER_DAY)
+        return np.nan_to_num(days, nan=0.0)
+
+    def score(self, metrics: UserMetrics) -> np.ndarray:
+        """
+        Compute the weighted score of every user.
+
+        Args:
+            metrics (UserMetrics): The columnar metrics
+
+        Returns:
+            np.ndarray: Scores in row order
+        """
+        w = self.weights
+        scores = np.zeros(len(metrics), dtype=np.float64)
+        if w['stars']:
+            scores += w['stars'] * metrics.stars
+        if w['forks']:
+            scores += w['forks'] * metrics.forks
+        if w['days_since_push']:
+            scores += w['days_since_push'] * self.days_since_push(metrics)
+        if w['followers']:
+            scores += w['followers'] * metrics.followers
+        if w['repos']:
+            scores += w['repos'] * metrics.repos
+        return scores
+
+    @staticmethod
+    def percentile_ranks(scores: np.ndarray) -> np.ndarray:
+        """
+        Percentile rank of every score, 100 for the best and 0 for the worst.
+
+        Tied scores share the highest rank among them.
+
+        Args:
+            scores (np.ndarray): Scores in row order
+
+        Returns:
+            np.ndarray: Percentile ranks in row order
+        """
+        if len(scores) < 2:
+            return np.full(len(scores), 100.0)
+        ranks = np.searchsorted(np.sort(scores), scores, side='right') - 1
+        return ranks * (100.0 / (len(scores) - 1))
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Row indices of the k best scores, best first.
+
+        Args:
+            scores (np.ndarray): Scores in row order
+            k (int): Number of rows to return
+
+        Returns:
+            np.ndarray: Indices sorted by descending score
+        """
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+def rank_profiles(profiles: Dict[str, UserProfile], top_k: Optional[int] = None,
+                  weights: Optional[Dict[str, float]] = None,
+                  columns: Optional['MetricColumns'] = None) -> Dict[str, dict]:
+    """
+    Score enriched profiles and order them best first.
+
+    Args:
+        profiles (Dict[str, UserProfile]): Profiles keyed by username
+        top_k (int): Only return the top_k best scored users
+        weights (Dict[str, float]): Overrides for DEFAULT_WEIGHTS
+        columns (MetricColumns): The profiles' metric rows, if they were collected while loading
+
+    Returns:
+        Dict[str, dict]: score, percentile, details, total_stars and total_forks per user, best first
+    """
+    engine = ScoringEngine(weights)
+    metrics = UserMetrics.from_columns(columns) if columns is not None else UserMetrics.from_profiles(profiles)
+    scores = engine.score(metrics)
+    percentiles = engine.percentile_ranks(scores)
+    order = engine.top_k(scores, len(scores) if top_k is None else top_k)
+
+    ranked = {}
+    for index in order.tolist():
+        username = metrics.logins[index]
+        score = float(scores[index])
+        ranked[username] = {
+            'score': int(score) if score.is_integer() else round(score, 2),
+            'percentile': round(float(percentiles[index]), 1),
+            'details': profiles[username].details,
+            'total_stars': int(metrics.stars[index]),
+            'total_forks': int(metrics.forks[index]),
+        }
+    return ranked
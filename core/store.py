@@ -0,0 +1,294 @@
+# core/store.py
+
+import json
+import os
+import sqlite3
+import threading
+from time import time
+from typing import Dict, Iterable, List, Optional
+
+# Default seconds before a stored entity is considered stale
+DEFAULT_TTLS = {
+    'users': 6 * 3600,
+    'repos': 6 * 3600,
+}
+
+# SQLite caps bound parameters per statement, so IN lookups are chunked
+LOOKUP_CHUNK = 500
+
+
+class EntityStore:
+    """
+    Local SQLite store of GitHub users, their repositories, follower snapshots
+    and event feed cursors.
+
+    Each entity keeps the time it was fetched; lookups only return entities
+    younger than the configured per-entity TTL. Follower/following snapshots
+    never expire, they are kept in step by incremental syncs.
+    """
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, int]] = None):
+        """
+        Open (or create) the store.
+
+        Args:
+            path (str): SQLite file to store entities in
+            ttls (Dict[str, int]): Per-entity TTL overrides in seconds ('users', 'repos')
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS users ('
+            ' login TEXT PRIMARY KEY COLLATE NOCASE, data TEXT NOT NULL, fetched_at REAL NOT NULL);'
+            'CREATE TABLE IF NOT EXISTS repos ('
+            ' owner TEXT NOT NULL COLLATE NOCASE, position INTEGER NOT NULL, data TEXT NOT NULL,'
+            ' PRIMARY KEY (owner, position));'
+            'CREATE TABLE IF NOT EXISTS repo_lists ('
+            ' owner TEXT PRIMARY KEY COLLATE NOCASE, fetched_at REAL NOT NULL);'
+            'CREATE TABLE IF NOT EXISTS snapshots ('
+            ' account TEXT NOT NULL COLLATE NOCASE, relation TEXT NOT NULL, seq INTEGER NOT NULL,'
+            ' login TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (account, relation, login));'
+            'CREATE INDEX IF NOT EXISTS snapshots_order ON snapshots (account, relation, seq);'
+            'CREATE TABLE IF NOT EXISTS snapshot_meta ('
+            ' account TEXT NOT NULL COLLATE NOCASE, relation TEXT NOT NULL, synced_at REAL NOT NULL,'
+            ' PRIMARY KEY (account, relation));'
+            'CREATE TABLE IF NOT EXISTS event_cursors ('
+            ' login TEXT PRIMARY KEY COLLATE NOCASE, last_event_id INTEGER NOT NULL, etag TEXT);'
+        )
+        self._conn.commit()
+
+    def _cutoff(self, entity: str) -> float:
+        return time() - self.ttls[entity]
+
+    def get_user(self, login: str) -> Optional[dict]:
+        """
+        Get a stored user if it is still fresh.
+
+        Args:
+            login (str): GitHub username
+
+        Returns:
+            dict: User details, or None if missing or stale
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM users WHERE login = ? AND fetched_at >= ?',
+                (login, self._cutoff('users'))
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_users(self, logins: Iterable[str]) -> Dict[str, dict]:
+        """
+        Get every fresh stored user among the given logins.
+
+        Args:
+            logins (Iterable[str]): GitHub usernames
+
+        Returns:
+            Dict[str, dict]: Fresh user details keyed by the requested login
+        """
+        requested = {login.lower(): login for login in logins}
+        keys = list(requested)
+        found = {}
+        cutoff = self._cutoff('users')
+        with self._lock:
+            for start in range(0, len(keys), LOOKUP_CHUNK):
+                chunk = keys[start:start + LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    f'SELECT login, data FROM users WHERE fetched_at >= ? '
+                    f'AND login IN ({",".join("?" * len(chunk))})',
+                    (cutoff, *chunk)
+                ).fetchall()
+                for login, data in rows:
+                    found[requested[login.lower()]] = json.loads(data)
+        return found
+
+    def upsert_users(self, users: Iterable[dict]):
+        """
+        Insert or refresh many users in one transaction.
+
+        Args:
+            users (Iterable[dict]): User details, each with a 'login'
+        """
+        now = time()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO users (login, data, fetched_at) VALUES (?, ?, ?)',
+                ((user['login'], json.dumps(user), now) for user in users)
+            )
+            self._conn.commit()
+
+    def get_repos(self, owner: str) -> Optional[List[dict]]:
+        """
+        Get a user's stored repository list if it is still fresh.
+
+        Args:
+            owner (str): GitHub username
+
+        Returns:
+            List[dict]: Repositories in their original order, or None if missing or stale
+        """
+        with self._lock:
+            fresh = self._conn.execute(
+                'SELECT 1 FROM repo_lists WHERE owner = ? AND fetched_at >= ?',
+                (owner, self._cutoff('repos'))
+            ).fetchone()
+            if not fresh:
+                return None
+            rows = self._conn.execute(
+                'SELECT data FROM repos WHERE owner = ? ORDER BY position', (owner,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def upsert_repos(self, owner: str, repos: List[dict]):
+        """
+        Replace a user's stored repository list.
+
+        Args:
+            owner (str): GitHub username
+            repos (List[dict]): Repositories in the order the API returned them
+        """
+        with self._lock:
+            self._conn.execute('DELETE FROM repos WHERE owner = ?', (owner,))
+            self._conn.executemany(
+                'INSERT INTO repos (owner, position, data) VALUES (?, ?, ?)',
+                ((owner, position, json.dumps(repo)) for position, repo in enumerate(repos))
+            )
+            self._conn.execute(
+                'INSERT OR REPLACE INTO repo_lists (owner, fetched_at) VALUES (?, ?)', (owner, time()))
+            self._conn.commit()
+
+    def get_snapshot(self, account: str, relation: str) -> Optional[List[dict]]:
+        """
+        Get the last synced follower or following list of an account.
+
+        Args:
+            account (str): GitHub username
+            relation (str): 'followers' or 'following'
+
+        Returns:
+            List[dict]: Users newest first, or None if the account was never synced
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT data FROM snapshots WHERE account = ? AND relation = ? ORDER BY seq DESC',
+                (account, relation)
+            ).fetchall()
+            if not rows and not self._conn.execute(
+                    'SELECT 1 FROM snapshot_meta WHERE account = ? AND relation = ?',
+                    (account, relation)).fetchone():
+                return None
+        return [json.loads(row[0]) for row in rows]
+
+    def replace_snapshot(self, account: str, relation: str, users: List[dict]):
+        """
+        Replace an account's follower or following snapshot.
+
+        Args:
+            account (str): GitHub username
+            relation (str): 'followers' or 'following'
+            users (List[dict]): Users newest first
+        """
+        count = len(users)
+        with self._lock:
+            self._conn.execute(
+                'DELETE FROM snapshots WHERE account = ? AND relation = ?', (account, relation))
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO snapshots (account, relation, seq, login, data) VALUES (?, ?, ?, ?, ?)',
+                ((account, relation, count - index, user['login'], json.dumps(user))
+                 for index, user in enumerate(users))
+            )
+            # An empty list is still a valid snapshot, remember that it was taken
+            self._conn.execute(
+                'INSERT OR REPLACE INTO snapshot_meta (account, relation, synced_at) VALUES (?, ?, ?)',
+                (account, relation, time()))
+            self._conn.commit()
+
+    def prepend_snapshot(self, account: str, relation: str, users: List[dict]):
+        """
+        Add newly seen users to the front of an account's snapshot.
+
+        Args:
+            account (str): GitHub username
+            relation (str): 'followers' or 'following'
+            users (List[dict]): New users newest first
+        """
+        with self._lock:
+            top = self._conn.execute(
+                'SELECT COALESCE(MAX(seq), 0) FROM snapshots WHERE account = ? AND relation = ?',
+                (account, relation)
+            ).fetchone()[0]
+            count = len(users)
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO snapshots (account, relation, seq, login, data) VALUES (?, ?, ?, ?, ?)',
+                ((account, relation, top + count - index, user['login'], json.dumps(user))
+                 for index, user in enumerate(users))
+            )
+            self._conn.execute(
+                'INSERT OR REPLACE INTO snapshot_meta (account, relation, synced_at) VALUES (?, ?, ?)',
+                (account, relation, time()))
+            self._conn.commit()
+
+    def get_event_cursors(self, logins: Iterable[str]) -> Dict[str, tuple]:
+        """
+        Get the event feed cursors of many users.
+
+        Args:
+            logins (Iterable[str]): GitHub usernames
+
+        Returns:
+            Dict[str, tuple]: (last processed event id, ETag) keyed by the requested login
+        """
+        requested = {login.lower(): login for login in logins}
+        keys = list(requested)
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), LOOKUP_CHUNK):
+                chunk = keys[start:start + LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    f'SELECT login, last_event_id, etag FROM event_cursors '
+                    f'WHERE login IN ({",".join("?" * len(chunk))})',
+                    chunk
+                ).fetchall()
+                for login, last_event_id, etag in rows:
+                    found[requested[login.lower()]] = (last_event_id, etag)
+        return found
+
+    def set_event_cursor(self, login: str, last_event_id: int, etag: Optional[str]):
+        """
+        Remember the newest processed event of a user and the ETag it was polled with.
+
+        Args:
+            login (str): GitHub username
+            last_event_id (int): Id of the newest processed event
+            etag (str): ETag of the poll that returned it
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO event_cursors (login, last_event_id, etag) VALUES (?, ?, ?)',
+                (login, last_event_id, etag))
+            self._conn.commit()
+
+    def invalidate(self, login: str):
+        """
+        Drop everything stored about a user.
+
+        Args:
+            login (str): GitHub username
+        """
+        with self._lock:
+            self._conn.execute('DELETE FROM users WHERE login = ?', (login,))
+            self._conn.execute('DELETE FROM repos WHERE owner = ?', (login,))
+            self._conn.execute('DELETE FROM repo_lists WHERE owner = ?', (login,))
+            self._conn.execute('DELETE FROM snapshots WHERE account = ?', (login,))
+            self._conn.execute('DELETE FROM snapshot_meta WHERE account = ?', (login,))
+            self._conn.execute('DELETE FROM event_cursors WHERE login = ?', (login,))
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
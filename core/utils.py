@@ -1,12 +1,79 @@
 # core/utils.py
 
-from typing import Dict, Tuple, List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Optional
 from core.github_api import GitHubAPIClient
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
-from time import sleep
-from datetime import datetime
-import random
+from core.aggregator import MetricColumns, UserProfileAggregator
+from core.models import EngagementContext, UserInfo
+from core.filters import UserFilter
+from core.relationships import split_relationships
+import heapq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+    from core.ledger import EngagementLedger
+
+# NumPy (scoring), asyncio and rich.progress are imported by the methods that
+# need them, so importing the analyzer stays cheap for short runs.
+
+
+class RecommendationCounts:
+    """
+    How many candidates have each recommendation count.
+
+    Counts only ever grow by one, so keeping them as a histogram lets the
+    crawl check whether its top candidates are settled by walking the few
+    distinct counts instead of ranking every candidate.
+    """
+
+    def __init__(self):
+        self.histogram: Dict[int, int] = {}
+
+    def increment(self, previous: int):
+        """
+        Record that a candidate's count went from previous to previous + 1.
+
+        Args:
+            previous (int): The candidate's count before, 0 for a new candidate
+        """
+        if previous:
+            self.histogram[previous] -= 1
+            if not self.histogram[previous]:
+                del self.histogram[previous]
+        self.histogram[previous + 1] = self.histogram.get(previous + 1, 0) + 1
+
+    def settled(self, max_users: int, remaining_seeds: int) -> bool:
+        """
+        Check whether the top max_users candidates can still change.
+
+        Every remaining seed adds at most one recommendation to any candidate,
+        so the top set is final once the weakest member leads the best
+        outsider (or a brand-new candidate) by more than the remaining seeds.
+
+        Args:
+            max_users (int): Size of the top set
+            remaining_seeds (int): Seeds not aggregated yet
+
+        Returns:
+            bool: True if no remaining seed can change the top set
+        """
+        if remaining_seeds == 0 or max_users <= 0:
+            return True
+        weakest = best_outsider = None
+        ranked = 0
+        for count in sorted(self.histogram, reverse=True):
+            ranked += self.histogram[count]
+            if weakest is None and ranked >= max_users:
+                weakest = count
+            if ranked > max_users:
+                best_outsider = count
+                break
+        if weakest is None:
+            return False
+        return weakest > (best_outsider or 0) + remaining_seeds
 
 
 class GitHubFollowerAnalyzer:
@@ -14,17 +81,18 @@ class GitHubFollowerAnalyzer:
     Analyzes follower and following relationships.
     """
 
-    def __init__(self, api_client: GitHubAPIClient):
+    def __init__(self, api_client: GitHubAPIClient, console: Optional[Console] = None):
         """
         Initialize the analyzer with a GitHub API client.
 
         Args:
             api_client (GitHubAPIClient): An instance of the GitHub API client
+            console (Console): Console to render progress on, defaults to the client's
         """
         self.api_client = api_client
-        self.console = Console()
+        self.console = console or api_client.console
 
-    def analyze_followers(self) -> Tuple[Dict[str, dict], Dict[str, dict], Dict[str, dict]]:
+    def analyze_followers(self) -> Tuple[Dict[str, UserInfo], Dict[str, UserInfo], Dict[str, UserInfo]]:
         """
         Analyze followers and following lists.
 
@@ -37,23 +105,18 @@ class GitHubFollowerAnalyzer:
         user_info = self.api_client.get_user_info()
         username = user_info['login']
 
-        followers = self.api_client.get_followers(username)
-        following = self.api_client.get_following(username)
-
-        follower_usernames = set(followers.keys())
-        following_usernames = set(following.keys())
-
-        mutual = {username: following[username]
-                  for username in follower_usernames & following_usernames}
-        not_following_back = {username: following[username]
-                              for username in following_usernames - follower_usernames}
-        not_followed_back = {username: followers[username]
-                             for username in follower_usernames - following_usernames}
+        # Only pages newer than the stored snapshot are fetched when the counts agree
+        with self.console.status("[bold green]Syncing followers..."):
+            followers = self.api_client.sync_connections(username, 'followers', user_info['followers'])
+        with self.console.status("[bold green]Syncing following..."):
+            following = self.api_client.sync_connections(username, 'following', user_info['following'])
 
-        return mutual, not_following_back, not_followed_back
+        return split_relationships(followers, following)
 
     def create_progress_bar(self, description: str) -> Progress:
         """Create a customized progress bar."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -63,45 +126,74 @@ class GitHubFollowerAnalyzer:
             console=self.console
         )
 
-    def follow_followers_followers(self, max_users: int = 50) -> Tuple[list, list]:
+    def follow_followers_followers(self, max_users: int = 50, max_pages_per_seed: int = 3,
+                                   max_workers: Optional[int] = None, follow: bool = True) -> Tuple[list, list]:
         """
         Follow your followers' followers (network expansion).
 
+        Followers' follower lists are crawled concurrently and each one is
+        aggregated as soon as its pages are in; the crawl stops early once the
+        top candidates are settled, which is checked against a histogram of
+        recommendation counts rather than by ranking every candidate.
+
         Args:
             max_users (int): Maximum number of new users to follow
+            max_pages_per_seed (int): Maximum follower pages fetched per follower (100 users each)
+            max_workers (int): Concurrent seed crawls, defaults to the client's page workers
+            follow (bool): Follow the recommended users, False to only recommend them
 
         Returns:
             Tuple: List of newly followed users and list of recommended users
         """
-        my_followers = self.api_client.get_followers(
-            self.api_client.get_user_info()['login'])
-        following = self.api_client.get_following(
-            self.api_client.get_user_info()['login'])
+        user_info = self.api_client.get_user_info()
+        login = user_info['login']
+        with self.console.status("[bold green]Syncing followers..."):
+            my_followers = self.api_client.sync_connections(login, 'followers', user_info['followers'])
+            following = self.api_client.sync_connections(login, 'following', user_info['following'])
+        excluded = my_followers.keys() | following.keys() | {login}
         newly_followed = []
         potential_follows = {}
-
-        with self.console.status("[bold green]Analyzing network..."):
-            for follower in my_followers.keys():
-                # Get this follower's followers
-                followers_followers = self.api_client.get_user_followers_limited(
-                    follower)
-                for username, user_data in followers_followers.items():
-                    if username not in following and username not in my_followers:
+        counts = RecommendationCounts()
+
+        seeds = list(my_followers)
+        remaining = len(seeds)
+        with self.create_progress_bar("Analyzing network...") as progress:
+            task = progress.add_task("Crawling followers' followers...", total=len(seeds))
+            with ThreadPoolExecutor(max_workers=max_workers or self.api_client.page_workers) as executor:
+                futures = {
+                    executor.submit(self.api_client.get_pages, f'/users/{seed}/followers',
+                                    None, max_pages_per_seed, UserInfo.from_api): seed
+                    for seed in seeds
+                }
+                for future in as_completed(futures):
+                    follower = futures[future]
+                    remaining -= 1
+                    # Aggregate this follower's followers as soon as they arrive
+                    for user_data in future.result():
+                        username = user_data.login
+                        if username in excluded:
+                            continue
                         if username not in potential_follows:
                             potential_follows[username] = {
                                 'data': user_data,
                                 'recommended_by': [follower]
                             }
-                        else:
+                            counts.increment(0)
+                        elif potential_follows[username]['recommended_by'][-1] != follower:
                             potential_follows[username]['recommended_by'].append(
                                 follower)
+                            counts.increment(len(potential_follows[username]['recommended_by']) - 1)
+                    progress.update(task, advance=1)
 
-        # Sort by number of mutual connections
-        sorted_potentials = sorted(
-            potential_follows.items(),
-            key=lambda x: len(x[1]['recommended_by']),
-            reverse=True
-        )
+                    if counts.settled(max_users, remaining):
+                        for pending in futures:
+                            pending.cancel()
+                        progress.update(task, completed=len(seeds))
+                        break
+
+        # Best candidates by number of mutual connections
+        sorted_potentials = heapq.nlargest(
+            max(max_users, 0), potential_follows.items(), key=lambda x: len(x[1]['recommended_by']))
 
         if not sorted_potentials:
             return [], []
@@ -110,10 +202,9 @@ class GitHubFollowerAnalyzer:
             (username, data['recommended_by']) for username, data in sorted_potentials[:max_users]
         ]
 
-        for username, _ in sorted_potentials[:max_users]:
+        for username, _ in sorted_potentials[:max_users] if follow else []:
             if self.api_client.follow_user(username):
                 newly_followed.append(username)
-                sleep(1)
 
         return newly_followed, recommended_users
 
@@ -127,124 +218,60 @@ class GitHubFollowerAnalyzer:
         Returns:
             dict: Activity analysis results
         """
-        user_details = self.api_client.get_user_details(username)
-
-        # Get user's repositories
-        repos = self.api_client.get_user_repos(username)
-
-        # Calculate activity metrics
-        total_stars = sum(repo['stargazers_count'] for repo in repos)
-        total_forks = sum(repo['forks_count'] for repo in repos)
-        languages = {}
-        for repo in repos:
-            if repo['language']:
-                languages[repo['language']] = languages.get(
-                    repo['language'], 0) + 1
-
-        last_push = None
-        if repos:
-            last_push_repo = max(
-                repos, key=lambda repo: datetime.fromisoformat(repo['updated_at'][:-1]))
-            last_push = datetime.fromisoformat(
-                last_push_repo['updated_at'][:-1])
+        profile = UserProfileAggregator(self.api_client).profile(username)
+        user_details = profile.details
 
         return {
-            'public_repos': user_details['public_repos'],
-            'followers': user_details['followers'],
-            'following': user_details['following'],
-            'total_stars': total_stars,
-            'total_forks': total_forks,
-            'top_languages': dict(sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]),
-            'created_at': user_details['created_at'],
-            'updated_at': user_details['updated_at'],
-            'last_push_at': last_push
+            'public_repos': user_details.public_repos,
+            'followers': user_details.followers,
+            'following': user_details.following,
+            'total_stars': profile.total_stars,
+            'total_forks': profile.total_forks,
+            'top_languages': dict(sorted(profile.languages.items(), key=lambda x: x[1], reverse=True)[:5]),
+            'created_at': user_details.created_at,
+            'updated_at': user_details.updated_at,
+            'last_push_at': profile.last_push_at
         }
 
-    def filter_users(self, users: Dict[str, dict], criteria: dict) -> Dict[str, dict]:
+    def filter_users(self, users: Dict[str, UserInfo], criteria: dict) -> Dict[str, UserInfo]:
         """
         Filters users based on specified criteria.
 
         Args:
-            users (Dict[str, dict]): A dictionary of user details
+            users (Dict[str, UserInfo]): A dictionary of users
             criteria (dict): Filtering criteria
 
         Returns:
-            Dict[str, dict]: A dictionary of filtered users
+            Dict[str, UserInfo]: A dictionary of filtered users
         """
-        filtered_users = users.copy()
-
         if not criteria:
-            return filtered_users
+            return users.copy()
 
+        user_filter = UserFilter(criteria)
         with self.console.status("[bold green]Filtering users..."):
+            return user_filter.apply(self.api_client, users)
 
-            for key, value in criteria.items():
-
-                if key == "min_followers":
-                    filtered_users = {
-                        user: details
-                        for user, details in filtered_users.items()
-                        if self.api_client.get_user_details(user).get('followers', 0) >= int(value)
-                    }
-
-                elif key == "max_followers":
-                    filtered_users = {
-                        user: details
-                        for user, details in filtered_users.items()
-                        if self.api_client.get_user_details(user).get('followers', 0) <= int(value)
-                    }
-
-                elif key == "min_repos":
-                    filtered_users = {
-                        user: details
-                        for user, details in filtered_users.items()
-                        if self.api_client.get_user_details(user).get('public_repos', 0) >= int(value)
-                    }
-
-                elif key == "max_repos":
-                    filtered_users = {
-                        user: details
-                        for user, details in filtered_users.items()
-                        if self.api_client.get_user_details(user).get('public_repos', 0) <= int(value)
-                    }
-
-            return filtered_users
-
-    def calculate_user_scores(self, users: Dict[str, dict]) -> Dict[str, dict]:
+    def calculate_user_scores(self, users: Dict[str, dict], backend: str = 'rest', top_k: Optional[int] = None,
+                              weights: Optional[Dict[str, float]] = None) -> Dict[str, dict]:
         """
         Calculates scores for users based on their activity and contributions.
 
         Args:
             users (Dict[str, dict]): A dictionary of user details.
+            backend (str): 'rest' or 'graphql' to fetch the users' data with.
+            top_k (int): Only return the top_k best scored users.
+            weights (Dict[str, float]): Score weight overrides, see core.scoring.DEFAULT_WEIGHTS.
 
         Returns:
-            Dict[str, dict]: A dictionary containing user scores and details.
+            Dict[str, dict]: A dictionary containing user scores and details, best first.
         """
-        scored_users = {}
+        from core.scoring import rank_profiles
+
         with self.console.status("[bold green]Calculating user scores..."):
-            for username in users:
-                details = self.api_client.get_user_details(username)
-                repos = self.api_client.get_user_repos(username)
-                total_stars = sum(repo['stargazers_count'] for repo in repos)
-                total_forks = sum(repo['forks_count'] for repo in repos)
-
-                activity_score = 0
-                if repos:
-                    last_push_repo = max(
-                        repos, key=lambda repo: datetime.fromisoformat(repo['updated_at'][:-1]))
-                    last_push = datetime.fromisoformat(
-                        last_push_repo['updated_at'][:-1])
-                    activity_score = (datetime.now() - last_push).days
-
-                # User score calculation is a simple sum of starts, forks, and the inverted activity score
-                user_score = total_stars + total_forks - \
-                    activity_score if activity_score else total_stars + total_forks
-                scored_users[username] = {
-                    "score": user_score,
-                    "details": details,
-                    "repos": repos
-                }
-        return scored_users
+            # Metric rows are collected while repositories load, ranking reuses them
+            columns = MetricColumns()
+            profiles = UserProfileAggregator(self.api_client, backend=backend).profiles(users, columns)
+            return rank_profiles(profiles, top_k, weights, columns)
 
     def analyze_network_languages(self, users: Dict[str, dict]) -> Dict[str, int]:
         """
@@ -259,7 +286,8 @@ class GitHubFollowerAnalyzer:
         language_counts = {}
         with self.console.status("[bold green]Analyzing network languages..."):
             for username in users:
-                repos = self.api_client.get_user_repos(username)
+                # Stream every page, keeping only the language of each repository
+                repos = self.api_client.iter_user_repos(username, fields=('language',))
                 for repo in repos:
                     if repo.get('language'):
                         language_counts[repo['language']] = language_counts.get(
@@ -267,72 +295,110 @@ class GitHubFollowerAnalyzer:
 
         return dict(sorted(language_counts.items(), key=lambda item: item[1], reverse=True))
 
-    def perform_automated_engagements(self, users: Dict[str, dict], config: dict) -> Dict[str, List[str]]:
+    async def analyze_followers_async(self, concurrency: Optional[int] = None) -> Tuple[Dict[str, UserInfo], Dict[str, UserInfo], Dict[str, UserInfo]]:
+        """
+        Analyze followers and following lists, fetching both lists concurrently.
+
+        Args:
+            concurrency (int): Maximum API calls in flight
+
+        Returns:
+            Tuple: Mutual, non-following and non-followed users, as analyze_followers
+        """
+        import asyncio
+        from core.async_api import AsyncGitHubAPIClient
+
+        async with AsyncGitHubAPIClient(self.api_client, concurrency) as client:
+            username = (await client.get_user_info())['login']
+            followers, following = await asyncio.gather(
+                client.get_followers(username), client.get_following(username))
+
+        return split_relationships(followers, following)
+
+    async def calculate_user_scores_async(self, users: Dict[str, dict], concurrency: Optional[int] = None,
+                                          top_k: Optional[int] = None) -> Dict[str, dict]:
+        """
+        Calculates user scores, gathering every user's profile and repositories concurrently.
+
+        Args:
+            users (Dict[str, dict]): A dictionary of user details.
+            concurrency (int): Maximum API calls in flight
+            top_k (int): Only return the top_k best scored users.
+
+        Returns:
+            Dict[str, dict]: A dictionary containing user scores and details, best first.
+        """
+        import asyncio
+        from core.async_api import AsyncGitHubAPIClient
+
+        from core.scoring import rank_profiles
+
+        aggregator = UserProfileAggregator(self.api_client)
+        usernames = list(users)
+
+        async with AsyncGitHubAPIClient(self.api_client, concurrency) as client:
+            # Profiles are fetched in one batch, as the sync path does, while the repositories load
+            details, all_repos = await asyncio.gather(
+                client.get_users_details(usernames),
+                asyncio.gather(*(client.get_user_repos(username) for username in usernames)))
+
+        columns = MetricColumns()
+        profiles = {}
+        for username, repos in zip(usernames, all_repos):
+            profiles[username] = aggregator.build(username, details[username], repos)
+            columns.add(profiles[username])
+        return rank_profiles(profiles, top_k, columns=columns)
+
+    async def analyze_network_languages_async(self, users: Dict[str, dict], concurrency: Optional[int] = None) -> Dict[str, int]:
+        """
+        Analyzes the most used languages in a network, fetching repositories concurrently.
+
+        Args:
+            users (Dict[str, dict]): A dictionary of user details.
+            concurrency (int): Maximum API calls in flight
+
+        Returns:
+            Dict[str, int]: A dictionary with language counts.
+        """
+        import asyncio
+        from core.async_api import AsyncGitHubAPIClient
+
+        async with AsyncGitHubAPIClient(self.api_client, concurrency) as client:
+            all_repos = await asyncio.gather(*(client.get_user_repos(username) for username in users))
+
+        language_counts = {}
+        for repos in all_repos:
+            for repo in repos:
+                if repo.get('language'):
+                    language_counts[repo['language']] = language_counts.get(
+                        repo['language'], 0) + 1
+
+        return dict(sorted(language_counts.items(), key=lambda item: item[1], reverse=True))
+
+    def perform_automated_engagements(self, users: Dict[str, dict], config: dict,
+                                      context: Optional[EngagementContext] = None,
+                                      ledger: Optional[EngagementLedger] = None) -> Dict[str, List[str]]:
         """
         Performs automated engagements on the given users.
 
         Args:
            users (Dict[str, dict]): Dictionary of users to engage with
            config (dict): Dictionary of configuration for the actions.
+           context (EngagementContext): Own login, following and followers, loaded once if not given
+           ledger (EngagementLedger): Record of earlier stars, likes and comments, which are skipped
 
         Returns:
-           Dict[str, List[str]]: Dictionary of users with the performed actions.
+           Dict[str, List[str]]: Dictionary of users with the performed actions; failures are printed.
         """
-        performed_actions = {}
+        from core.engagement import EngagementEngine
+
+        engine = EngagementEngine(self.api_client, config, ledger=ledger)
 
         with self.create_progress_bar("Performing automated engagements...") as progress:
             task = progress.add_task("Engaging users...", total=len(users))
-
-            for username in users:
-                user_actions = []
-                events = self.api_client.get_user_events(username)
-
-                for event in events:
-                    if event["type"] == "CreateEvent":
-                        if config.get("star_repo", False):
-                            repo_owner = event["repo"]["name"].split("/")[0]
-                            repo_name = event["repo"]["name"].split("/")[1]
-                            if self.api_client.star_repository(repo_owner, repo_name):
-                                user_actions.append(
-                                    f"Starred repo: {event['repo']['name']}")
-                                # Respect rate limits
-                                sleep(random.uniform(0.5, 2))
-
-                    elif event["type"] == "PushEvent":
-                        if config.get("like_commit", False):
-                            for commit in event["payload"].get("commits", []):
-                                repo_owner = event["repo"]["name"].split(
-                                    "/")[0]
-                                repo_name = event["repo"]["name"].split("/")[1]
-                                commit_sha = commit.get("sha")
-                                if commit_sha and self.api_client.like_commit(repo_owner, repo_name, commit_sha):
-                                    user_actions.append(
-                                        f"Liked commit: {commit_sha}")
-                                    # Respect rate limits
-                                    sleep(random.uniform(0.5, 2))
-
-                    elif event["type"] in ["IssuesEvent", "PullRequestEvent"]:
-                        if config.get("comment_issue_pr", False) and event["payload"].get("action", "") in ["opened", "created", "submitted"]:
-                            comment_text = config.get(
-                                "comment_message", "Great job, keep up the amazing work! 😄")
-                            repo_owner = event["repo"]["name"].split("/")[0]
-                            repo_name = event["repo"]["name"].split("/")[1]
-                            issue_number = event["payload"]["issue"]["number"] if event[
-                                "type"] == "IssuesEvent" else event["payload"]["pull_request"]["number"]
-                            if self.api_client.create_comment(repo_owner, repo_name, issue_number, comment_text):
-                                user_actions.append(f"Commented on {
-                                                    'issue' if event['type'] == 'IssuesEvent' else 'PR'} {issue_number}")
-                                # Respect rate limits
-                                sleep(random.uniform(0.5, 2))
-
-                if config.get("follow_back", False):
-                    if username not in self.api_client.get_following(self.api_client.get_user_info()["login"]):
-                        if self.api_client.follow_user(username):
-                            user_actions.append(f"Followed user back")
-                            # Respect rate limits
-                            sleep(random.uniform(0.5, 2))
-
-                performed_actions[username] = user_actions
-                progress.update(task, advance=1)
-
+            performed_actions = engine.run(users, context,
+                                           on_progress=lambda username: progress.update(task, advance=1))
+        for username, reasons in engine.failures.items():
+            for reason in reasons:
+                self.console.print(f"[yellow]Failed for {username}: {reason}[/yellow]")
         return performed_actions
@@ -8,19 +8,34 @@
 # (_______)\_______/   )_(   (_______/(_______/(_______/|/     \||/    )_)\_______)(_______/
 # ---------------------- By Pouya
 # main.py
-from core.github_api import GitHubAPIClient
-from core.utils import GitHubFollowerAnalyzer
-from ui.console_display import ConsoleDisplay
-from ui.menu import Menu
-from ui.prompts import UserPrompts
-from config import get_github_token
-import requests
+from __future__ import annotations
+
+from config import get_github_token, get_cache_path, ENRICH_BACKEND
+from typing import TYPE_CHECKING
+import os
+import sys
+
+if TYPE_CHECKING:
+    # Modules are imported where they are first used: UI modules only for the
+    # interactive menu, and heavier core modules only by the actions needing them
+    from core.github_api import GitHubAPIClient
+    from core.ledger import EngagementLedger
+    from core.models import MutationReport
+    from core.utils import GitHubFollowerAnalyzer
+    from ui.console_display import ConsoleDisplay
+    from ui.prompts import UserPrompts
 
 
 def main():
     """Main function to execute the GitHub follower manager."""
-    display = ConsoleDisplay()  # Initialize console display handler
-    user_prompts = UserPrompts()  # Initialize user prompts handler
+    from rich.console import Console
+    from ui.console_display import ConsoleDisplay
+    from ui.menu import Menu
+    from ui.prompts import UserPrompts
+
+    console = Console()  # One console shared by every component
+    display = ConsoleDisplay(console)  # Initialize console display handler
+    user_prompts = UserPrompts(console)  # Initialize user prompts handler
 
     # Welcome message
     display.display_panel(
@@ -31,25 +46,28 @@ def main():
     # Get GitHub token
     token = get_github_token()  # Retrieve the GitHub access token
 
+    import requests
+    from core.client_factory import create_api_client
+    from core.utils import GitHubFollowerAnalyzer
+
     try:
         # Initialize core components
-        api_client = GitHubAPIClient(token)  # API client
+        # API client with HTTP cache and entity store; nothing is requested until an action needs it
+        api_client = create_api_client(token, console)
+        cache = api_client.cache
         # Analyzer for followers/following
         analyzer = GitHubFollowerAnalyzer(api_client)
-        menu = Menu(user_prompts)  # Menu handler
-        user_info = api_client.get_user_info()  # Get current user info
-
-        # Greet the user
-        display.display_message(
-            f"\n[bold green]Welcome, {user_info['name'] or user_info['login']}![/bold green]")
-        display.display_message(
-            f"[italic]Profile: https://github.com/{user_info['login']}[/italic]\n")
+        menu = Menu(user_prompts, console)  # Menu handler
 
         while True:
             # Show the menu and get the user's choice
             choice = menu.display()  # Display the menu and get user's selection
 
             if choice == "q":  # If user chooses to exit
+                stats = cache.stats()
+                display.display_message(
+                    f"[dim]HTTP cache: {stats['hits']} hits, {stats['not_modified']} not modified (304), "
+                    f"{stats['misses']} misses[/dim]")
                 display.display_message(
                     "[yellow]Exiting the GitCleanse. Goodbye![/yellow]")
                 break
@@ -68,12 +86,9 @@ def main():
                       # Display user activity
                       lambda: display_user_activity(analyzer, api_client, display, user_prompts)),
                 "6": ("Display detailed user information",
-                      lambda: display.display_users_table(
-                          {user_info['login']: user_info},
-                          "Your Profile Details", api_client
-                      )),  # Display detailed info
-                # Do nothing for now
-                "7": ("Generate network report", lambda: display.display_message("[yellow]Report generation is not yet implemented[/yellow]")),
+                      lambda: display_own_profile(api_client, display)),  # Display detailed info
+                # Stream the whole network to a report file
+                "7": ("Generate network report", lambda: generate_network_report(analyzer, display, user_prompts)),
                 # Display Dashboard
                 "8": ("Display user dashboard", lambda: display_dashboard(analyzer, display)),
                 # Automated Engagement
@@ -99,14 +114,14 @@ def main():
                                 filtered_users = filter_users(
                                     analyzer, user_prompts, not_following_back)
                                 display.display_users_table(
-                                    filtered_users, "Users Not Following You Back", api_client)
+                                    filtered_users, "Users Not Following You Back", api_client, ENRICH_BACKEND)
 
                         if not_followed_back:
                             if user_prompts.confirm("Do you want to see the list of users you're not following back?"):
                                 filtered_users = filter_users(
                                     analyzer, user_prompts, not_followed_back)
                                 display.display_users_table(
-                                    filtered_users, "Users You're Not Following Back", api_client)
+                                    filtered_users, "Users You're Not Following Back", api_client, ENRICH_BACKEND)
 
                 except requests.exceptions.RequestException as e:
                     display.display_message(
@@ -127,6 +142,33 @@ def main():
             "\n[yellow]Operation cancelled by user.[/yellow]")
 
 
+def display_own_profile(api_client: GitHubAPIClient, display: ConsoleDisplay):
+    """Greets the authenticated user and shows their profile details."""
+    from core.models import UserInfo
+
+    user_info = api_client.get_user_info()  # Get current user info
+    display.display_message(
+        f"[bold green]Welcome, {user_info['name'] or user_info['login']}![/bold green]")
+    display.display_message(
+        f"[italic]Profile: https://github.com/{user_info['login']}[/italic]\n")
+    display.display_users_table(
+        {user_info['login']: UserInfo.from_api(user_info)}, "Your Profile Details", api_client)
+
+
+def run_bulk_mutation(analyzer: GitHubFollowerAnalyzer, operation: str, targets, description: str) -> MutationReport:
+    """Runs a resumable bulk follow/unfollow with a progress bar."""
+    from core.mutations import BulkMutationExecutor
+
+    targets = list(targets)
+    login = analyzer.api_client.get_user_info()["login"]
+    # One journal per account and operation, so rerunning an interrupted run resumes where it stopped
+    executor = BulkMutationExecutor(
+        analyzer.api_client, get_cache_path(os.path.join("journals", f"{operation}-{login}.jsonl")))
+    with analyzer.create_progress_bar(description) as progress:
+        task = progress.add_task(description, total=len(targets))
+        return executor.run(operation, targets, on_progress=lambda target, ok: progress.update(task, advance=1))
+
+
 def cleanup_following(analyzer: GitHubFollowerAnalyzer, display: ConsoleDisplay, user_prompts: UserPrompts):
     """Handles the cleanup following action."""
     mutual, not_following_back, not_followed_back = analyzer.analyze_followers(
@@ -148,11 +190,9 @@ def cleanup_following(analyzer: GitHubFollowerAnalyzer, display: ConsoleDisplay,
             "[yellow]Operation cancelled by user.[/yellow]")
         return []
 
-    unfollowed_users = []
-    for username in analyzer.create_progress_bar("Unfollowing users...").track(not_following_back.keys()):
-        # Unfollow user via API
-        if analyzer.api_client.unfollow_user(username):
-            unfollowed_users.append(username)  # Collect the user
+    report = run_bulk_mutation(analyzer, "unfollow", not_following_back.keys(), "Unfollowing users...")
+    display.display_mutation_report(report)
+    unfollowed_users = report.succeeded
 
     if unfollowed_users:  # Confirmation message
         display.display_message(f"[green]Successfully unfollowed {
@@ -180,7 +220,7 @@ def follow_my_followers(analyzer: GitHubFollowerAnalyzer, display: ConsoleDispla
     display.display_message(f"\n[yellow]Found {len(
         not_followed_back)} followers you're not following back:[/yellow]")
     display.display_users_table(
-        not_followed_back, "Users You Could Follow Back", analyzer.api_client)  # Display the list
+        not_followed_back, "Users You Could Follow Back", analyzer.api_client, ENRICH_BACKEND)  # Display the list
 
     # Confirmation prompt
     if not user_prompts.confirm("\nDo you want to follow these users back?"):
@@ -188,9 +228,9 @@ def follow_my_followers(analyzer: GitHubFollowerAnalyzer, display: ConsoleDispla
             "[yellow]Operation cancelled by user.[/yellow]")
         return []
 
-    for username in analyzer.create_progress_bar("Following users...").track(not_followed_back.keys()):
-        if analyzer.api_client.follow_user(username):  # Follow user via API
-            newly_followed.append(username)  # Collect followed users
+    report = run_bulk_mutation(analyzer, "follow", not_followed_back.keys(), "Following users...")
+    display.display_mutation_report(report)
+    newly_followed = report.succeeded
 
     if newly_followed:  # Confirmation message
         display.display_message(f"[green]Successfully followed back {
@@ -255,24 +295,90 @@ def filter_users(analyzer: GitHubFollowerAnalyzer, user_prompts: UserPrompts, us
     return filtered_users
 
 
+def generate_network_report(analyzer: GitHubFollowerAnalyzer, display: ConsoleDisplay, user_prompts: UserPrompts):
+    """Handles writing the network report and comparing it with the previous one."""
+    from datetime import datetime
+    from reports.formats import diff_reports, load_report, open_report_writer
+    from reports.report_generator import NetworkReportGenerator, find_previous_report, report_filename
+
+    report_format = user_prompts.ask_for_report_format()
+    filename = report_filename(report_format, datetime.now().strftime("%Y%m%d_%H%M%S"))
+    user_info = analyzer.api_client.get_user_info()
+    generator = NetworkReportGenerator(analyzer.api_client, backend=ENRICH_BACKEND)
+
+    # Rows are written as each batch is enriched, nothing is kept for the whole network
+    with analyzer.create_progress_bar("Writing network report...") as progress, \
+            open_report_writer(filename, report_format) as writer:
+        task = progress.add_task("Writing network report...",
+                                 total=user_info["followers"] + user_info["following"])
+        counts = generator.write(writer, on_progress=lambda rows: progress.update(task, advance=rows))
+        progress.update(task, total=writer.rows, completed=writer.rows)
+
+    display.display_message(
+        f"[green]Report with {writer.rows} users saved to {filename}[/green] "
+        f"({counts['mutual']} mutual, {counts['not-following-back']} not following back, "
+        f"{counts['not-followed-back']} not followed back)")
+
+    previous = find_previous_report(report_format, exclude=filename)
+    if previous and user_prompts.confirm(f"Compare with the previous report {previous}?"):
+        display.display_report_diff(diff_reports(load_report(previous), load_report(filename)), previous)
+
+
 def display_dashboard(analyzer: GitHubFollowerAnalyzer, display: ConsoleDisplay):
     """Handles displaying the user dashboard."""
+    from core.dashboard import DashboardPipeline
+
     user_info = analyzer.api_client.get_user_info()
-    followers = analyzer.api_client.get_followers(user_info["login"])
-    scored_users = analyzer.calculate_user_scores(followers)
-    language_counts = analyzer.analyze_network_languages(followers)
-    display.display_dashboard(scored_users, language_counts)
+    # One fetch per follower feeds every dashboard panel, redrawn as followers load
+    pipeline = DashboardPipeline(analyzer.api_client, backend=ENRICH_BACKEND)
+    with display.live_dashboard() as update:
+        pipeline.run_connections(user_info["login"], user_info["followers"], on_update=update)
 
 
 def automated_user_engagement(analyzer: GitHubFollowerAnalyzer, display: ConsoleDisplay, user_prompts: UserPrompts):
     """Handles automated user engagements."""
+    from core.ledger import EngagementLedger
+
     user_info = analyzer.api_client.get_user_info()
-    followers = analyzer.api_client.get_followers(user_info["login"])
+    followers = analyzer.api_client.sync_connections(
+        user_info["login"], "followers", user_info["followers"])
     engagement_config = user_prompts.ask_for_engagement_options()
-    performed_actions = analyzer.perform_automated_engagements(
-        followers, engagement_config)
-    display.display_engagement_results(performed_actions)
+    # Stars, likes and comments from earlier runs are recorded per account and never repeated
+    ledger = EngagementLedger(get_cache_path(os.path.join("ledgers", f"{user_info['login']}.sqlite3")))
+    try:
+        performed_actions = analyzer.perform_automated_engagements(
+            followers, engagement_config, ledger=ledger)
+        display.display_engagement_results(performed_actions)
+
+        if user_prompts.confirm("Keep watching your followers for new activity (press Ctrl+C to stop)?"):
+            run_engagement_daemon(analyzer, display, engagement_config, ledger)
+    finally:
+        ledger.close()
+
+
+def run_engagement_daemon(analyzer: GitHubFollowerAnalyzer, display: ConsoleDisplay, engagement_config: dict,
+                          ledger: EngagementLedger = None):
+    """Polls followers' event feeds and engages with new activity until interrupted."""
+    from core.daemon import EngagementDaemon
+
+    daemon = EngagementDaemon(analyzer.api_client, engagement_config, ledger=ledger)
+    display.display_message(
+        "[cyan]Watching for new activity. Feeds are polled with ETags and GitHub's poll interval.[/cyan]")
+    try:
+        daemon.run(
+            on_action=lambda action, ok: display.display_message(
+                f"[{'green' if ok else 'red'}]{action.username}: {action.description}"
+                f"{'' if ok else ' (failed)'}[/{'green' if ok else 'red'}]"),
+            on_error=lambda username, e: display.display_message(
+                f"[yellow]Polling {username} failed: {e}[/yellow]"))
+    except KeyboardInterrupt:
+        daemon.stop()
+        display.display_message("[yellow]Stopped watching for new activity.[/yellow]")
 
 
 if __name__ == "__main__":
+    # Any arguments select a headless command, see cli.py
+    if len(sys.argv) > 1:
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
     main()
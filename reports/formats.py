@@ -0,0 +1,347 @@
+# reports/formats.py
+
+import csv
+import json
+import struct
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional
+
+# Report columns and their kinds: 'i' int64, 'f' float64, 's' string
+REPORT_FIELDS = (
+    ('login', 's'),
+    ('id', 'i'),
+    ('relation', 's'),
+    ('name', 's'),
+    ('followers', 'i'),
+    ('following', 'i'),
+    ('public_repos', 'i'),
+    ('total_stars', 'i'),
+    ('total_forks', 'i'),
+    ('last_push_at', 's'),
+    ('top_language', 's'),
+    ('languages', 's'),
+    ('score', 'f'),
+)
+FIELD_NAMES = tuple(name for name, _ in REPORT_FIELDS)
+
+# Columnar files start with this magic, then a length-prefixed JSON header
+COLUMNAR_MAGIC = b'GCREPORT\x01'
+# Rows buffered per column group in columnar files
+COLUMNAR_GROUP_SIZE = 4096
+NUMERIC_DTYPES = {'i': '<i8', 'f': '<f8'}
+# Integer widths a column group can be packed with, by the code stored before it
+INT_WIDTHS = ('<i1', '<i2', '<i4', '<i8')
+# String encodings of a column group
+PLAIN, DICTIONARY = 0, 1
+
+# Format name -> file extension
+REPORT_EXTENSIONS = {'csv': '.csv', 'ndjson': '.ndjson', 'columnar': '.gcr'}
+
+
+def _empty(kind: str):
+    return 0 if kind == 'i' else float('nan') if kind == 'f' else ''
+
+
+class ReportWriter(ABC):
+    """
+    Writes report rows one at a time to a file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open the report file.
+
+        Args:
+            path (str): File to write
+        """
+        self.path = path
+        self.rows = 0
+
+    @abstractmethod
+    def write(self, row: dict):
+        """
+        Write one row.
+
+        Args:
+            row (dict): Values keyed by REPORT_FIELDS names, missing ones are left empty
+        """
+
+    @abstractmethod
+    def close(self):
+        """Flush and close the file."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvReportWriter(ReportWriter):
+    """Writes rows as CSV with a header line."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, FIELD_NAMES, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def write(self, row: dict):
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+
+
+class NdjsonReportWriter(ReportWriter):
+    """Writes rows as one JSON object per line."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, row: dict):
+        record = {name: row.get(name) for name in FIELD_NAMES}
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+
+
+class ColumnarReportWriter(ReportWriter):
+    """
+    Writes rows in groups of columns.
+
+    Each group holds up to COLUMNAR_GROUP_SIZE rows: a row count, then every
+    column in REPORT_FIELDS order. Integers are packed little-endian in the
+    narrowest width that fits the group, floats as float64. Strings are
+    stored as their byte lengths followed by the UTF-8 bytes, and columns
+    with few distinct values (relationship, language) are dictionary
+    encoded. A zero row count ends the file. Only one group is buffered at
+    a time.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'wb')
+        header = json.dumps({'fields': REPORT_FIELDS}).encode()
+        self._file.write(COLUMNAR_MAGIC + struct.pack('<I', len(header)) + header)
+        self._group = {name: [] for name in FIELD_NAMES}
+
+    def write(self, row: dict):
+        for name, kind in REPORT_FIELDS:
+            value = row.get(name)
+            self._group[name].append(_empty(kind) if value is None else value)
+        self.rows += 1
+        if len(self._group['login']) >= COLUMNAR_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self):
+        import numpy as np
+
+        count = len(self._group['login'])
+        if not count:
+            return
+        parts = [struct.pack('<I', count)]
+        for name, kind in REPORT_FIELDS:
+            values = self._group[name]
+            if kind == 'i':
+                parts.append(_pack_ints(np.asarray(values, dtype=np.int64)))
+            elif kind == 'f':
+                parts.append(np.asarray(values, dtype=NUMERIC_DTYPES[kind]).tobytes())
+            else:
+                distinct = {}
+                codes = [distinct.setdefault(str(value), len(distinct)) for value in values]
+                if len(distinct) <= count // 4:
+                    parts.append(bytes([DICTIONARY]) + struct.pack('<I', len(distinct)))
+                    parts.append(_pack_strings(list(distinct)))
+                    parts.append(_pack_ints(np.asarray(codes, dtype=np.int64)))
+                else:
+                    parts.append(bytes([PLAIN]) + _pack_strings([str(value) for value in values]))
+            values.clear()
+        self._file.write(b''.join(parts))
+
+    def close(self):
+        self._flush()
+        self._file.write(struct.pack('<I', 0))
+        self._file.close()
+
+
+def _pack_ints(values) -> bytes:
+    # One width code, then the values in the narrowest width holding them all
+    import numpy as np
+
+    code = next(index for index, width in enumerate(INT_WIDTHS)
+                if not len(values) or (np.iinfo(width).min <= values.min() and values.max() <= np.iinfo(width).max))
+    return bytes([code]) + values.astype(INT_WIDTHS[code]).tobytes()
+
+
+def _pack_strings(values: List[str]) -> bytes:
+    import numpy as np
+
+    encoded = [value.encode() for value in values]
+    return _pack_ints(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))) + b''.join(encoded)
+
+
+def _unpack_ints(data: bytes, count: int, offset: int):
+    import numpy as np
+
+    values = np.frombuffer(data, dtype=INT_WIDTHS[data[offset]], count=count, offset=offset + 1)
+    return values, offset + 1 + values.nbytes
+
+
+def _unpack_strings(data: bytes, count: int, offset: int):
+    import numpy as np
+
+    lengths, offset = _unpack_ints(data, count, offset)
+    ends = (np.cumsum(lengths, dtype=np.int64) + offset).tolist()
+    starts = [offset] + ends[:-1]
+    return [data[start:end].decode() for start, end in zip(starts, ends)], (ends[-1] if ends else offset)
+
+
+WRITERS = {'csv': CsvReportWriter, 'ndjson': NdjsonReportWriter, 'columnar': ColumnarReportWriter}
+
+
+def open_report_writer(path: str, report_format: str) -> ReportWriter:
+    """
+    Open a writer for one of the report formats.
+
+    Args:
+        path (str): File to write
+        report_format (str): 'csv', 'ndjson' or 'columnar'
+
+    Returns:
+        ReportWriter: The writer, usable as a context manager
+    """
+    if report_format not in WRITERS:
+        raise ValueError(f"Unknown report format: {report_format}")
+    return WRITERS[report_format](path)
+
+
+def _load_columnar(path: str) -> Dict[str, object]:
+    import mmap
+    import numpy as np
+
+    # Numeric columns are read from a memory map of the file; the arrays keep it open
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    offset = len(COLUMNAR_MAGIC)
+    (header_size,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    fields = [tuple(field) for field in json.loads(data[offset:offset + header_size])['fields']]
+    offset += header_size
+
+    chunks = {name: [] for name, _ in fields}
+    while True:
+        (count,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        if not count:
+            break
+        for name, kind in fields:
+            # Numeric columns are views on the mapped bytes, no per-value parsing
+            if kind == 'i':
+                column, offset = _unpack_ints(data, count, offset)
+            elif kind == 'f':
+                column = np.frombuffer(data, dtype=NUMERIC_DTYPES[kind], count=count, offset=offset)
+                offset += column.nbytes
+            elif data[offset] == DICTIONARY:
+                (size,) = struct.unpack_from('<I', data, offset + 1)
+                distinct, offset = _unpack_strings(data, size, offset + 5)
+                codes, offset = _unpack_ints(data, count, offset)
+                column = [distinct[code] for code in codes.tolist()]
+            else:
+                column, offset = _unpack_strings(data, count, offset + 1)
+            chunks[name].append(column)
+
+    columns = {}
+    for name, kind in fields:
+        if kind in NUMERIC_DTYPES:
+            # A single group stays a view when it was stored at full width; narrower
+            # integers are widened and several groups are joined, which copies
+            if len(chunks[name]) == 1:
+                column = chunks[name][0]
+            else:
+                column = np.concatenate(chunks[name]) if chunks[name] else np.empty(0)
+            columns[name] = column.astype(NUMERIC_DTYPES[kind], copy=False)
+        else:
+            columns[name] = [value for chunk in chunks[name] for value in chunk]
+    return columns
+
+
+def _rows(path: str) -> Iterator[dict]:
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith(REPORT_EXTENSIONS['csv']):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def load_report(path: str) -> Dict[str, object]:
+    """
+    Load a report written in any of the formats.
+
+    Args:
+        path (str): Report file
+
+    Returns:
+        Dict[str, object]: Columns keyed by field name; numeric columns are
+            NumPy arrays (for columnar files, read-only arrays backed by a
+            memory map of the file), string columns are lists
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(COLUMNAR_MAGIC)) == COLUMNAR_MAGIC:
+            return _load_columnar(path)
+
+    import numpy as np
+
+    lists: Dict[str, List] = {name: [] for name in FIELD_NAMES}
+    for row in _rows(path):
+        for name, kind in REPORT_FIELDS:
+            value = row.get(name)
+            if value in (None, ''):
+                value = _empty(kind)
+            lists[name].append(value)
+    return {
+        name: np.asarray(lists[name], dtype=NUMERIC_DTYPES[kind]) if kind in NUMERIC_DTYPES else
+        [str(value) for value in lists[name]]
+        for name, kind in REPORT_FIELDS
+    }
+
+
+def _user_keys(report: Dict[str, object]) -> Iterator[object]:
+    # Ids are ints and logins strings, so the two kinds of key never collide
+    for user_id, login in zip(report['id'].tolist(), report['login']):
+        yield user_id or login
+
+
+def diff_reports(old: Dict[str, object], new: Dict[str, object]) -> Dict[str, list]:
+    """
+    Compare two loaded reports of the same account.
+
+    Users are matched by id, so renamed users are not reported as changes.
+    Rows without an id (0) are matched by login, as in split_relationships.
+
+    Args:
+        old (Dict[str, object]): Earlier report as returned by load_report
+        new (Dict[str, object]): Later report as returned by load_report
+
+    Returns:
+        Dict[str, list]: 'added' and 'removed' logins, and 'changed' as
+            (login, old relation, new relation) tuples
+    """
+    old_rows = {key: row for row, key in enumerate(_user_keys(old))}
+    new_rows = {key: row for row, key in enumerate(_user_keys(new))}
+    changed = []
+    for user_id, row in new_rows.items():
+        old_row: Optional[int] = old_rows.get(user_id)
+        if old_row is not None and old['relation'][old_row] != new['relation'][row]:
+            changed.append((new['login'][row], old['relation'][old_row], new['relation'][row]))
+    return {
+        'added': [new['login'][row] for user_id, row in new_rows.items() if user_id not in old_rows],
+        'removed': [old['login'][row] for user_id, row in old_rows.items() if user_id not in new_rows],
+        'changed': changed,
+    }
@@ -1,6 +1,36 @@
 # reports/report_generator.py
 
-from typing import List
+import glob
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.aggregator import UserProfileAggregator
+from core.github_api import GitHubAPIClient
+from core.models import UserInfo
+from core.relationships import StreamingRelationshipAnalyzer
+from reports.formats import REPORT_EXTENSIONS, ReportWriter
+
+
+def report_filename(report_format: str, timestamp: str) -> str:
+    """Name of a network report file, next to the unfollow reports."""
+    return f"github_network_report_{timestamp}{REPORT_EXTENSIONS[report_format]}"
+
+
+def find_previous_report(report_format: str, exclude: Optional[str] = None) -> Optional[str]:
+    """
+    Find the latest network report of a format in the working directory.
+
+    Args:
+        report_format (str): 'csv', 'ndjson' or 'columnar'
+        exclude (str): Report to skip, usually the one just written
+
+    Returns:
+        str: Path of the report, or None if there is none
+    """
+    # Timestamps sort chronologically, so the last name is the latest report
+    reports = sorted(glob.glob(report_filename(report_format, '*')))
+    reports = [path for path in reports if path != exclude]
+    return reports[-1] if reports else None
+
 
 def save_report(unfollowed: List[str], timestamp: str):
     """Save unfollowed users to a report file."""
@@ -13,4 +43,98 @@ def save_report(unfollowed: List[str], timestamp: str):
             f.write("Unfollowed users:\n")
             for user in unfollowed:
                 f.write(f"- {user}\n")
-    return filename
\ No newline at end of file
+    return filename
+
+class NetworkReportGenerator:
+    """
+    Streams the whole network into a report, one row per user.
+
+    Relationships come from the streaming analyzer, so only the smaller of
+    the followers and following lists is held. Users are enriched and
+    scored in batches as they are classified, and every batch is written
+    out before the next one is fetched, so memory stays bounded by one
+    batch however large the network is.
+    """
+
+    def __init__(self, api_client: GitHubAPIClient, backend: str = 'rest', batch_size: int = 100,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            api_client (GitHubAPIClient): Client used to fetch the network
+            backend (str): 'rest' or 'graphql' to enrich users with
+            batch_size (int): Users enriched and written per batch
+            weights (Dict[str, float]): Score weight overrides, see core.scoring.DEFAULT_WEIGHTS
+        """
+        self.api_client = api_client
+        self.aggregator = UserProfileAggregator(api_client, backend=backend)
+        self.batch_size = batch_size
+        self.weights = weights
+
+    def rows(self, batch: List[Tuple[str, UserInfo]]) -> List[dict]:
+        """
+        Enrich and score one batch of classified users.
+
+        Args:
+            batch (List[Tuple[str, UserInfo]]): Relationship and user pairs
+
+        Returns:
+            List[dict]: Report rows in batch order
+        """
+        from core.scoring import ScoringEngine, UserMetrics
+
+        profiles = self.aggregator.profiles(user.login for _, user in batch)
+        scores = {}
+        if profiles:
+            metrics = UserMetrics.from_profiles(profiles)
+            scores = dict(zip(metrics.logins, ScoringEngine(self.weights).score(metrics).tolist()))
+        rows = []
+        for relation, user in batch:
+            row = {'login': user.login, 'id': user.id, 'relation': relation}
+            profile = profiles.get(user.login)
+            if profile is not None:
+                details = profile.details
+                row.update({
+                    'name': details.name,
+                    'followers': details.followers,
+                    'following': details.following,
+                    'public_repos': details.public_repos,
+                    'total_stars': profile.total_stars,
+                    'total_forks': profile.total_forks,
+                    'last_push_at': profile.last_push_at.isoformat() if profile.last_push_at else None,
+                    'top_language': profile.top_language,
+                    'languages': ';'.join(f'{language}:{count}' for language, count in profile.languages.items()),
+                    'score': scores[user.login],
+                })
+            rows.append(row)
+        return rows
+
+    def write(self, writer: ReportWriter, on_progress: Optional[Callable[[int], None]] = None) -> Dict[str, int]:
+        """
+        Write the authenticated user's network to a report.
+
+        Args:
+            writer (ReportWriter): Destination of the rows
+            on_progress (Callable[[int], None]): Called with the number of rows written per batch
+
+        Returns:
+            Dict[str, int]: Users per relationship
+        """
+        stream = StreamingRelationshipAnalyzer(self.api_client)
+        batch = []
+        for item in stream.run():
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write_batch(writer, batch, on_progress)
+                batch = []
+        if batch:
+            self._write_batch(writer, batch, on_progress)
+        return stream.counts
+
+    def _write_batch(self, writer: ReportWriter, batch: List[Tuple[str, UserInfo]],
+                     on_progress: Optional[Callable[[int], None]]):
+        for row in self.rows(batch):
+            writer.write(row)
+        if on_progress:
+            on_progress(len(batch))
@@ -0,0 +1,24 @@
+# tests/conftest.py
+
+import pytest
+from rich.console import Console
+
+from benchmarks.mock_github import MockGitHub
+from core.github_api import GitHubAPIClient
+from core.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def mock_github():
+    """A mock GitHub API with a 1000-user network around 'me'."""
+    with MockGitHub(users=1000) as mock:
+        yield mock
+
+
+@pytest.fixture
+def api_client(mock_github):
+    """A client talking to the mock, without cache, store or local mutation pacing."""
+    client = GitHubAPIClient('test-token', base_url=mock_github.base_url, console=Console(quiet=True),
+                             rate_limiter=RateLimiter(mutation_capacity=10 ** 9, mutation_window=1))
+    yield client
+    client.close()
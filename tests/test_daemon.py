@@ -0,0 +1,27 @@
+# tests/test_daemon.py
+
+import requests
+
+import core.daemon
+from core.daemon import EngagementDaemon
+
+
+def test_run_survives_context_refresh_errors(api_client, monkeypatch):
+    monkeypatch.setattr(core.daemon, 'DEFAULT_POLL_INTERVAL', 0.01)
+    daemon = EngagementDaemon(api_client, {'follow_back': True}, context_refresh=0)
+    refresh = daemon.engine.refresh_context
+    calls, errors = [], []
+
+    def flaky_refresh():
+        calls.append(1)
+        if len(calls) == 2:
+            raise requests.exceptions.ConnectionError('connection reset')
+        if len(calls) == 3:
+            daemon.stop()
+        return refresh()
+
+    monkeypatch.setattr(daemon.engine, 'refresh_context', flaky_refresh)
+    daemon.run(users=[], on_error=lambda username, e: errors.append((username, str(e))))
+
+    assert len(calls) == 3
+    assert errors == [('me', 'connection reset')]
@@ -0,0 +1,37 @@
+# tests/test_dashboard.py
+
+from core.dashboard import DashboardPipeline
+
+
+def _run(api_client, backend):
+    user_info = api_client.get_user_info()
+    return DashboardPipeline(api_client, backend=backend, top_k=20).run_connections(
+        user_info['login'], user_info['followers'])
+
+
+def test_graphql_dashboard_matches_rest(mock_github, api_client):
+    rest = _run(api_client, 'rest')
+    before = mock_github.stats()
+    graphql = _run(api_client, 'graphql')
+    after = mock_github.stats()
+
+    assert graphql.total == graphql.processed == rest.total == 750
+    assert (graphql.total_stars, graphql.total_forks) == (rest.total_stars, rest.total_forks)
+    assert graphql.language_counts == rest.language_counts
+    assert graphql.activity == rest.activity
+    assert list(graphql.scored_users) == list(rest.scored_users)
+    # The followers list and its enrichment come back together, 50 users per query
+    assert after['graphql'] - before['graphql'] == 15
+    assert after['profile'] + after['repos'] + after['followers'] == \
+        before['profile'] + before['repos'] + before['followers']
+
+
+def test_graphql_completes_capped_repositories(mock_github, api_client):
+    api_client.graphql.repos_per_user = 2
+    rest = _run(api_client, 'rest')
+    before = mock_github.stats()['repos']
+    graphql = _run(api_client, 'graphql')
+
+    assert (graphql.total_stars, graphql.total_forks) == (rest.total_stars, rest.total_forks)
+    assert graphql.language_counts == rest.language_counts
+    assert mock_github.stats()['repos'] > before
@@ -0,0 +1,34 @@
+# tests/test_engagement.py
+
+import core.engagement
+from core.engagement import QUEUE_PER_WORKER, EngagementEngine
+
+CONFIG = {'star_repo': True, 'like_commit': True, 'comment_issue_pr': True, 'follow_back': True}
+
+
+def test_run_keeps_going_past_missing_users(mock_github, api_client):
+    users = [f'user{index}' for index in range(40)]
+    engine = EngagementEngine(api_client, CONFIG)
+
+    performed = engine.run(users[:20] + ['ghost'] + users[20:])
+
+    assert list(engine.failures) == ['ghost']
+    assert 'Could not fetch events' in engine.failures['ghost'][0]
+    assert performed['ghost'] == []
+    assert sum(map(len, performed.values())) == mock_github.stats()['mutation'] > 0
+
+
+def test_run_bounds_queued_work(api_client, monkeypatch):
+    engine = EngagementEngine(api_client, CONFIG, max_workers=2, mutation_workers=2)
+    waited_on = []
+    real_wait = core.engagement.wait
+
+    def tracking_wait(futures, *args, **kwargs):
+        waited_on.append(len(futures))
+        return real_wait(futures, *args, **kwargs)
+
+    monkeypatch.setattr(core.engagement, 'wait', tracking_wait)
+    performed = engine.run([f'user{index}' for index in range(300)])
+
+    assert sum(map(len, performed.values())) > 2 * QUEUE_PER_WORKER
+    assert max(waited_on) <= 2 * QUEUE_PER_WORKER
@@ -0,0 +1,26 @@
+# tests/test_github_api.py
+
+import pytest
+
+from core.store import EntityStore
+
+
+@pytest.mark.parametrize('change', ['swap', 'refollow'])
+def test_sync_connections_sees_changes_that_keep_the_count(mock_github, api_client, tmp_path, change):
+    api_client.store = EntityStore(str(tmp_path / 'store.sqlite3'))
+    followers = list(mock_github.followers)
+    api_client.sync_connections('me', 'followers', len(followers))
+
+    if change == 'swap':
+        # user5 unfollows and user900 follows, so the count is unchanged
+        followers.remove(5)
+        followers.insert(0, 900)
+    else:
+        # user40 unfollows and follows again, moving to the front
+        followers.remove(40)
+        followers.insert(0, 40)
+    mock_github.followers = followers
+
+    synced = api_client.sync_connections('me', 'followers', len(followers))
+    assert list(synced) == [f'user{index}' for index in followers]
+    assert api_client.store.get_snapshot('me', 'followers') == [synced[login].to_api() for login in synced]
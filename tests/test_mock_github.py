@@ -0,0 +1,33 @@
+# tests/test_mock_github.py
+
+from rich.console import Console
+
+from benchmarks.mock_github import MockGitHub
+from core.github_api import GitHubAPIClient
+
+
+def test_small_network_lists_every_user():
+    with MockGitHub(users=20) as mock:
+        client = GitHubAPIClient('test-token', base_url=mock.base_url, console=Console(quiet=True))
+        for index in range(40):
+            details = client.get_user_details(f'user{index}')
+            assert len(client.get_followers(f'user{index}')) == details['followers'] <= 40
+        client.close()
+
+
+def test_conditional_requests_are_free(mock_github, api_client):
+    first = api_client.poll_user_events('user3')
+    again = api_client.poll_user_events('user3', first.etag)
+
+    assert first.modified and first.etag and first.poll_interval == 60
+    assert not again.modified
+    stats = mock_github.stats()
+    assert stats['not_modified'] == 1
+    assert api_client.rate_limiter.status()['core']['remaining'] == mock_github.rate_limit - 1
+
+
+def test_secondary_limit_is_retried(mock_github, api_client):
+    mock_github.mutation_limit, mock_github.mutation_window = 3, 1.0
+
+    assert all(api_client.follow_user(f'user{index}') for index in range(6))
+    assert mock_github.stats()['throttled'] >= 1
@@ -0,0 +1,60 @@
+# tests/test_mutations.py
+
+import requests
+
+from core.mutations import BulkMutationExecutor
+
+
+def _fail_for(executor, failing):
+    mutate = executor._mutate
+    executor._mutate = lambda operation, target: 'HTTP 500' if target in failing else mutate(operation, target)
+
+
+def test_failed_run_resumes_only_itself(api_client, tmp_path):
+    journal = str(tmp_path / 'unfollow-me.jsonl')
+    targets = ['user1', 'user2', 'user3']
+
+    executor = BulkMutationExecutor(api_client, journal)
+    _fail_for(executor, {'user3'})
+    report = executor.run('unfollow', targets)
+    assert report.succeeded == ['user1', 'user2'] and list(report.failed) == ['user3']
+
+    # Another target set is another run, nothing it targets is skipped
+    report = BulkMutationExecutor(api_client, journal).run('unfollow', ['user1', 'user4'])
+    assert report.skipped == [] and report.succeeded == ['user1', 'user4']
+
+    # The journal now belongs to that clean run and is gone; a failed run resumes only with its own targets
+    executor = BulkMutationExecutor(api_client, journal)
+    _fail_for(executor, {'user3'})
+    executor.run('unfollow', targets)
+    report = BulkMutationExecutor(api_client, journal).run('unfollow', list(reversed(targets)))
+    assert sorted(report.skipped) == ['user1', 'user2'] and report.succeeded == ['user3']
+
+
+def test_failed_run_expires(api_client, tmp_path):
+    journal = str(tmp_path / 'follow-me.jsonl')
+    executor = BulkMutationExecutor(api_client, journal)
+    _fail_for(executor, {'user2'})
+    executor.run('follow', ['user1', 'user2'])
+
+    executor = BulkMutationExecutor(api_client, journal)
+    executor.journal.max_age = 0
+    report = executor.run('follow', ['user1', 'user2'])
+    assert report.skipped == [] and report.succeeded == ['user1', 'user2']
+
+
+def test_rate_limited_target_is_retried_in_one_layer(api_client, tmp_path, monkeypatch):
+    sent = []
+
+    def throttled(method, url, **kwargs):
+        sent.append(url)
+        response = requests.Response()
+        response.status_code, response.url = 429, url
+        response.headers['Retry-After'] = '0'
+        return response
+
+    monkeypatch.setattr(api_client.session, 'request', throttled)
+    report = BulkMutationExecutor(api_client, str(tmp_path / 'follow-me.jsonl')).run('follow', ['user1'])
+
+    assert report.failed == {'user1': 'HTTP 429'}
+    assert len(sent) == api_client.max_retries + 1
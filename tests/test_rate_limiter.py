@@ -0,0 +1,33 @@
+# tests/test_rate_limiter.py
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from time import time
+
+import requests
+
+from core.rate_limiter import RateBucket
+
+
+def _rejected(retry_after: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 429
+    response.headers['Retry-After'] = retry_after
+    return response
+
+
+def test_block_reads_retry_after_seconds_and_dates():
+    bucket = RateBucket('mutation')
+    bucket.block(_rejected('30'))
+    assert 29 <= bucket.blocked_until - time() <= 30
+
+    bucket = RateBucket('mutation')
+    bucket.block(_rejected(format_datetime(datetime.now(timezone.utc) + timedelta(seconds=90), usegmt=True)))
+    assert 88 <= bucket.blocked_until - time() <= 90
+
+
+def test_block_ignores_unparseable_retry_after():
+    bucket = RateBucket('mutation')
+    bucket.block(_rejected('soon'))
+    # Falls back to the one-minute wait used when no hint is given
+    assert 59 <= bucket.blocked_until - time() <= 60
@@ -0,0 +1,23 @@
+# tests/test_relationships.py
+
+from core.models import UserInfo
+from core.relationships import MUTUAL, NOT_FOLLOWED_BACK, NOT_FOLLOWING_BACK, classify_relationships
+
+
+def _users(*logins):
+    return [UserInfo(login, index + 1) for index, login in enumerate(logins)]
+
+
+def test_classify_yields_repeated_streamed_users_once():
+    # Pagination drift lists 'carol' and 'alice' twice in the streamed followers
+    followers = _users('alice', 'carol', 'carol', 'alice', 'dave')
+    following = _users('alice', 'bob')
+
+    classified = [(relation, user.login) for relation, user in classify_relationships(followers, following)]
+
+    assert classified == [
+        (MUTUAL, 'alice'),
+        (NOT_FOLLOWED_BACK, 'carol'),
+        (NOT_FOLLOWED_BACK, 'dave'),
+        (NOT_FOLLOWING_BACK, 'bob'),
+    ]
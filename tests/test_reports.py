@@ -0,0 +1,40 @@
+# tests/test_reports.py
+
+from reports.formats import diff_reports, load_report, open_report_writer
+
+
+def _write(path, report_format, rows):
+    with open_report_writer(str(path), report_format) as writer:
+        for row in rows:
+            writer.write(row)
+    return load_report(str(path))
+
+
+def test_columnar_numeric_columns_map_the_file(tmp_path):
+    rows = [{'login': f'user{index}', 'id': index, 'relation': 'mutual', 'score': index / 2}
+            for index in range(100)]
+    columns = _write(tmp_path / 'report.gcr', 'columnar', rows)
+
+    assert columns['login'] == [row['login'] for row in rows]
+    assert columns['score'].tolist() == [row['score'] for row in rows]
+    # float64 is stored at full width, so the column is a view on the mapped file
+    assert not columns['score'].flags.owndata and not columns['score'].flags.writeable
+
+
+def test_diff_matches_rows_without_id_by_login(tmp_path):
+    old = _write(tmp_path / 'old.ndjson', 'ndjson', [
+        {'login': 'renamed', 'id': 7, 'relation': 'mutual'},
+        {'login': 'ghost', 'relation': 'mutual'},
+        {'login': 'leaver', 'relation': 'not-following-back'},
+    ])
+    new = _write(tmp_path / 'new.csv', 'csv', [
+        {'login': 'new-name', 'id': 7, 'relation': 'mutual'},
+        {'login': 'ghost', 'relation': 'not-followed-back'},
+        {'login': 'joiner', 'relation': 'mutual'},
+    ])
+
+    assert diff_reports(old, new) == {
+        'added': ['joiner'],
+        'removed': ['leaver'],
+        'changed': [('ghost', 'mutual', 'not-followed-back')],
+    }
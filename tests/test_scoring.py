@@ -0,0 +1,14 @@
+# tests/test_scoring.py
+
+from benchmarks.bench_scoring import _profiles
+from core.aggregator import MetricColumns
+from core.scoring import rank_profiles
+
+
+def test_collected_rows_rank_like_profiles():
+    profiles = _profiles(500)
+    columns = MetricColumns()
+    for profile in profiles.values():
+        columns.add(profile)
+
+    assert rank_profiles(profiles, 50, columns=columns) == rank_profiles(profiles, 50)
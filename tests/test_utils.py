@@ -0,0 +1,74 @@
+# tests/test_utils.py
+
+import asyncio
+import random
+from datetime import datetime
+
+from core.store import EntityStore
+from core.utils import GitHubFollowerAnalyzer, RecommendationCounts
+
+
+def test_analyze_user_activity(mock_github, api_client):
+    profile = mock_github._profile(7)
+    repos = mock_github._repos(7)
+
+    analysis = GitHubFollowerAnalyzer(api_client).analyze_user_activity('user7')
+
+    assert analysis['public_repos'] == profile['public_repos'] == len(repos)
+    assert analysis['followers'] == profile['followers']
+    assert analysis['following'] == profile['following']
+    assert analysis['total_stars'] == sum(repo['stargazers_count'] for repo in repos)
+    assert analysis['total_forks'] == sum(repo['forks_count'] for repo in repos)
+    assert analysis['created_at'] == profile['created_at']
+    assert analysis['updated_at'] == profile['updated_at']
+    assert isinstance(analysis['last_push_at'], datetime)
+
+
+def _settled_by_ranking(recommendations: dict, max_users: int, remaining_seeds: int) -> bool:
+    # The bound computed from a full ranking, as the crawl used to
+    if remaining_seeds == 0 or max_users <= 0:
+        return True
+    counts = sorted(recommendations.values(), reverse=True)
+    if len(counts) < max_users:
+        return False
+    best_outsider = counts[max_users] if len(counts) > max_users else 0
+    return counts[max_users - 1] > best_outsider + remaining_seeds
+
+
+def test_recommendation_counts_match_ranking():
+    rng = random.Random(7)
+    recommendations = {}
+    counts = RecommendationCounts()
+    for step in range(3000):
+        candidate = int(rng.paretovariate(0.8)) % 400
+        counts.increment(recommendations.get(candidate, 0))
+        recommendations[candidate] = recommendations.get(candidate, 0) + 1
+        for max_users in (1, 5, 50, 500):
+            remaining = rng.randint(0, 20)
+            assert counts.settled(max_users, remaining) == \
+                _settled_by_ranking(recommendations, max_users, remaining), step
+
+
+def test_follow_followers_followers(mock_github, api_client):
+    followed, recommended = GitHubFollowerAnalyzer(api_client).follow_followers_followers(
+        max_users=10, max_pages_per_seed=1)
+
+    assert followed == [login for login, _ in recommended]
+    assert len(recommended) == 10
+    assert mock_github.stats()['mutation'] == 10
+    network = {f'user{index}' for index in range(mock_github.users)}
+    assert not {login for login, _ in recommended} & network
+    votes = [len(recommended_by) for _, recommended_by in recommended]
+    assert votes == sorted(votes, reverse=True)
+
+
+def test_async_scores_match_sync(mock_github, api_client, tmp_path):
+    api_client.store = EntityStore(str(tmp_path / 'store.sqlite3'))
+    analyzer = GitHubFollowerAnalyzer(api_client)
+    users = {f'user{index}': None for index in range(200)}
+
+    scored = asyncio.run(analyzer.calculate_user_scores_async(users, top_k=20))
+    assert mock_github.stats()['profile'] == len(users)
+    assert scored == analyzer.calculate_user_scores(users, top_k=20)
+    # The batched lookup served every profile from the store the second time
+    assert mock_github.stats()['profile'] == len(users)
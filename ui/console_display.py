@@ -3,13 +3,19 @@
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List
+from contextlib import contextmanager
 from core.github_api import GitHubAPIClient
-from time import sleep
-import requests
+from core.aggregator import UserProfileAggregator
+from core.dashboard import ACTIVITY_BUCKETS, STALE_BUCKET, INACTIVE_BUCKET
+from core.models import DashboardSummary, MutationReport, UserInfo
 from datetime import datetime
 from rich.layout import Layout
 from rich.text import Text
+from rich.live import Live
+
+# Activity buckets from most to least recent
+ACTIVITY_ORDER = [name for name, _ in ACTIVITY_BUCKETS] + [STALE_BUCKET, INACTIVE_BUCKET]
 
 
 class ConsoleDisplay:
@@ -17,9 +23,9 @@ class ConsoleDisplay:
     Handles displaying data to the console.
     """
 
-    def __init__(self):
-        """Initialize the console display with the console object."""
-        self.console = Console()
+    def __init__(self, console: Console = None):
+        """Initialize the console display with the (shared) console object."""
+        self.console = console or Console()
 
     def display_user_stats(self, mutual: dict, not_following_back: dict, not_followed_back: dict):
         """Display user statistics in a rich table format."""
@@ -36,8 +42,8 @@ class ConsoleDisplay:
 
         self.console.print(stats_table)
 
-    def display_users_table(self, users: Dict[str, dict], title: str, api_client: GitHubAPIClient):
-        """Display user information in an enhanced table format."""
+    def display_users_table(self, users: Dict[str, UserInfo], title: str, api_client: GitHubAPIClient, backend: str = 'rest'):
+        """Display user information in an enhanced table format, enriched through the given backend."""
         if not users:
             return
 
@@ -58,34 +64,21 @@ class ConsoleDisplay:
         table.add_column("⏱️ Last Push", style="magenta", justify="right")
 
         with api_client.console.status("[bold green]Fetching user details"):
-            for username, user in users.items():
-                details = api_client.get_user_details(username)
-                repos_response = requests.get(
-                    f'{api_client.base_url}/users/{username}/repos',
-                    headers=api_client.headers,
-                    params={'per_page': 100}
-                )
-                total_stars = sum(repo['stargazers_count']
-                                  for repo in repos_response.json())
-
-                repos = api_client.get_user_repos(username)
-                last_push_date = None
-                if repos:
-                    last_push_repo = max(
-                        repos, key=lambda repo: datetime.fromisoformat(repo['updated_at'][:-1]))
-                    last_push_date = datetime.fromisoformat(
-                        last_push_repo['updated_at'][:-1]).strftime("%Y-%m-%d")
+            profiles = UserProfileAggregator(api_client, backend=backend).profiles(users.keys())
+            for username, profile in profiles.items():
+                details = profile.details
+                last_push_date = profile.last_push_at.strftime(
+                    "%Y-%m-%d") if profile.last_push_at else None
 
                 table.add_row(
                     username,
-                    details.get('name', 'N/A'),
-                    str(details.get('followers', 0)),
-                    str(details.get('following', 0)),
-                    str(details.get('public_repos', 0)),
-                    str(total_stars),
+                    details.name or 'N/A',
+                    str(details.followers),
+                    str(details.following),
+                    str(details.public_repos),
+                    str(profile.total_stars),
                     last_push_date if last_push_date else "N/A"
                 )
-                sleep(1)
 
         self.console.print(Panel(
             table,
@@ -169,7 +162,6 @@ class ConsoleDisplay:
                     ", ".join(mutual_connections),
                     str(user_details.get('followers', 0))
                 )
-                sleep(0.5)
 
         self.console.print(table)
 
@@ -182,7 +174,7 @@ class ConsoleDisplay:
         self.console.print(
             Panel(content, title=title, border_style=border_style))
 
-    def display_mutual_relationships(self, mutual: Dict[str, dict], not_following_back: Dict[str, dict], not_followed_back: Dict[str, dict], api_client: GitHubAPIClient):
+    def display_mutual_relationships(self, mutual: Dict[str, UserInfo], not_following_back: Dict[str, UserInfo], not_followed_back: Dict[str, UserInfo], api_client: GitHubAPIClient):
         """Display detailed mutual relationships with a better presentation."""
         self.console.print("[bold blue]Mutual Relationships[/bold blue]\n")
 
@@ -203,25 +195,18 @@ class ConsoleDisplay:
             table.add_column("⭐ Stars", style="cyan", justify="right")
 
             with api_client.console.status("[bold green]Fetching user details"):
-                for username, user in mutual.items():
-                    details = api_client.get_user_details(username)
-                    repos_response = requests.get(
-                        f'{api_client.base_url}/users/{username}/repos',
-                        headers=api_client.headers,
-                        params={'per_page': 100}
-                    )
-                    total_stars = sum(repo['stargazers_count']
-                                      for repo in repos_response.json())
+                profiles = UserProfileAggregator(api_client).profiles(mutual.keys())
+                for username, profile in profiles.items():
+                    details = profile.details
 
                     table.add_row(
                         username,
-                        details.get('name', 'N/A'),
-                        str(details.get('followers', 0)),
-                        str(details.get('following', 0)),
-                        str(details.get('public_repos', 0)),
-                        str(total_stars)
+                        details.name or 'N/A',
+                        str(details.followers),
+                        str(details.following),
+                        str(details.public_repos),
+                        str(profile.total_stars)
                     )
-                    sleep(0.5)
             self.console.print(
                 Panel(table, border_style="blue", padding=(1, 2)))
         else:
@@ -245,13 +230,26 @@ class ConsoleDisplay:
             self.console.print(
                 "[green]You are following everyone who follows you.[/green]\n")
 
-    def display_dashboard(self, scored_users: Dict[str, dict], language_counts: Dict[str, int]):
-        """Displays a dashboard with key metrics and insights."""
+    def render_dashboard(self, summary: DashboardSummary) -> Layout:
+        """Builds the dashboard layout from the aggregates processed so far."""
         layout = Layout()
         layout.split_column(
+            Layout(name="overview", size=3),
             Layout(name="user_scores", ratio=2),
-            Layout(name="language_stats", ratio=1)
+            Layout(name="breakdown", ratio=1)
         )
+        layout["breakdown"].split_row(
+            Layout(name="language_stats"),
+            Layout(name="activity_stats")
+        )
+
+        # Overview line
+        status = "" if summary.complete else " [yellow](loading...)[/yellow]"
+        layout["overview"].update(Panel(
+            f"Followers analyzed: [bold]{summary.processed}/{summary.total}[/bold]{status}   "
+            f"Total stars: [green]{summary.total_stars}[/green]   "
+            f"Total forks: [blue]{summary.total_forks}[/blue]",
+            border_style="blue"))
 
         # User Scores Table
         user_score_table = Table(
@@ -261,14 +259,13 @@ class ConsoleDisplay:
         user_score_table.add_column("Stars", style="green", justify="right")
         user_score_table.add_column("Forks", style="blue", justify="right")
 
-        sorted_users = sorted(scored_users.items(
-        ), key=lambda item: item[1]["score"], reverse=True)[:10]
-        for username, data in sorted_users:
+        # Scored users arrive best first
+        for username, data in list(summary.scored_users.items())[:10]:
             user_score_table.add_row(
                 username,
                 str(data["score"]),
-                str(sum(repo['stargazers_count'] for repo in data["repos"])),
-                str(sum(repo['forks_count'] for repo in data["repos"]))
+                str(data["total_stars"]),
+                str(data["total_forks"])
 
             )
 
@@ -278,15 +275,37 @@ class ConsoleDisplay:
         language_table.add_column("Language", style="cyan")
         language_table.add_column("Count", style="magenta", justify="right")
 
-        for language, count in list(language_counts.items())[:5]:
+        for language, count in list(summary.language_counts.items())[:5]:
             language_table.add_row(language, str(count))
 
+        # Activity Table
+        activity_table = Table(title="Last Push",
+                               show_header=True, border_style="blue", padding=(0, 2))
+        activity_table.add_column("Period", style="cyan")
+        activity_table.add_column("Users", style="magenta", justify="right")
+
+        for bucket in ACTIVITY_ORDER:
+            if bucket in summary.activity:
+                activity_table.add_row(bucket, str(summary.activity[bucket]))
+
         layout["user_scores"].update(
             Panel(user_score_table, border_style="blue"))
         layout["language_stats"].update(
             Panel(language_table, border_style="blue"))
+        layout["activity_stats"].update(
+            Panel(activity_table, border_style="blue"))
 
-        self.console.print(layout)
+        return layout
+
+    def display_dashboard(self, summary: DashboardSummary):
+        """Displays a dashboard with key metrics and insights."""
+        self.console.print(self.render_dashboard(summary))
+
+    @contextmanager
+    def live_dashboard(self) -> Iterator[Callable[[DashboardSummary], None]]:
+        """Keeps the dashboard on screen, yielding a callback that redraws it with newer aggregates."""
+        with Live(console=self.console, refresh_per_second=4) as live:
+            yield lambda summary: live.update(self.render_dashboard(summary))
 
     def display_engagement_results(self, performed_actions: Dict[str, List[str]]):
         """Displays the results of the automated engagements"""
@@ -301,3 +320,40 @@ class ConsoleDisplay:
             else:
                 self.console.print(f"[cyan]No actions for user: {
                                    username}[/cyan]")
+
+    def display_mutation_report(self, report: MutationReport):
+        """Displays throughput and failures of a bulk follow/unfollow run."""
+        self.console.print(
+            f"[cyan]{report.operation.capitalize()}: {len(report.succeeded)} done, "
+            f"{len(report.failed)} failed, {len(report.skipped)} already done in a previous run "
+            f"({report.throughput:.1f}/s over {report.elapsed:.1f}s)[/cyan]")
+
+        if report.failed:
+            table = Table(title="Failed Operations", show_header=True, border_style="red")
+            table.add_column("Target", style="cyan")
+            table.add_column("Reason", style="red")
+            for target, reason in report.failed.items():
+                table.add_row(target, reason)
+            self.console.print(table)
+            self.console.print(
+                "[yellow]Run the action again to retry the failed operations.[/yellow]")
+
+    def display_report_diff(self, diff: Dict[str, list], previous: str, limit: int = 20):
+        """Displays who joined, left or changed relationship since a previous report."""
+        table = Table(title="Changes Since the Previous Report", show_header=True, border_style="blue")
+        table.add_column("User", style="cyan")
+        table.add_column("Change", style="magenta")
+
+        rows = [(login, "[green]new in your network[/green]") for login in diff['added']]
+        rows += [(login, "[red]no longer in your network[/red]") for login in diff['removed']]
+        rows += [(login, f"{old} → {new}") for login, old, new in diff['changed']]
+        for login, change in rows[:limit]:
+            table.add_row(login, change)
+
+        self.console.print(
+            f"[cyan]Since {previous}: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+            f"{len(diff['changed'])} changed relationship[/cyan]")
+        if rows:
+            self.console.print(table)
+        if len(rows) > limit:
+            self.console.print(f"[italic]...and {len(rows) - limit} more[/italic]")
@@ -10,14 +10,15 @@ class Menu:
     Handles displaying the main menu to the console.
     """
 
-    def __init__(self, user_prompts: UserPrompts):
+    def __init__(self, user_prompts: UserPrompts, console: Console = None):
         """
         Initialize the menu with a console and a prompt handler.
 
         Args:
             user_prompts (UserPrompts): Prompt handler
+            console (Console): Shared console, a new one is created if omitted
         """
-        self.console = Console()
+        self.console = console or Console()
         self.user_prompts = user_prompts
 
     def display(self) -> str:
@@ -1,4 +1,5 @@
 # ui/prompts.py
+from rich.console import Console
 from rich.prompt import Confirm, Prompt
 from typing import Dict
 
@@ -8,6 +9,15 @@ class UserPrompts:
     Handles prompting the user for input.
     """
 
+    def __init__(self, console: Console = None):
+        """
+        Initialize the prompts.
+
+        Args:
+            console (Console): Shared console to prompt on, rich's global console if omitted
+        """
+        self.console = console
+
     def ask(self, prompt_text, **kwargs):
         """
         Prompts the user for input.
@@ -19,6 +29,7 @@ class UserPrompts:
         Returns:
             str or bool: User input based on the type of the prompt
         """
+        kwargs.setdefault('console', self.console)
         return Prompt.ask(prompt_text, **kwargs)
 
     def confirm(self, prompt_text):
@@ -31,7 +42,7 @@ class UserPrompts:
         Returns:
             bool: True if user confirms, False otherwise
         """
-        return Confirm.ask(prompt_text)
+        return Confirm.ask(prompt_text, console=self.console)
 
     def ask_for_filter_criteria(self) -> Dict[str, str]:
         """
@@ -58,6 +69,22 @@ class UserPrompts:
             filters["max_repos"] = self.ask(
                 "Enter maximum number of repositories")
 
+        if self.confirm("Do you want to filter users by minimum account age?"):
+            filters["min_account_age_days"] = self.ask(
+                "Enter minimum account age in days")
+
+        if self.confirm("Do you want to filter users by recent activity?"):
+            filters["max_days_since_push"] = self.ask(
+                "Enter maximum number of days since their last push")
+
+        if self.confirm("Do you want to filter users by minimum number of stars?"):
+            filters["min_stars"] = self.ask(
+                "Enter minimum number of stars across their repositories")
+
+        if self.confirm("Do you want to filter users by language?"):
+            filters["language"] = self.ask(
+                "Enter a language they have repositories in")
+
         return filters
 
     def ask_for_engagement_options(self) -> Dict[str, str]:
@@ -82,3 +109,13 @@ class UserPrompts:
                 "Please enter a comment message (default: 'Great job, keep up the amazing work! 😄')")
 
         return options
+
+    def ask_for_report_format(self) -> str:
+        """
+        Prompts the user for the network report format.
+
+        Returns:
+            str: 'csv', 'ndjson' or 'columnar'
+        """
+        return self.ask("Report format (columnar is the smallest and fastest to reload)",
+                        choices=["csv", "ndjson", "columnar"], default="csv")